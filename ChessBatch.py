@@ -0,0 +1,257 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains ChessVarBatch, a vectorized environment that plays many games of the chess variant
+#              defined in ChessVar at once for reinforcement learning. The games are stored as NumPy arrays (one row
+#              per game) and every game advances by one move in a single step call. Requires NumPy.
+
+import numpy as np
+from ChessVar import ChessVar, BETWEEN, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, RAYS, ROOK_DIRECTIONS, \
+    BISHOP_DIRECTIONS, QUEEN_DIRECTIONS, PIECE_NAMES
+
+# Board squares hold 0 for empty or bitboard index + 1 (1-6 White pawn to king, 7-12 Black pawn to king)
+EMPTY = 0
+ACTIONS = 4096
+
+# Game state codes
+UNFINISHED = 0
+WHITE_WON = 1
+BLACK_WON = 2
+DRAW = 3
+
+
+def _bits(bitboard):
+    """Returns the square indexes set in a bitboard"""
+    return [square for square in range(64) if (bitboard >> square) & 1]
+
+
+def _build_tables():
+    """
+    Builds the move tables indexed by square code, source and destination square:
+    moves that need the destination not to hold an own piece, pawn pushes that need an empty destination, pawn captures
+    that need an enemy piece on the destination, and the squares between every source and destination
+    """
+    geometry = np.zeros((13, 64, 64), dtype=bool)
+    pawn_pushes = np.zeros((13, 64, 64), dtype=bool)
+    pawn_captures = np.zeros((13, 64, 64), dtype=bool)
+
+    for color in range(2):
+        first = 1 + 6 * color
+        forward = 8 if color == 0 else -8
+        start_row = 1 if color == 0 else 6
+        for source in range(64):
+            if 0 <= source + forward < 64:
+                pawn_pushes[first, source, source + forward] = True
+                if source // 8 == start_row:
+                    pawn_pushes[first, source, source + 2 * forward] = True
+            pawn_captures[first, source, _bits(PAWN_ATTACKS[color][source])] = True
+
+            for offset, directions in ((2, BISHOP_DIRECTIONS), (3, ROOK_DIRECTIONS), (4, QUEEN_DIRECTIONS)):
+                rays = 0
+                for direction in directions:
+                    rays |= RAYS[direction][source]
+                geometry[first + offset, source, _bits(rays)] = True
+            geometry[first + 1, source, _bits(KNIGHT_ATTACKS[source])] = True
+            geometry[first + 5, source, _bits(KING_ATTACKS[source])] = True
+
+    between = np.zeros((64, ACTIONS), dtype=np.float32)
+    for source in range(64):
+        for destination in range(64):
+            between[_bits(BETWEEN[source][destination]), source * 64 + destination] = 1.0
+
+    return geometry, pawn_pushes, pawn_captures, between
+
+
+GEOMETRY, PAWN_PUSHES, PAWN_CAPTURES, BETWEEN_MATRIX = _build_tables()
+
+# Starting position in the batch encoding
+START_BOARD = np.zeros(64, dtype=np.int8)
+START_BOARD[0:8] = [4, 2, 3, 5, 6, 3, 2, 4]
+START_BOARD[8:16] = 1
+START_BOARD[48:56] = 7
+START_BOARD[56:64] = [10, 8, 9, 11, 12, 9, 8, 10]
+START_INVENTORY = np.array([8, 2, 2, 2, 1, 1, 8, 2, 2, 2, 1, 1], dtype=np.int8)
+
+
+def legal_action_mask(boards, turns, out=None):
+    """
+    Computes the legal moves of many positions at once
+
+    :param boards: a (K, 64) integer array of square codes
+    :param turns: a (K,) array holding 0 where White has the turn and 1 where Black has the turn
+    :param out: optional (K, 4096) boolean array to write the mask into
+    :return: a (K, 4096) boolean array, True at (source * 64 + destination) for every legal move
+    """
+    count = boards.shape[0]
+    pieces = boards.astype(np.intp)
+    occupied = pieces != EMPTY
+    own = occupied & ((pieces - 1) // 6 == turns.reshape(-1, 1))
+    enemy = occupied & ~own
+
+    # Destinations reachable from each source square, ignoring pieces in between
+    squares = np.arange(64)
+    reachable = GEOMETRY[pieces, squares] & ~own[:, None, :]
+    reachable |= PAWN_PUSHES[pieces, squares] & ~occupied[:, None, :]
+    reachable |= PAWN_CAPTURES[pieces, squares] & enemy[:, None, :]
+    reachable &= own[:, :, None]
+
+    # A move is blocked if any square between its source and destination is occupied
+    blocked = (occupied.astype(np.float32) @ BETWEEN_MATRIX) > 0
+
+    mask = np.logical_and(reachable.reshape(count, ACTIONS), ~blocked, out=out)
+    return mask
+
+
+class ChessVarBatch:
+    """
+    A class used to play many games of the chess variant at once, stored as NumPy arrays.
+
+    Every game starts at the standard starting position. A call to step makes one move in every game, scores it, and
+    resets every game that ended back to the starting position, so the batch always holds K games in progress.
+
+    Attributes
+    ----------
+    boards : numpy array
+        (K, 64) int8 square codes: 0 for empty or bitboard index + 1, squares ordered a1 = 0 to h8 = 63
+    inventories : numpy array
+        (K, 12) int8 piece counts in PIECE_NAMES order
+    turns : numpy array
+        (K,) int8, 0 where White has the turn and 1 where Black has the turn
+    states : numpy array
+        (K,) int8 game state codes: UNFINISHED, WHITE_WON, BLACK_WON or DRAW
+    plies : numpy array
+        (K,) int32 number of moves made in each game
+    legal_mask : numpy array
+        (K, 4096) boolean mask of the legal moves in each game's current position
+    max_plies : int
+        Number of moves after which a game is scored as a draw
+
+    Methods
+    -------
+    reset(indexes=None)
+        Resets some or all games to the starting position
+    step(moves)
+        Makes one move in every game and returns (boards, rewards, dones, legal_mask)
+    get_game(index)
+        Returns a ChessVar object at one game's current position
+    """
+
+    def __init__(self, size, max_plies=400):
+        self._size = size
+        self._max_plies = max_plies
+        self._boards = np.empty((size, 64), dtype=np.int8)
+        self._inventories = np.empty((size, 12), dtype=np.int8)
+        self._turns = np.empty(size, dtype=np.int8)
+        self._states = np.empty(size, dtype=np.int8)
+        self._plies = np.empty(size, dtype=np.int32)
+        self._legal_mask = np.empty((size, ACTIONS), dtype=bool)
+        self._start_mask = legal_action_mask(START_BOARD.reshape(1, 64), np.zeros(1, dtype=np.int8))[0]
+        self._rows = np.arange(size)
+        self._final_states = np.zeros(size, dtype=np.int8)
+        self.reset()
+
+    def __len__(self):
+        return self._size
+
+    def get_boards(self):
+        """Returns the (K, 64) array of square codes"""
+        return self._boards
+
+    def get_inventories(self):
+        """Returns the (K, 12) array of piece counts"""
+        return self._inventories
+
+    def get_turns(self):
+        """Returns the (K,) array of player turns, 0 for White and 1 for Black"""
+        return self._turns
+
+    def get_states(self):
+        """Returns the (K,) array of game state codes"""
+        return self._states
+
+    def get_legal_mask(self):
+        """Returns the (K, 4096) boolean mask of legal moves in each game's current position"""
+        return self._legal_mask
+
+    def get_final_states(self):
+        """Returns the state code each game ended with during the last step, or UNFINISHED if it did not end"""
+        return self._final_states
+
+    def reset(self, indexes=None):
+        """
+        Resets games to the starting position
+
+        :param indexes: indexes or boolean mask of the games to reset, or None to reset every game
+        """
+        if indexes is None:
+            indexes = slice(None)
+        self._boards[indexes] = START_BOARD
+        self._inventories[indexes] = START_INVENTORY
+        self._turns[indexes] = 0
+        self._states[indexes] = UNFINISHED
+        self._plies[indexes] = 0
+        self._legal_mask[indexes] = self._start_mask
+
+    def step(self, moves, validate=True):
+        """
+        Makes one move in every game, then resets the games that ended
+
+        :param moves: a (K,) integer array of moves encoded as (source << 6) | destination, one per game
+        :param validate: if True, raises ValueError when a move is not legal in its game
+        :return: a (boards, rewards, dones, legal_mask) tuple. rewards is a (K,) float32 array holding 1 for the player
+                 who just moved if the move won the game and 0 otherwise. dones is a (K,) boolean array marking the
+                 games that ended and were reset; get_final_states tells how they ended. boards and legal_mask
+                 already describe the reset games.
+        """
+        moves = np.asarray(moves, dtype=np.intp)
+        rows = self._rows
+        if validate and not self._legal_mask[rows, moves].all():
+            raise ValueError('Illegal move in game {}'.format(int(np.argmin(self._legal_mask[rows, moves]))))
+
+        sources = moves >> 6
+        destinations = moves & 63
+
+        # Move the pieces and remove the captured ones
+        captured = self._boards[rows, destinations].astype(np.intp)
+        self._boards[rows, destinations] = self._boards[rows, sources]
+        self._boards[rows, sources] = EMPTY
+
+        # Decrement only the captured pieces' counts. Capturing the last piece of a type wins the game.
+        capturing = np.flatnonzero(captured)
+        victims = captured[capturing] - 1
+        self._inventories[capturing, victims] -= 1
+        winners = capturing[self._inventories[capturing, victims] == 0]
+        self._states[winners] = WHITE_WON + self._turns[winners]
+
+        rewards = np.zeros(self._size, dtype=np.float32)
+        rewards[winners] = 1.0
+
+        self._turns ^= 1
+        self._plies += 1
+        legal_action_mask(self._boards, self._turns, out=self._legal_mask)
+
+        # Games with no legal move or too many moves are draws
+        draws = (self._states == UNFINISHED) & ((self._plies >= self._max_plies) | ~self._legal_mask.any(axis=1))
+        self._states[draws] = DRAW
+
+        dones = self._states != UNFINISHED
+        self._final_states[:] = self._states
+        if dones.any():
+            self.reset(dones)
+
+        return self._boards, rewards, dones, self._legal_mask
+
+    def get_game(self, index):
+        """
+        Returns a ChessVar object at the current position of the game with the given index. Finished games are reset
+        by step, so the game is normally unfinished. ChessVar has no draw state, so a game whose state is DRAW, or
+        whose board holds a square code outside 0-12, raises ValueError.
+        """
+        board = self._boards[index]
+        state = int(self._states[index])
+        if state >= DRAW or board.min() < 0 or board.max() > len(PIECE_NAMES):
+            raise ValueError('Game {} cannot be converted to a ChessVar position'.format(index))
+        board = board.astype(np.uint8)
+        position = bytearray((board[0::2] | (board[1::2] << 4)).tobytes())
+        position.append(int(self._turns[index]) | (state << 1))
+        return ChessVar.from_position(bytes(position))
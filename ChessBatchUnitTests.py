@@ -0,0 +1,168 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: Unit Tests for the NumPy modules ChessBatch.py and ChessTensor.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from ChessVar import ChessVar, SQUARE_INDEX, PIECE_NAMES
+from ChessBatch import ChessVarBatch, legal_action_mask, WHITE_WON, BLACK_WON, DRAW, UNFINISHED
+from ChessRecord import GameRecordWriter
+from ChessSimulator import simulate
+import ChessTensor
+
+
+def move(source, destination):
+    """Returns the move between two algebraic squares"""
+    return (SQUARE_INDEX[source] << 6) | SQUARE_INDEX[destination]
+
+
+class ChessVarBatchTestCase(unittest.TestCase):
+
+    def test_mask_matches_legal_moves(self):
+        # Play random games side by side with ChessVar objects and compare every position
+        batch = ChessVarBatch(16, max_plies=40)
+        games = [ChessVar() for _ in range(16)]
+        rng = np.random.default_rng(3)
+        state_codes = {'WHITE_WON': WHITE_WON, 'BLACK_WON': BLACK_WON}
+        for _ in range(120):
+            mask = batch.get_legal_mask()
+            moves = np.empty(16, dtype=np.int64)
+            for number, game in enumerate(games):
+                self.assertEqual(set(np.flatnonzero(mask[number]).tolist()), set(game.legal_moves()))
+                moves[number] = rng.choice(np.flatnonzero(mask[number]))
+                game.push(int(moves[number]))
+
+            _, rewards, dones, _ = batch.step(moves)
+            final_states = batch.get_final_states()
+            for number, game in enumerate(games):
+                if game.get_game_state() != 'UNFINISHED':
+                    self.assertTrue(dones[number])
+                    self.assertEqual(final_states[number], state_codes[game.get_game_state()])
+                    self.assertEqual(rewards[number], 1.0)
+                    games[number] = ChessVar()
+                elif len(game._undo_stack) >= 40 or not game.legal_moves():
+                    self.assertTrue(dones[number])
+                    self.assertEqual(final_states[number], DRAW)
+                    games[number] = ChessVar()
+                else:
+                    self.assertFalse(dones[number])
+                    self.assertEqual(rewards[number], 0.0)
+                    self.assertEqual(batch.get_game(number).to_position(), game.to_position())
+
+    def test_step_and_auto_reset(self):
+        batch = ChessVarBatch(2)
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(int(batch.get_legal_mask().sum()), 40)
+
+        # The first game heads for a queen capture, the second shuffles knights
+        first = [move('e2', 'e4'), move('d7', 'd5'), move('d1', 'g4'), move('c8', 'g4')]
+        second = [move('g1', 'f3'), move('g8', 'f6'), move('f3', 'g1'), move('f6', 'g8')]
+        for ply in range(3):
+            _, rewards, dones, _ = batch.step([first[ply], second[ply]])
+            self.assertFalse(dones.any())
+        self.assertEqual(batch.get_turns().tolist(), [1, 1])
+
+        boards, rewards, dones, mask = batch.step([first[3], second[3]])
+        self.assertEqual(dones.tolist(), [True, False])
+        self.assertEqual(rewards.tolist(), [1.0, 0.0])
+        self.assertEqual(batch.get_final_states().tolist(), [BLACK_WON, UNFINISHED])
+
+        # The finished game is already back at the starting position, the other one kept going
+        self.assertEqual(batch.get_game(0).to_position(), ChessVar().to_position())
+        self.assertEqual(batch.get_turns().tolist(), [0, 0])
+        self.assertEqual(batch.get_inventories()[0].sum(), 32)
+        np.testing.assert_array_equal(boards[0], boards[1])
+        np.testing.assert_array_equal(mask[0], legal_action_mask(boards[1:], batch.get_turns()[1:])[0])
+
+    def test_illegal_move(self):
+        batch = ChessVarBatch(2)
+        with self.assertRaises(ValueError):
+            batch.step([move('e2', 'e4'), move('e2', 'e5')])
+        self.assertEqual(batch.get_game(0).to_position(), ChessVar().to_position())
+
+        # States and square codes that have no ChessVar position are rejected rather than changed
+        batch._states[1] = DRAW
+        with self.assertRaises(ValueError):
+            batch.get_game(1)
+        batch._boards[0, 0] = 13
+        with self.assertRaises(ValueError):
+            batch.get_game(0)
+
+
+class TensorTestCase(unittest.TestCase):
+
+    def test_export_position(self):
+        game = ChessVar()
+        game.make_move('e2', 'e4')
+        planes, features = ChessTensor.allocate()
+        ChessTensor.export_position(game, planes, features)
+
+        # Every occupied square is set on its piece's plane and nowhere else
+        board = game.get_board()
+        for square, piece in board.items():
+            column, row = ord(square[0]) - ord('a'), int(square[1]) - 1
+            expected = [0.0] * 12
+            if piece is not None:
+                expected[PIECE_NAMES.index(piece.get_name())] = 1.0
+            self.assertEqual(planes[:, row, column].tolist(), expected)
+        self.assertEqual(features.tolist(), [1, 8, 2, 2, 2, 1, 1, 8, 2, 2, 2, 1, 1])
+
+        with self.assertRaises(ValueError):
+            ChessTensor.export_position(game, np.zeros((8, 8, 12)).transpose(2, 0, 1), features)
+
+    def test_export_batch_matches_positions(self):
+        batch = ChessVarBatch(8)
+        rng = np.random.default_rng(5)
+        for _ in range(30):
+            mask = batch.get_legal_mask()
+            batch.step([rng.choice(np.flatnonzero(row)) for row in mask])
+
+        planes, features = ChessTensor.allocate(8, dtype=np.uint8)
+        ChessTensor.export_batch(batch, planes, features)
+        single_planes, single_features = ChessTensor.allocate(dtype=np.uint8)
+        for number in range(8):
+            ChessTensor.export_position(batch.get_game(number), single_planes, single_features)
+            np.testing.assert_array_equal(planes[number], single_planes)
+            np.testing.assert_array_equal(features[number], single_features)
+
+    def test_write_dataset(self):
+        results = list(simulate(6, 'greedy', 'random', processes=1, seed=2, max_plies=60))
+        with tempfile.TemporaryDirectory() as directory:
+            record_path = os.path.join(directory, 'games.cvgr')
+            with GameRecordWriter(record_path) as writer:
+                for result in results:
+                    writer.write_result(result)
+
+            prefix = os.path.join(directory, 'games')
+            count = ChessTensor.write_dataset(record_path, prefix)
+            self.assertEqual(count, sum(len(result.moves) for result in results))
+
+            planes = np.load(prefix + '.planes.npy', mmap_mode='r')
+            features = np.load(prefix + '.features.npy', mmap_mode='r')
+            moves = np.load(prefix + '.moves.npy', mmap_mode='r')
+            outcomes = np.load(prefix + '.outcomes.npy', mmap_mode='r')
+            self.assertEqual(planes.shape, (count, 12, 8, 8))
+
+            # Spot check the positions of the last game against a replay
+            result = results[-1]
+            first = count - len(result.moves)
+            game = ChessVar()
+            single_planes, single_features = ChessTensor.allocate(dtype=np.uint8)
+            for ply, move in enumerate(result.moves):
+                ChessTensor.export_position(game, single_planes, single_features)
+                np.testing.assert_array_equal(planes[first + ply], single_planes)
+                np.testing.assert_array_equal(features[first + ply], single_features)
+                self.assertEqual(moves[first + ply], move)
+                game.push(move)
+
+            white_outcome = {'WHITE_WON': 1, 'BLACK_WON': -1, 'DRAW': 0}[result.result]
+            self.assertEqual(outcomes[first], white_outcome)
+            self.assertEqual(outcomes[first + 1], -white_outcome)
+            del planes, features, moves, outcomes
+
+
+if __name__ == '__main__':
+    unittest.main()
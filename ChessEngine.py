@@ -0,0 +1,524 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a computer player for the chess game defined in ChessVar. It uses iterative
+#              deepening alpha-beta search with a transposition table and an evaluation built around this variant's
+#              win condition: the winner is the first player to capture all of an opponent's pieces of one type, so a
+#              player down to the last piece of any type is one capture away from losing.
+
+import argparse
+import multiprocessing
+import random
+import time
+from ChessVar import ChessVar, PIECE_NAMES, move_to_algebraic
+from ChessTransposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from ChessOrdering import MoveOrderer
+from ChessTablebase import MAX_DISTANCE
+
+# Score of a won position. Wins found closer to the root score higher, so the engine takes the fastest win.
+WIN_SCORE = 100000
+MAX_PLY = 128
+INFINITY = WIN_SCORE + 1
+
+# Scores beyond WIN_SCORE - WIN_BAND are forced wins or losses. A win is scored WIN_SCORE minus its distance from the
+# root: up to MAX_PLY plies of search, plus up to MAX_DISTANCE plies more when an endgame table ends the line.
+WIN_BAND = MAX_PLY + MAX_DISTANCE
+
+# Material value of each piece type, in PIECE_NAMES order within a color (pawn, knight, bishop, rook, queen, king)
+PIECE_VALUES = [100, 300, 320, 500, 900, 400]
+
+# Penalty by number of pieces of a type left on the board. A type with one piece left loses the game if that piece is
+# captured, so it is weighted heavily. A count of 0 only happens for types that were never in play. Counts past the end
+# of the list, which set-up positions can have, use its last entry.
+EXTINCTION_PENALTY = [0, 450, 120, 40, 15, 5, 0]
+
+# The sixteen squares c3-f6, occupied pieces there get a small bonus
+CENTER = 0x00003C3C3C3C0000
+CENTER_BONUS = 10
+
+# How many nodes are searched between checks of the time limit. The node budget is always checked exactly.
+CHECK_INTERVAL = 1024
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when the node budget or time limit runs out, or the search is stopped"""
+    pass
+
+
+class SearchResult:
+    """
+    A class used to represent the outcome of a search.
+
+    Attributes
+    ----------
+    best_move : int
+        The best move found, encoded as (source << 6) | destination, or None if there are no legal moves
+    score : int
+        The score of the best move for the player who has the turn, in centipawns. Scores beyond
+        WIN_SCORE - WIN_BAND are forced wins (positive) or losses (negative).
+    depth : int
+        The deepest completed iteration
+    nodes : int
+        The number of positions searched, including quiescence positions
+    elapsed : float
+        The search time in seconds
+    principal_variation : list
+        The expected sequence of moves starting with best_move
+
+    Methods
+    -------
+    get_nodes_per_second()
+        Returns the search speed in nodes per second
+    """
+
+    def __init__(self, best_move, score, depth, nodes, elapsed, principal_variation):
+        self.best_move = best_move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.principal_variation = principal_variation
+
+    def get_nodes_per_second(self):
+        """Returns the search speed in nodes per second"""
+        if self.elapsed <= 0:
+            return 0
+        return int(self.nodes / self.elapsed)
+
+    def __str__(self):
+        moves = ' '.join(''.join(move_to_algebraic(move)) for move in self.principal_variation)
+        return 'depth {} score {} nodes {} nps {} time {:.2f} pv {}'.format(
+            self.depth, self.score, self.nodes, self.get_nodes_per_second(), self.elapsed, moves)
+
+
+class SearchEngine:
+    """
+    A class used to search ChessVar positions for the best move.
+
+    The engine runs iterative deepening negamax alpha-beta with a transposition table, followed by a captures-only
+    quiescence search so that the evaluation is never taken in the middle of an exchange. Moves are searched in the
+    order chosen by a ChessOrdering.MoveOrderer. Moves are made and taken back with ChessVar push and pop, so the game
+    passed to search is left exactly as it was.
+
+    Attributes
+    ----------
+    max_depth : int
+        The deepest iteration to search
+    node_limit : int
+        The number of nodes after which the search stops, or None for no limit
+    time_limit : float
+        The number of seconds after which the search stops, or None for no limit
+    stop_event : threading.Event
+        Any object with an is_set method, such as a threading or multiprocessing Event. The search stops soon after it
+        is set, returning the deepest completed iteration. None if the search can only stop at its limits.
+    tablebases : ChessTablebase.Tablebases
+        Endgame tables probed at every node with few enough pieces, whose exact results replace searching further.
+        None to search every position.
+    table : TranspositionTable
+        The transposition table shared by every search made with this engine. A SharedTranspositionTable can be passed
+        in to share it with engines in other processes.
+    root_seed : int
+        Seed for shuffling the root moves after the table move at every iteration, so engines searching the same
+        position in parallel spread over different moves first. None keeps the ordered root moves.
+    ordering : MoveOrderer
+        The move ordering, with the killer moves, history scores and cutoff statistics of this engine's searches
+
+    Methods
+    -------
+    search(game, on_iteration=None)
+        Searches the game's current position and returns a SearchResult
+    evaluate(game)
+        Returns the static evaluation of the game's position for the player who has the turn
+    """
+
+    def __init__(self, max_depth=4, node_limit=None, time_limit=None, table_size_mb=16, stop_event=None,
+                 tablebases=None, table=None, root_seed=None):
+        self._max_depth = max_depth
+        self._node_limit = node_limit
+        self._time_limit = time_limit
+        self._stop_event = stop_event
+        self._tablebases = tablebases
+        self._table = TranspositionTable(table_size_mb) if table is None else table
+        self._root_random = None if root_seed is None else random.Random(root_seed)
+        self._ordering = MoveOrderer(PIECE_VALUES, MAX_PLY)
+        self._nodes = 0
+        self._next_check = self._next_check_at()
+        self._deadline = None
+
+    def get_table(self):
+        """Returns the transposition table used by the engine"""
+        return self._table
+
+    def get_ordering(self):
+        """Returns the move ordering used by the engine, whose statistics add up over every search until reset"""
+        return self._ordering
+
+    def evaluate(self, game):
+        """
+        Returns the static evaluation of the game's position for the player who has the turn. Each piece type scores its
+        material value times the number of pieces left, minus a penalty that grows as the type nears extinction.
+
+        :param game: a ChessVar object
+        :return: the score in centipawns, positive if the player who has the turn is ahead
+        """
+        inventory = game.get_piece_inventory()
+        bitboards = game.get_bitboards()
+        score = 0
+        last = len(EXTINCTION_PENALTY) - 1
+        for index in range(6):
+            white_count = inventory.get(PIECE_NAMES[index], 0)
+            black_count = inventory.get(PIECE_NAMES[index + 6], 0)
+            score += PIECE_VALUES[index] * (white_count - black_count)
+            score += EXTINCTION_PENALTY[min(black_count, last)] - EXTINCTION_PENALTY[min(white_count, last)]
+
+        white = bitboards[0] | bitboards[1] | bitboards[2] | bitboards[3] | bitboards[4] | bitboards[5]
+        black = bitboards[6] | bitboards[7] | bitboards[8] | bitboards[9] | bitboards[10] | bitboards[11]
+        score += CENTER_BONUS * ((white & CENTER).bit_count() - (black & CENTER).bit_count())
+
+        if game.get_player_turn() == 'WHITE':
+            return score
+        return -score
+
+    def search(self, game, on_iteration=None):
+        """
+        Searches the game's current position with iterative deepening until max_depth is completed or the node budget
+        or time limit runs out.
+
+        :param game: a ChessVar object. It is returned to its original position when the search ends.
+        :param on_iteration: optional function called with a SearchResult after each completed iteration
+        :return: a SearchResult for the deepest completed iteration
+        """
+        start = time.perf_counter()
+        self._nodes = 0
+        self._next_check = self._next_check_at()
+        self._deadline = None if self._time_limit is None else start + self._time_limit
+        self._table.new_search()
+        self._ordering.new_search()
+
+        result = SearchResult(None, 0, 0, 0, 0.0, [])
+        moves = game.legal_moves()
+        if not moves:
+            return result
+
+        # Always have a move to play, even if the first iteration is cut short
+        result.best_move = moves[0]
+        result.principal_variation = [moves[0]]
+
+        for depth in range(1, self._max_depth + 1):
+            try:
+                score, best_move = self._search_root(game, depth)
+            except SearchAborted:
+                break
+
+            result = SearchResult(best_move, score, depth, self._nodes, time.perf_counter() - start,
+                                  self._principal_variation(game, best_move, depth))
+            if on_iteration is not None:
+                on_iteration(result)
+
+            # Stop early once a forced win or loss has been found
+            if abs(score) >= WIN_SCORE - WIN_BAND:
+                break
+
+        result.nodes = self._nodes
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def _next_check_at(self):
+        """Returns the node count of the next limit check: CHECK_INTERVAL nodes on, but never past the node budget"""
+        next_check = self._nodes + CHECK_INTERVAL
+        if self._node_limit is not None:
+            return min(next_check, self._node_limit)
+        return next_check
+
+    def _check_limits(self):
+        """Raises SearchAborted if the node budget or time limit has run out, or the search was stopped"""
+        self._next_check = self._next_check_at()
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchAborted()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted()
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise SearchAborted()
+
+    def _search_root(self, game, depth):
+        """Searches every root move to the given depth and returns (score, best move)"""
+        entry = self._table.probe(game.get_hash())
+        moves = self._ordering.order(game, game.legal_moves(), 0 if entry is None else entry[3], 0)
+        if self._root_random is not None:
+            rest = moves[1:]
+            self._root_random.shuffle(rest)
+            moves[1:] = rest
+        alpha = -INFINITY
+        best_move = moves[0]
+
+        for move in moves:
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -INFINITY, -alpha, 1)
+            finally:
+                game.pop()
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        self._table.store(game.get_hash(), depth, EXACT, alpha, best_move)
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        """Returns the score of the position for the player who has the turn, searched to the given depth"""
+        self._nodes += 1
+        if self._nodes >= self._next_check:
+            self._check_limits()
+
+        # The previous move captured the last piece of a type, so the player who has the turn has lost
+        if game.get_game_state() != 'UNFINISHED':
+            return ply - WIN_SCORE
+
+        # An endgame table knows the exact result and how many plies it takes
+        if self._tablebases is not None:
+            entry = self._tablebases.probe(game)
+            if entry is not None:
+                result, distance = entry
+                if result == 'WIN':
+                    return WIN_SCORE - ply - distance
+                if result == 'LOSS':
+                    return ply + distance - WIN_SCORE
+                return 0
+
+        if depth <= 0 or ply >= MAX_PLY:
+            return self._quiescence(game, alpha, beta, ply)
+
+        key = game.get_hash()
+        entry = self._table.probe(key)
+        table_move = 0
+        if entry is not None:
+            entry_depth, bound, score, table_move = entry
+            if entry_depth >= depth:
+                score = score_from_table(score, ply)
+                if bound == EXACT or (bound == LOWER_BOUND and score >= beta) or \
+                        (bound == UPPER_BOUND and score <= alpha):
+                    return score
+
+        moves = game.legal_moves()
+        if not moves:
+            return 0
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = 0
+        for move_number, move in enumerate(self._ordering.order(game, moves, table_move, ply)):
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.pop()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self._ordering.record_cutoff(game, move, ply, depth, move_number, table_move)
+                        break
+        else:
+            self._ordering.record_no_cutoff()
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self._table.store(key, depth, bound, score_to_table(best_score, ply), best_move)
+        return best_score
+
+    def _quiescence(self, game, alpha, beta, ply):
+        """Returns the score of the position once every capture worth making has been made"""
+        self._nodes += 1
+        if self._nodes >= self._next_check:
+            self._check_limits()
+
+        if game.get_game_state() != 'UNFINISHED':
+            return ply - WIN_SCORE
+
+        best_score = self.evaluate(game)
+        if best_score >= beta or ply >= MAX_PLY:
+            return best_score
+        if best_score > alpha:
+            alpha = best_score
+
+        for move in self._ordering.order(game, game.legal_moves(captures_only=True), 0, ply):
+            game.push(move)
+            try:
+                score = -self._quiescence(game, -beta, -alpha, ply + 1)
+            finally:
+                game.pop()
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        return best_score
+
+    def _principal_variation(self, game, best_move, depth):
+        """Follows the best moves stored in the transposition table from the current position"""
+        variation = [best_move]
+        pushed = 0
+        game.push(best_move)
+        pushed += 1
+        while len(variation) < depth:
+            entry = self._table.probe(game.get_hash())
+            if entry is None or entry[3] == 0 or entry[3] not in game.legal_moves():
+                break
+            variation.append(entry[3])
+            game.push(entry[3])
+            pushed += 1
+        for _ in range(pushed):
+            game.pop()
+        return variation
+
+
+class _SupersededSearch:
+    """Stop flag for a background worker's search: set once the caller cancels it or starts a newer search"""
+
+    def __init__(self, wanted_search):
+        self.search_id = 0
+        self._wanted_search = wanted_search
+
+    def is_set(self):
+        return self._wanted_search.value != self.search_id
+
+
+def _background_worker(connection, wanted_search, max_depth, time_limit, table_size_mb):
+    """Worker process entry point. Searches each (search id, position bytes) request and sends back the result."""
+    superseded = _SupersededSearch(wanted_search)
+    engine = SearchEngine(max_depth, None, time_limit, table_size_mb, stop_event=superseded)
+    while True:
+        request = connection.recv()
+        if request is None:
+            return
+        search_id, position = request
+        superseded.search_id = search_id
+        if superseded.is_set():
+            continue
+        connection.send((search_id, engine.search(ChessVar.from_position(position))))
+
+
+class BackgroundSearch:
+    """
+    A class used to search in a worker process, so the caller (such as the GUI event loop) keeps running while the
+    engine thinks. The worker keeps one SearchEngine, and its transposition table, for every search.
+
+    Start a search with start, then call poll until it returns the result. A search ends at its time limit, or soon
+    after cancel is called or a newer search is started; results of cancelled searches are never returned.
+
+    Methods
+    -------
+    start(game)
+        Starts searching the game's current position, cancelling any search still running
+    poll()
+        Returns the SearchResult of the current search once it is done, otherwise None
+    cancel()
+        Stops the current search without waiting for it
+    is_searching()
+        Returns True while a started search has not returned its result yet
+    close()
+        Stops the worker process
+    """
+
+    def __init__(self, max_depth=MAX_PLY // 2, time_limit=1.0, table_size_mb=16):
+        # Spawn rather than fork, so the worker inherits nothing from a process that has already started pygame
+        context = multiprocessing.get_context('spawn')
+        self._wanted_search = context.Value('q', 0, lock=False)
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(target=_background_worker, daemon=True,
+                                        args=(worker_connection, self._wanted_search, max_depth, time_limit,
+                                              table_size_mb))
+        self._process.start()
+        worker_connection.close()
+        self._last_search = 0
+        self._searching = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self, game):
+        """Starts searching the game's current position, cancelling any search still running"""
+        self._last_search += 1
+        self._wanted_search.value = self._last_search
+        self._connection.send((self._last_search, game.to_position(binary=True)))
+        self._searching = True
+
+    def poll(self):
+        """Returns the SearchResult of the current search once it is done, otherwise None. Never waits."""
+        while self._searching and self._connection.poll():
+            search_id, result = self._connection.recv()
+            if search_id == self._last_search:
+                self._searching = False
+                return result
+        return None
+
+    def cancel(self):
+        """Stops the current search without waiting for it"""
+        self._wanted_search.value = 0
+        self._searching = False
+
+    def is_searching(self):
+        """Returns True while a started search has not returned its result yet"""
+        return self._searching
+
+    def close(self):
+        """Stops the worker process"""
+        if self._process.is_alive():
+            self.cancel()
+            try:
+                self._connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._connection.close()
+
+
+def score_to_table(score, ply):
+    """Converts a win or loss score from distance-to-root to distance-to-node before storing it"""
+    if score >= WIN_SCORE - WIN_BAND:
+        return score + ply
+    if score <= WIN_BAND - WIN_SCORE:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """Converts a stored win or loss score from distance-to-node back to distance-to-root"""
+    if score >= WIN_SCORE - WIN_BAND:
+        return score - ply
+    if score <= WIN_BAND - WIN_SCORE:
+        return score + ply
+    return score
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search the starting position of the chess variant.')
+    parser.add_argument('--depth', type=int, default=5, help='deepest iteration to search')
+    parser.add_argument('--nodes', type=int, default=None, help='node budget')
+    parser.add_argument('--time', type=float, default=None, help='time limit in seconds')
+    parser.add_argument('--hash', type=int, default=16, help='transposition table size in MB')
+    arguments = parser.parse_args()
+
+    engine = SearchEngine(arguments.depth, arguments.nodes, arguments.time, arguments.hash)
+    result = engine.search(ChessVar(), on_iteration=print)
+    print('ordering', engine.get_ordering().get_statistics())
+    print('bestmove', ''.join(move_to_algebraic(result.best_move)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: Unit Tests for the search modules built on ChessVar.py
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from ChessVar import ChessVar, SQUARE_INDEX, move_to_algebraic
+from ChessEngine import SearchEngine, BackgroundSearch, WIN_SCORE, MAX_PLY, WIN_BAND, INFINITY, PIECE_VALUES, \
+    score_to_table, score_from_table
+from ChessTransposition import TranspositionTable, SharedTranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from ChessParallel import ParallelSearch, measure_speedup
+import ChessTablebase
+from ChessOrdering import MoveOrderer, CutoffStatistics, TABLE_MOVE, EXTINCTION_CAPTURE, CAPTURE, QUIET
+
+
+class TranspositionTableTestCase(unittest.TestCase):
+
+    def test_size(self):
+        table = TranspositionTable(1)
+        self.assertEqual(len(table), 65536)  # 1 MB of 16 byte entries
+        self.assertEqual(len(TranspositionTable(3)), 131072)  # Rounded down to a power of two
+        self.assertEqual(len(TranspositionTable(0.5)), 32768)
+        for size_mb in (0, -1):
+            with self.assertRaises(ValueError):
+                TranspositionTable(size_mb)
+            with self.assertRaises(ValueError):
+                SharedTranspositionTable(size_mb)
+
+    def test_store_probe(self):
+        table = TranspositionTable(1)
+        key = 0x123456789ABCDEF0
+        self.assertIsNone(table.probe(key))
+        table.store(key, 5, EXACT, -250, (12 << 6) | 28)
+        self.assertEqual(table.probe(key), (5, EXACT, -250, (12 << 6) | 28))
+        self.assertIsNone(table.probe(key ^ (1 << 63)))  # Same slot, different position
+
+        # A result without a best move keeps the stored move
+        table.store(key, 6, LOWER_BOUND, 40, 0)
+        self.assertEqual(table.probe(key), (6, LOWER_BOUND, 40, (12 << 6) | 28))
+
+        # Depths too large for the entry are stored as the largest one, without touching the other fields
+        for deep_table in (table, SharedTranspositionTable(1)):
+            deep_table.store(key, 300, UPPER_BOUND, -7, 0)
+            self.assertEqual(deep_table.probe(key)[:3], (255, UPPER_BOUND, -7))
+        deep_table.close()
+
+    def test_replacement(self):
+        table = TranspositionTable(1)
+        key = 42
+        collision = key + len(table)
+        table.store(key, 8, EXACT, 10, 0)
+        table.store(collision, 3, UPPER_BOUND, 20, 0)
+        self.assertIsNotNone(table.probe(key))  # A shallower result does not replace a deeper one
+        self.assertIsNone(table.probe(collision))
+
+        table.new_search()
+        table.store(collision, 3, UPPER_BOUND, 20, 0)
+        self.assertIsNone(table.probe(key))  # Results from an older search are always replaceable
+        self.assertEqual(table.probe(collision), (3, UPPER_BOUND, 20, 0))
+
+    def test_shared_table(self):
+        with SharedTranspositionTable(1) as table:
+            self.assertEqual(len(table), 65536)
+            key = 0x123456789ABCDEF0
+            table.store(key, 5, EXACT, -250, (12 << 6) | 28)
+
+            # Another table attached by name sees the same slots
+            with SharedTranspositionTable(1, name=table.get_name()) as attached:
+                self.assertEqual(attached.probe(key), (5, EXACT, -250, (12 << 6) | 28))
+                attached.store(key ^ (1 << 63), 9, LOWER_BOUND, 7, 0)  # Same slot, deeper result
+            self.assertEqual(table.probe(key ^ (1 << 63)), (9, LOWER_BOUND, 7, 0))
+            self.assertIsNone(table.probe(key))
+
+            # A slot whose two words come from different writes does not match any key
+            slot = 2 * (key & (len(table) - 1))
+            table._words[slot + 1] ^= 1 << 40
+            self.assertIsNone(table.probe(key ^ (1 << 63)))
+
+            table.clear()
+            self.assertEqual(table.hashfull(), 0)
+            self.assertIsNone(table.probe(key ^ (1 << 63)))
+
+
+class SearchEngineTestCase(unittest.TestCase):
+
+    def test_evaluate(self):
+        engine = SearchEngine()
+        game = ChessVar()
+        self.assertEqual(engine.evaluate(game), 0)  # The starting position is symmetric
+
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('g8', 'f6')]:
+            game.make_move(source, destination)
+        self.assertGreater(engine.evaluate(game), 0)  # White is a pawn up and has the turn
+        game.pop()
+        self.assertLess(engine.evaluate(game), 0)  # Same position from Black's side
+
+        # Set-up positions can hold more pieces of a type than a normal game
+        game = ChessVar.from_position('pppppppp/pppp4/8/8/8/8/PPPPPPPP/PPPP4 w -')
+        self.assertEqual(engine.evaluate(game), 0)
+
+    def test_finds_extinction_capture(self):
+        game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(source, destination)
+        position = game.get_hash()
+
+        result = SearchEngine(max_depth=3).search(game)
+        self.assertEqual(move_to_algebraic(result.best_move), ('c8', 'g4'))  # Bishop takes White's only queen
+        self.assertGreaterEqual(result.score, WIN_SCORE - MAX_PLY)
+        self.assertEqual(game.get_hash(), position)  # The search leaves the game where it was
+        self.assertEqual(game.get_player_turn(), 'BLACK')
+
+    def test_limits(self):
+        iterations = []
+        result = SearchEngine(max_depth=3).search(ChessVar(), on_iteration=iterations.append)
+        self.assertEqual([iteration.depth for iteration in iterations], [1, 2, 3])
+        self.assertIn(result.best_move, ChessVar().legal_moves())
+        self.assertGreater(result.get_nodes_per_second(), 0)
+
+        result = SearchEngine(max_depth=20, node_limit=3000).search(ChessVar())
+        self.assertLess(result.depth, 20)
+        self.assertEqual(result.nodes, 3000)
+
+        # Budgets smaller than the time check interval are kept exactly too
+        result = SearchEngine(max_depth=20, node_limit=100).search(ChessVar())
+        self.assertEqual(result.nodes, 100)
+        self.assertIn(result.best_move, ChessVar().legal_moves())
+        self.assertIn(result.best_move, ChessVar().legal_moves())
+
+        game = ChessVar()
+        game.forfeit()
+        self.assertIsNone(SearchEngine().search(game).best_move)  # Nothing to search once the game is over
+
+        # A set stop event ends the search at once, still with a legal move to play
+        stop_event = threading.Event()
+        stop_event.set()
+        result = SearchEngine(max_depth=20, stop_event=stop_event).search(ChessVar())
+        self.assertLess(result.depth, 20)
+        self.assertIn(result.best_move, ChessVar().legal_moves())
+
+    def test_background_search(self):
+        game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(source, destination)
+
+        with BackgroundSearch(max_depth=3, time_limit=5.0, table_size_mb=1) as search:
+            self.assertIsNone(search.poll())
+
+            # A cancelled search never returns its result
+            search.start(ChessVar())
+            search.cancel()
+            self.assertFalse(search.is_searching())
+
+            search.start(game)
+            self.assertTrue(search.is_searching())
+            result = None
+            deadline = time.monotonic() + 30
+            while result is None and time.monotonic() < deadline:
+                result = search.poll()
+                time.sleep(0.01)
+            self.assertEqual(move_to_algebraic(result.best_move), ('c8', 'g4'))
+            self.assertFalse(search.is_searching())
+            self.assertIsNone(search.poll())
+
+    def test_parallel_search(self):
+        game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(source, destination)
+        position = game.to_position()
+
+        with ParallelSearch(workers=2, max_depth=3) as search:
+            self.assertEqual(search.get_workers(), 2)
+            result = search.search(game)
+            self.assertEqual(move_to_algebraic(result.best_move), ('c8', 'g4'))
+            self.assertGreaterEqual(result.score, WIN_SCORE - MAX_PLY)
+            self.assertEqual(game.to_position(), position)
+
+            result = search.search(ChessVar())
+            self.assertGreaterEqual(result.depth, 3)
+            self.assertIn(result.best_move, ChessVar().legal_moves())
+
+        rows = measure_speedup(ChessVar(), [1, 2], 2)
+        self.assertEqual([row['workers'] for row in rows], [1, 2])
+        self.assertEqual(rows[0]['speedup'], 1.0)
+        self.assertTrue(all(row['depth'] >= 2 and row['nodes'] > 0 for row in rows))
+
+        # With no legal move there is no best move, and the command line prints '-' for it
+        blocked = '8/8/8/8/8/1p6/1P6/8 b -'
+        self.assertIsNone(measure_speedup(ChessVar.from_position(blocked), [1], 2)[0]['best_move'])
+        output = subprocess.run([sys.executable, 'ChessParallel.py', '--depth', '2', '--workers', '1', '--position',
+                                 blocked], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        self.assertTrue(output.splitlines()[-1].endswith(' -'))
+
+
+class MoveOrderingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Black can take White's only queen with the bishop or a pawn with the pawn
+        self.game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            self.game.make_move(source, destination)
+        self.ordering = MoveOrderer(PIECE_VALUES, MAX_PLY)
+
+    def move(self, source, destination):
+        return (SQUARE_INDEX[source] << 6) | SQUARE_INDEX[destination]
+
+    def test_order(self):
+        game = self.game
+        queen_capture = self.move('c8', 'g4')
+        pawn_capture = self.move('d5', 'e4')
+        killer = self.move('a7', 'a6')
+        table_move = self.move('h7', 'h6')
+        history_move = self.move('b8', 'c6')
+
+        self.ordering.record_cutoff(game, history_move, 3, 4, 2)
+        self.ordering.record_cutoff(game, killer, 3, 1, 1)
+        self.assertEqual(self.ordering.get_killers(3), [killer, history_move])
+        self.ordering.new_search()
+        self.assertEqual(self.ordering.get_killers(3), [0, 0])
+        self.assertEqual(self.ordering.get_history(1, history_move), 8)  # 4 * 4, halved by the new search
+        self.ordering.record_cutoff(game, killer, 3, 1, 1)
+
+        moves = self.ordering.order(game, game.legal_moves(), table_move, 3)
+        self.assertEqual(moves[:5], [table_move, queen_capture, pawn_capture, killer, history_move])
+        self.assertEqual(sorted(moves), sorted(game.legal_moves()))
+
+        # Killers belong to their ply, and captures never become killers
+        self.assertEqual(self.ordering.order(game, game.legal_moves(), 0, 2)[2], history_move)
+        self.ordering.record_cutoff(game, pawn_capture, 3, 5, 0)
+        self.assertEqual(self.ordering.get_killers(3)[0], killer)
+
+        categories = [self.ordering.categorize(game, move, table_move) for move in moves[:5]]
+        self.assertEqual(categories, [TABLE_MOVE, EXTINCTION_CAPTURE, CAPTURE, QUIET, QUIET])
+
+        # A cutoff counts as a killer's if the move already was a killer when it was searched
+        self.ordering.record_cutoff(game, killer, 3, 1, 3)
+        statistics = self.ordering.get_statistics()
+        self.assertEqual(statistics.category_cutoffs, [0, 0, 1, 1, 3])
+        self.assertEqual((statistics.cutoffs, statistics.first_move_cutoffs, statistics.cutoff_move_numbers), (5, 1, 7))
+
+    def test_scarcity(self):
+        # Taking one of two rooks comes before taking one of four queens, since it leaves the rooks one capture from
+        # extinction
+        game = ChessVar.from_position('qq1qk2r/8/2r5/8/8/8/2R4q/4K3 w -')
+        captures = self.ordering.order(game, game.legal_moves(captures_only=True), 0, 0)
+        self.assertEqual(captures, [self.move('c2', 'c6'), self.move('c2', 'h2')])
+
+    def test_statistics(self):
+        statistics = CutoffStatistics()
+        self.assertEqual(statistics.get_cutoff_rate(), 0.0)
+
+        engine = SearchEngine(max_depth=4)
+        engine.search(ChessVar())
+        statistics = engine.get_ordering().get_statistics()
+        self.assertGreater(statistics.cutoffs, 0)
+        self.assertLessEqual(statistics.first_move_cutoffs, statistics.cutoffs)
+        self.assertLessEqual(statistics.cutoffs, statistics.nodes)
+        self.assertEqual(sum(statistics.category_cutoffs), statistics.cutoffs)
+        self.assertGreater(statistics.get_first_move_rate(), 0.5)
+        self.assertIn('cutoffs', str(statistics))
+        statistics.reset()
+        self.assertEqual(statistics.nodes, 0)
+
+
+class TablebaseTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Two knights against a king also needs the one-knight table, since capturing a knight does not end the game
+        cls.directory = tempfile.TemporaryDirectory()
+        ChessTablebase.generate_tables(ChessTablebase.parse_material(['WN', 'BK', 'WN']), cls.directory.name)
+        cls.tablebases = ChessTablebase.Tablebases(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebases.close()
+        cls.directory.cleanup()
+
+    def test_files(self):
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['WN-BK.cvtb', 'WN-WN-BK.cvtb'])
+        self.assertEqual(len(self.tablebases), 2)
+        self.assertEqual(self.tablebases.get_max_pieces(), 3)
+        self.assertIsNone(self.tablebases.probe(ChessVar()))
+        self.assertIsNone(self.tablebases.probe(ChessVar.from_position('8/8/8/8/8/8/8/KN5k w -')))  # No WK table
+
+        with ChessTablebase.Tablebase(os.path.join(self.directory.name, 'WN-BK.cvtb')) as table:
+            self.assertEqual(table.get_pieces(), (1, 11))
+            self.assertEqual(len(table), 2 * 64 * 64)
+            self.assertEqual(table.probe(ChessVar.from_position('8/8/8/8/8/8/1k6/N7 w -')), ('LOSS', 2))
+            self.assertEqual(table.probe(ChessVar.from_position('8/8/8/8/8/8/1k6/N7 b -')), ('WIN', 1))
+            with self.assertRaises(ValueError):
+                table.probe(ChessVar.from_position('8/8/8/8/8/8/1k6/NN6 b -'))
+
+        path = os.path.join(self.directory.name, 'broken.bin')
+        with open(path, 'wb') as file:
+            file.write(b'CVGR' + bytes(100))
+        with self.assertRaises(ValueError):
+            ChessTablebase.Tablebase(path)
+
+    def test_results_match_moves(self):
+        # Every result must follow from the results after each legal move, found with ChessVar's own move generator
+        rng = random.Random(3)
+        game = ChessVar()
+        for _ in range(300):
+            squares = rng.sample(range(64), 3)
+            rows = ['8'] * 8
+            placement = [None] * 64
+            for letter, square in zip('NNk', squares):
+                placement[square] = letter
+            for row in range(8):
+                text = ''
+                empty = 0
+                for letter in placement[row * 8:row * 8 + 8]:
+                    if letter is None:
+                        empty += 1
+                        continue
+                    text += (str(empty) if empty else '') + letter
+                    empty = 0
+                rows[7 - row] = text + (str(empty) if empty else '')
+            game.set_position('/'.join(rows) + ' ' + rng.choice('wb') + ' -')
+
+            children = []
+            for move in game.legal_moves():
+                game.push(move)
+                children.append(('LOSS', 0) if game.get_game_state() != 'UNFINISHED' else
+                                self.tablebases.probe(game))
+                game.pop()
+            wins = [distance + 1 for result, distance in children if result == 'LOSS']
+            if wins:
+                expected = ('WIN', min(wins))
+            elif children and all(result == 'WIN' for result, _ in children):
+                expected = ('LOSS', max(distance for _, distance in children) + 1)
+            else:
+                expected = ('DRAW', 0)
+            self.assertEqual(self.tablebases.probe(game), expected, game.to_position())
+
+    def test_engine_probes(self):
+        # White's longest win with two knights: the cornered king cannot capture either knight in time
+        game = ChessVar.from_position('8/8/8/8/8/8/8/kN1N4 w -')
+        self.assertEqual(self.tablebases.probe(game), ('WIN', 3))
+        search = SearchEngine(max_depth=6, tablebases=self.tablebases).search(game)
+        self.assertEqual((search.depth, search.score), (1, WIN_SCORE - 3))
+        game.push(search.best_move)
+        self.assertEqual(self.tablebases.probe(game), ('LOSS', 2))
+        self.assertEqual(SearchEngine(max_depth=6).search(game).score, 2 - WIN_SCORE)
+
+    def test_deep_probe(self):
+        # A table result found at the deepest ply scores below WIN_SCORE - MAX_PLY, but is still a win or a loss
+        engine = SearchEngine(tablebases=self.tablebases)
+        for position, stored in [('8/8/8/8/8/8/8/kN1N4 w -', WIN_SCORE - 3), ('8/8/8/8/8/8/1k6/N7 w -', 2 - WIN_SCORE)]:
+            score = engine._negamax(ChessVar.from_position(position), 4, -INFINITY, INFINITY, MAX_PLY)
+            self.assertEqual(score, stored - MAX_PLY if stored > 0 else stored + MAX_PLY)
+            self.assertGreaterEqual(abs(score), WIN_SCORE - WIN_BAND)
+
+            # The transposition table stores the distance from the node and gives back the distance from the root
+            self.assertEqual(score_to_table(score, MAX_PLY), stored)
+            self.assertEqual(score_from_table(stored, MAX_PLY), score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,39 +6,384 @@
 #              from the normal rules. In this version, the winner is the first player to capture all of an
 #              opponent's pieces of one type. Also, castling, en passant, and pawn promotion are not allowed.
 
-from ChessVar import ChessVar
-import pygame
+import hashlib
+import os
+from ChessVar import ChessVar, PIECE_NAMES
+from ChessEngine import BackgroundSearch
+
+# Pygame is imported by import_pygame when the window or a renderer is first needed, so that importing this module
+# (for its constants, or by code that only needs ChessVar) does not load pygame
+pygame = None
 
 # Global Variables
 DIMENSION = 8  # 8x8 chessboard
 SQ_SIZE = 512 // DIMENSION
 WIDTH = SQ_SIZE * 14
 HEIGHT = SQ_SIZE * 10
-MAX_FPS = 15  # for animations
+MAX_FPS = 15  # while idle
+ANIMATION_FPS = 60  # while a move is animating
+ANIMATION_TIME = 500  # milliseconds per move animation, however far the piece travels
+COMPUTER_COLOR = 'BLACK'  # side played by the computer when it is turned on
+COMPUTER_TIME = 1.0  # seconds the computer thinks per move
 IMAGES = {}
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+ATLAS_DIR = os.path.join(IMAGE_DIR, 'cache')
 COLUMN_LETTER = {1: 'a', 2: 'b', 3: 'c', 4: 'd', 5: 'e', 6: 'f', 7: 'g', 8: 'h'}
 FLIP_ROW = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+FONT_SIZE = 36
+MESSAGES = {'WHITE_WON': 'White wins!', 'BLACK_WON': 'Black wins!', 'DRAW': 'Draw!'}
+
+# Rendering caches, filled on first use: fonts by size, rendered text by (text, color, antialias, size), and the layers:
+# the static background with the board, border, buttons and coordinate labels, and the piece sprite atlas
+FONTS = {}
+TEXT = {}
+LAYERS = {}
+
+
+def import_pygame():
+    """Imports pygame the first time it is needed and returns it"""
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    return pygame
+
+
+def atlas_path():
+    """
+    Returns the path of the sprite atlas cached for the current SQ_SIZE. The name includes a digest of the piece images'
+    sizes and modification times, so editing an image leads to a new atlas.
+    """
+    digest = hashlib.sha1(str(SQ_SIZE).encode())
+    for piece in PIECE_NAMES:
+        status = os.stat(os.path.join(IMAGE_DIR, piece + '.png'))
+        digest.update('{} {} {}'.format(piece, status.st_mtime_ns, status.st_size).encode())
+    return os.path.join(ATLAS_DIR, 'atlas-{}-{}.png'.format(SQ_SIZE, digest.hexdigest()[:16]))
+
+
+def build_atlas(path):
+    """Scales the twelve piece images into one row of SQ_SIZE squares in PIECE_NAMES order and tries to cache it"""
+    atlas = pygame.Surface((SQ_SIZE * len(PIECE_NAMES), SQ_SIZE), pygame.SRCALPHA)
+    for index, piece in enumerate(PIECE_NAMES):
+        image = pygame.transform.scale(pygame.image.load(os.path.join(IMAGE_DIR, piece + '.png')), (SQ_SIZE, SQ_SIZE))
+
+        # Copy the pixels exactly: the atlas starts fully transparent, so the channel-wise maximum is the image itself
+        atlas.blit(image, (index * SQ_SIZE, 0), special_flags=pygame.BLEND_RGBA_MAX)
+
+    # Write to a temporary name first so a reader never sees half a file, and drop atlases of older images
+    try:
+        os.makedirs(ATLAS_DIR, exist_ok=True)
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+        pygame.image.save(atlas, temporary_path)
+        os.replace(temporary_path, path)
+        prefix = 'atlas-{}-'.format(SQ_SIZE)
+        for name in os.listdir(ATLAS_DIR):
+            if name.startswith(prefix) and os.path.join(ATLAS_DIR, name) != path:
+                os.remove(os.path.join(ATLAS_DIR, name))
+    except (OSError, pygame.error):
+        pass  # A read-only install still works, it just rebuilds the atlas at every start
+    return atlas
 
 
 def load_images():
-    """Initializes global dictionary of images"""
-    pieces = ['WP', 'WN', 'WB', 'WR', 'WQ', 'WK', 'BP', 'BN', 'BB', 'BR', 'BQ', 'BK']
-
-    # Populate IMAGES dictionary with chess piece images from file
-    for piece in pieces:
-        IMAGES[piece] = pygame.transform.scale(pygame.image.load("images/" + piece + ".png"), (SQ_SIZE, SQ_SIZE))
+    """
+    Initializes global dictionary of images. Every piece is a subsurface of one sprite atlas, pre-scaled to SQ_SIZE and
+    cached on disk, so after the first start only a single image file is read. Call after the display mode is set.
+    """
+    path = atlas_path()
+    if LAYERS.get('atlas_path') == path:
+        return
+
+    atlas = None
+    if os.path.exists(path):
+        try:
+            atlas = pygame.image.load(path)
+        except pygame.error:
+            atlas = None
+    if atlas is None or atlas.get_size() != (SQ_SIZE * len(PIECE_NAMES), SQ_SIZE):
+        atlas = build_atlas(path)
+    atlas = LAYERS['atlas'] = atlas.convert_alpha()
+    LAYERS['atlas_path'] = path
+
+    # Populate IMAGES dictionary with views into the atlas
+    for index, piece in enumerate(PIECE_NAMES):
+        IMAGES[piece] = atlas.subsurface(pygame.Rect(index * SQ_SIZE, 0, SQ_SIZE, SQ_SIZE))
+
+
+def get_font(size=FONT_SIZE):
+    """Returns the default font at the given size, creating it only once"""
+    font = FONTS.get(size)
+    if font is None:
+        font = FONTS[size] = pygame.font.Font(None, size)
+    return font
+
+
+def render_text(text, color='black', antialias=True, size=FONT_SIZE):
+    """Returns a surface with the text rendered on it, rendering each distinct text only once"""
+    key = (text, color, antialias, size)
+    surface = TEXT.get(key)
+    if surface is None:
+        surface = TEXT[key] = get_font(size).render(text, antialias, color)
+    return surface
+
+
+def get_background():
+    """Returns the static background layer, drawing it the first time it is needed"""
+    background = LAYERS.get('background')
+    if background is None:
+        background = LAYERS['background'] = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill(pygame.Color('white'))
+        draw_static_board(background)
+    return background
+
+
+def get_result(game):
+    """
+    Returns the game's state, or 'DRAW' if the game is unfinished but the player who has the turn has no legal move.
+    ChessSimulator.play_game scores that case as a draw too.
+    """
+    state = game.get_game_state()
+    if state == 'UNFINISHED' and not game.legal_moves():
+        return 'DRAW'
+    return state
+
+
+def square_rect(square):
+    """Returns the screen rectangle of a square index (a1 = 0, h8 = 63)"""
+    return pygame.Rect((square % 8 + 1) * SQ_SIZE, FLIP_ROW[square // 8 + 1] * SQ_SIZE, SQ_SIZE, SQ_SIZE)
+
+
+class MoveAnimation:
+    """
+    A class used to represent a piece sliding from its source square to its destination square.
+
+    Attributes
+    ----------
+    source : int
+        Index of the square the piece left
+    destination : int
+        Index of the square the piece moves to
+    piece : int
+        Bitboard index of the moving piece
+    captured : int
+        Bitboard index of the captured piece, shown on the destination square until the animation ends, or None
+    start : int
+        pygame.time.get_ticks() value when the animation started
+    """
+
+    def __init__(self, source, destination, piece, captured, start):
+        self.source = source
+        self.destination = destination
+        self.piece = piece
+        self.captured = captured
+        self.start = start
+
+    def get_progress(self, now):
+        """Returns the fraction of the animation time that has passed, from 0 to 1"""
+        return min(1.0, max(0.0, (now - self.start) / ANIMATION_TIME))
+
+    def get_rect(self, progress):
+        """Returns the rectangle of the moving piece at the given progress"""
+        source = square_rect(self.source)
+        destination = square_rect(self.destination)
+        return pygame.Rect(round(source.x + (destination.x - source.x) * progress),
+                           round(source.y + (destination.y - source.y) * progress), SQ_SIZE, SQ_SIZE)
+
+
+class BoardRenderer:
+    """
+    A class used to draw a game onto a surface, redrawing only the parts that changed since the last draw.
+
+    The renderer remembers what each square, the turn box and the result message currently show. A draw blits the
+    cached background over just the changed areas, draws their new contents, and returns their rectangles so the
+    caller can pass them to pygame.display.update.
+
+    While a move animates, a snapshot of the surface without the moving piece is kept. Each draw restores the area the
+    piece covered from the snapshot and draws the piece at its new place, so only those two rectangles change. The
+    piece's place depends on the time since the move, not on how often draw is called.
+
+    Methods
+    -------
+    draw(game, player_selection=(), now=None, computer=False)
+        Brings the surface up to date with the game and returns the list of rectangles that changed
+    animate(source, destination, piece, captured, now=None)
+        Starts sliding a piece that was just moved from source to destination
+    stop_animation()
+        Ends a running move animation at once
+    is_animating()
+        Returns True while a move animation is running
+    invalidate()
+        Forgets what is on the surface so the next draw repaints everything
+    get_result(game)
+        Returns get_result(game), generating moves only when the position changed
+    """
+
+    def __init__(self, surface):
+        self._surface = surface
+        self._squares = [None] * 64
+        self._turn = None
+        self._message = None
+        self._message_rect = None
+        self._stale = True
+        self._animation = None
+        self._sprite_rect = None
+        self._snapshot = None
+        self._snapshot_stale = True
+        self._computer = None
+        self._result_key = None
+        self._result = None
+
+    def get_result(self, game):
+        """Returns get_result(game), only generating the legal moves of an unfinished position once"""
+        state = game.get_game_state()
+        if state != 'UNFINISHED':
+            return state
+        if game.get_hash() != self._result_key:
+            self._result_key = game.get_hash()
+            self._result = get_result(game)
+        return self._result
+
+    def invalidate(self):
+        """Forgets what is on the surface so the next draw repaints everything"""
+        self._stale = True
+
+    def stop_animation(self):
+        """Ends a running move animation at once"""
+        self._animation = None
+
+    def is_animating(self):
+        """Returns True while a move animation is running"""
+        return self._animation is not None
+
+    def animate(self, source, destination, piece, captured, now=None):
+        """
+        Starts sliding a piece that was just moved. A move that is still animating is cut short.
+
+        :param source: index of the square the piece left
+        :param destination: index of the square the piece moved to
+        :param piece: bitboard index of the moving piece
+        :param captured: bitboard index of the captured piece, or None
+        :param now: pygame.time.get_ticks() value to start at, defaults to the current time
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        self._animation = MoveAnimation(source, destination, piece, captured, now)
+        self._snapshot_stale = True
+
+    def draw(self, game, player_selection=(), now=None, computer=False):
+        """
+        Brings the surface up to date with the game
+
+        :param game: the ChessVar object to draw
+        :param player_selection: the selected (column, row) square, or () for no selection
+        :param now: pygame.time.get_ticks() value used to place an animating piece, defaults to the current time
+        :param computer: True if the computer opponent is turned on, which highlights its button
+        :return: the list of rectangles that changed, empty if nothing did
+        """
+        surface = self._surface
+        background = get_background()
+        dirty = []
+
+        # Take the moving piece off the surface, and stop animating once its time is up
+        animation = self._animation
+        progress = 0.0
+        if self._sprite_rect is not None:
+            surface.blit(self._snapshot, self._sprite_rect, self._sprite_rect)
+            dirty.append(self._sprite_rect)
+            self._sprite_rect = None
+        if animation is not None:
+            if now is None:
+                now = pygame.time.get_ticks()
+            progress = animation.get_progress(now)
+            if progress >= 1.0:
+                animation = self._animation = None
+
+        if self._stale:
+            surface.blit(background, (0, 0))
+            self._squares = [None] * 64
+            self._turn = None
+            self._message = None
+            self._message_rect = None
+            self._computer = None
+            self._stale = False
+            dirty.append(surface.get_rect())
+
+        # A message that goes away or changes uncovers the squares under it
+        message = MESSAGES.get(self.get_result(game))
+        if message != self._message and self._message_rect is not None:
+            surface.blit(background, self._message_rect, self._message_rect)
+            dirty.append(self._message_rect)
+            for square in range(64):
+                if square_rect(square).colliderect(self._message_rect):
+                    self._squares[square] = None
+            self._message_rect = None
+
+        # Squares are redrawn when their piece or highlight changes
+        selected = None
+        if player_selection != ():
+            selected = (player_selection[1] - 1) * 8 + player_selection[0] - 1
+        mailbox = game.get_mailbox()
+        changed_squares = []
+        for square in range(64):
+            shown = (mailbox[square], square == selected)
+
+            # The destination keeps showing the captured piece, if any, until the moving piece arrives
+            if animation is not None and square == animation.destination:
+                shown = (animation.captured, square == selected)
+            if self._squares[square] != shown:
+                self._squares[square] = shown
+                rect = square_rect(square)
+                draw_square(surface, rect, shown[0], shown[1])
+                changed_squares.append(rect)
+        dirty.extend(changed_squares)
+
+        if game.get_player_turn() != self._turn:
+            self._turn = game.get_player_turn()
+            dirty.append(print_turn(surface, game))
+
+        if computer != self._computer:
+            self._computer = computer
+            dirty.append(draw_computer_button(surface, computer))
+
+        # Draw the message over the board when it appears or when squares under it were redrawn
+        if message is not None and (message != self._message or
+                                    self._message_rect.collidelist(changed_squares) != -1):
+            self._message_rect = display_text(surface, message)
+            dirty.append(self._message_rect)
+        self._message = message
+
+        # Keep the snapshot equal to the surface without the moving piece, then draw the piece
+        if animation is not None:
+            if self._snapshot is None:
+                self._snapshot = pygame.Surface(surface.get_size()).convert()
+            if self._snapshot_stale:
+                self._snapshot.blit(surface, (0, 0))
+                self._snapshot_stale = False
+            else:
+                for rect in dirty:
+                    self._snapshot.blit(surface, rect, rect)
+            self._sprite_rect = animation.get_rect(progress)
+            surface.blit(IMAGES[PIECE_NAMES[animation.piece]], self._sprite_rect)
+            dirty.append(self._sprite_rect)
+        else:
+            self._snapshot_stale = True
+
+        return dirty
 
 
 def main():
 
     # Initialise screen
+    import_pygame()
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock = pygame.time.Clock()
-    screen.fill(pygame.Color('white'))
     pygame.display.set_caption('Chess Variant')
     game = ChessVar()
     load_images()  # Load images once (labor-intensive)
+    renderer = BoardRenderer(screen)
+    opponent = None  # BackgroundSearch that plays COMPUTER_COLOR, started when the computer is first turned on
+    computer = False  # True while the computer opponent is turned on
 
     player_selection = ()  # Keeps track of current selection
     player_clicks = []  # Keeps track of player clicks [(row, col), (row, col)]
@@ -47,26 +392,55 @@ def main():
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if opponent is not None:
+                    opponent.close()
+                pygame.quit()
                 return
 
+            # Repaint everything if the window was covered or restored
+            elif event.type == pygame.WINDOWEXPOSED:
+                renderer.invalidate()
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
 
                 # Get (x, y) location of the mouse
-                location = pygame.mouse.get_pos()
+                location = event.pos
 
                 # Transform (x, y) to square location
                 column = location[0] / SQ_SIZE
                 row = location[1] / SQ_SIZE
 
-                # Check if click is on Forfeit button
+                # Check if click is on Forfeit button. Against the computer, the human player forfeits.
                 if 10.5 <= column <= 12.5 and 4.5 <= row <= 5.5:
-                    game.forfeit()
-                    break
-
-                # Check if click is on Reset button
+                    if computer:
+                        opponent.cancel()
+                        game.forfeit(player='WHITE' if COMPUTER_COLOR == 'BLACK' else 'BLACK')
+                    else:
+                        game.forfeit()
+                    continue
+
+                # Check if click is on Reset button. The window, images, fonts and game storage are all reused.
                 elif 10.5 <= column <= 12.5 and 6 <= row <= 7:
-                    pygame.quit()
-                    main()
+                    if opponent is not None:
+                        opponent.cancel()
+                    game.reset()
+                    renderer.stop_animation()
+                    player_clicks = []
+                    player_selection = ()
+                    continue
+
+                # Check if click is on Computer button
+                elif 10.5 <= column <= 12.5 and 7.5 <= row <= 8.5:
+                    computer = not computer
+                    if computer and opponent is None:
+                        opponent = BackgroundSearch(time_limit=COMPUTER_TIME)
+                    elif not computer:
+                        opponent.cancel()
+                    continue
+
+                # The board does not take clicks while the computer has the turn
+                if computer and game.get_player_turn() == COMPUTER_COLOR:
+                    continue
 
                 # Check if click is on chessboard
                 column = location[0]//SQ_SIZE
@@ -79,22 +453,18 @@ def main():
                     # Determine if that was the user's second click and attempt to make proposed move
                     if len(player_clicks) == 2:
 
-                        # If piece is on ending square, store the name of the removed piece for animation purposes
-                        if game.get_board()[COLUMN_LETTER[player_selection[0]] + str(player_selection[1])]:
-                            removed_piece = game.get_board()[COLUMN_LETTER[player_selection[0]] +
-                                                             str(player_selection[1])].get_name()
-                        else:
-                            removed_piece = None
-
-                        # Store the name of the moved piece for animation purposes
-                        moved_piece = game.get_board()[COLUMN_LETTER[player_clicks[0][0]] +
-                                                       str(player_clicks[0][1])].get_name()
+                        # Store the moved and removed pieces for animation purposes
+                        source = (player_clicks[0][1] - 1) * 8 + player_clicks[0][0] - 1
+                        destination = (player_clicks[1][1] - 1) * 8 + player_clicks[1][0] - 1
+                        moved_piece = game.get_mailbox()[source]
+                        removed_piece = game.get_mailbox()[destination]
 
-                        # Make proposed move and animate the move if move is legal
+                        # Make proposed move and animate the move if move is legal. The animation runs while the
+                        # event loop keeps going, so clicks are still handled.
                         if game.make_move(COLUMN_LETTER[player_clicks[0][0]] + str(player_clicks[0][1]),
                                           COLUMN_LETTER[player_clicks[1][0]] + str(player_clicks[1][1])) is True:
 
-                            animate_move(player_clicks, screen, game.get_board(), clock, moved_piece, removed_piece)
+                            renderer.animate(source, destination, moved_piece, removed_piece)
 
                         # Clear clicks/selection
                         player_clicks = []
@@ -113,35 +483,80 @@ def main():
                         player_clicks = []
                         player_selection = ()
 
-        # Draw the game screen
-        draw_game_state(screen, game, player_selection)
-
-        # Display a message if the game is finished
-        if game.get_game_state() != 'UNFINISHED':
-
-            if game.get_game_state() == 'BLACK_WON':
-                display_text(screen, 'Black wins!')
-            if game.get_game_state() == 'WHITE_WON':
-                display_text(screen, 'White wins!')
-
-        clock.tick(MAX_FPS)
-        pygame.display.flip()
+        # Let the computer think in its own process while this loop keeps drawing and handling clicks, and play its
+        # move once the search is done and the previous move has finished animating. With no legal move the game is
+        # a draw, so there is nothing to search.
+        if computer and renderer.get_result(game) == 'UNFINISHED' and game.get_player_turn() == COMPUTER_COLOR:
+            if not opponent.is_searching():
+                opponent.start(game)
+            elif not renderer.is_animating():
+                result = opponent.poll()
+                if result is not None:
+                    source = result.best_move >> 6
+                    destination = result.best_move & 63
+                    moved_piece = game.get_mailbox()[source]
+                    removed_piece = game.get_mailbox()[destination]
+                    game.make_move_idx(source, destination)
+                    renderer.animate(source, destination, moved_piece, removed_piece)
+
+        # Draw only what changed, including the result message if the game is finished, and update only those areas
+        dirty = renderer.draw(game, player_selection, computer=computer)
+        if dirty:
+            pygame.display.update(dirty)
+
+        clock.tick(ANIMATION_FPS if renderer.is_animating() else MAX_FPS)
 
 
 def draw_game_state(screen, game, player_selection):
-    """ Responsible for displaying game graphics"""
+    """ Responsible for displaying game graphics. Redraws the whole screen; the main loop uses BoardRenderer instead."""
     draw_chessboard(screen)
     draw_pieces(screen, game.get_board())
     print_turn(screen, game)
     highlight_selection(screen, player_selection, game.get_board())
 
+    # Display a message if the game is finished
+    result = get_result(game)
+    if result in MESSAGES:
+        display_text(screen, MESSAGES[result])
+
 
 def draw_chessboard(screen):
+    """Draw the board, border, buttons and labels by copying the cached background layer"""
+    screen.blit(get_background(), (0, 0))
+
+
+def draw_computer_button(screen, enabled):
+    """Draws the button that turns the computer opponent on and off, and returns its rectangle"""
+    outline = pygame.Rect(SQ_SIZE * 10.5 - 2, SQ_SIZE * 7.5 - 2, SQ_SIZE * 2 + 4, SQ_SIZE + 4)
+    pygame.draw.rect(screen, pygame.Color('light green' if enabled else 'light gray'), outline)
+    pygame.draw.rect(screen, pygame.Color('black'),
+                     pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 7.5, SQ_SIZE * 2, SQ_SIZE), 3)
+    text = render_text('Computer')
+    screen.blit(text, text.get_rect(center=outline.center))
+    return outline
+
+
+def draw_square(screen, rect, piece, highlighted):
+    """
+    Draws one board square from the background layer, with its highlight and piece
+
+    :param screen: the surface to draw on
+    :param rect: the square's rectangle
+    :param piece: the bitboard index of the piece on the square, or None
+    :param highlighted: True if the square is the current selection
+    """
+    screen.blit(get_background(), rect, rect)
+    if highlighted:
+        pygame.draw.rect(screen, pygame.Color('light green'), rect)
+    if piece is not None:
+        screen.blit(IMAGES[PIECE_NAMES[piece]], rect)
+
+
+def draw_static_board(screen):
     """Draw squares on the board"""
 
-    # Establish colors and font
+    # Establish colors
     colors = [pygame.Color('white'), pygame.Color('gray')]
-    font = pygame.font.Font(None, 36)
 
     # Draw white squares over and around the board
     for row in range(DIMENSION + 2):
@@ -169,30 +584,37 @@ def draw_chessboard(screen):
                      pygame.Rect(SQ_SIZE * 10.5 - 2, SQ_SIZE * 4.5 - 2, SQ_SIZE * 2 + 4, SQ_SIZE + 4))
     pygame.draw.rect(screen, pygame.Color('black'),
                      pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 4.5, SQ_SIZE * 2, SQ_SIZE), 3)
-    text = font.render('Forfeit', 1, 'black')
+    text = render_text('Forfeit')
     screen.blit(text, pygame.Rect(SQ_SIZE * 10.9, SQ_SIZE * 4.8, SQ_SIZE * 2, SQ_SIZE))
 
     pygame.draw.rect(screen, pygame.Color('light gray'),
                      pygame.Rect(SQ_SIZE * 10.5 - 2, SQ_SIZE * 6 - 2, SQ_SIZE * 2 + 4, SQ_SIZE + 4))
     pygame.draw.rect(screen, pygame.Color('black'),
                      pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 6, SQ_SIZE * 2, SQ_SIZE), 3)
-    text = font.render('Reset', 1, 'black')
+    text = render_text('Reset')
     screen.blit(text, pygame.Rect(SQ_SIZE * 11, SQ_SIZE * 6.3, SQ_SIZE * 2, SQ_SIZE))
 
+    draw_computer_button(screen, False)
+
     # Display column/row text
     for number, letter in COLUMN_LETTER.items():
-        text = font.render(letter, 1, 'black')
+        text = render_text(letter)
         screen.blit(text, pygame.Rect(number*SQ_SIZE + SQ_SIZE/3, SQ_SIZE/2, SQ_SIZE, SQ_SIZE))
     for number, letter in COLUMN_LETTER.items():
-        text = font.render(letter, 1, 'black')
+        text = render_text(letter)
         screen.blit(text, pygame.Rect(number*SQ_SIZE + SQ_SIZE/3, 9.1*SQ_SIZE, SQ_SIZE, SQ_SIZE))
     for number in range(1, DIMENSION + 1):
-        text = font.render(str(number), 1, 'black')
+        text = render_text(str(number))
         screen.blit(text, pygame.Rect(SQ_SIZE/2, FLIP_ROW[number]*SQ_SIZE + SQ_SIZE/3, SQ_SIZE, SQ_SIZE))
     for number in range(1, DIMENSION + 1):
-        text = font.render(str(number), 1, 'black')
+        text = render_text(str(number))
         screen.blit(text, pygame.Rect(9.25*SQ_SIZE, FLIP_ROW[number]*SQ_SIZE + SQ_SIZE/3, SQ_SIZE, SQ_SIZE))
 
+    # Draw the frame and label of the turn box
+    pygame.draw.rect(screen, pygame.Color('black'),
+                     pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 3, SQ_SIZE * 2, SQ_SIZE), 3)
+    screen.blit(render_text('Turn'), pygame.Rect(SQ_SIZE * 11, SQ_SIZE * 2.6, SQ_SIZE * 2, SQ_SIZE))
+
 
 def draw_pieces(screen, chessboard):
     """Draw pieces on top of squares"""
@@ -208,20 +630,15 @@ def draw_pieces(screen, chessboard):
 
 
 def print_turn(screen, game):
-    """Prints the current player's turn"""
+    """Prints the current player's turn and returns the rectangle of the turn box"""
 
-    # Clear the previous turn
-    pygame.draw.rect(screen, pygame.Color('white'),
-                     pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 3, SQ_SIZE * 2, SQ_SIZE))
-    pygame.draw.rect(screen, pygame.Color('black'),
-                     pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 3, SQ_SIZE * 2, SQ_SIZE), 3)
+    # Clear the previous turn by restoring the empty box from the background
+    box = pygame.Rect(SQ_SIZE * 10.5, SQ_SIZE * 3, SQ_SIZE * 2, SQ_SIZE)
+    screen.blit(get_background(), box, box)
 
     # Print current turn
-    font = pygame.font.Font(None, 36)
-    text = font.render(game.get_player_turn(), 1, 'black')
-    screen.blit(text, pygame.Rect(SQ_SIZE * 10.8, SQ_SIZE * 3.3, SQ_SIZE * 2, SQ_SIZE))
-    text = font.render('Turn', 1, 'black')
-    screen.blit(text, pygame.Rect(SQ_SIZE * 11, SQ_SIZE * 2.6, SQ_SIZE * 2, SQ_SIZE))
+    screen.blit(render_text(game.get_player_turn()), pygame.Rect(SQ_SIZE * 10.8, SQ_SIZE * 3.3, SQ_SIZE * 2, SQ_SIZE))
+    return box
 
 
 def highlight_selection(screen, player_selection, chessboard):
@@ -242,54 +659,14 @@ def highlight_selection(screen, player_selection, chessboard):
 
 
 def display_text(screen, text):
-    """Displays input text to the middle of the chessboard"""
+    """Displays input text to the middle of the chessboard and returns the rectangle it covers"""
 
-    font = pygame.font.Font(None, 36)
-    text_object = font.render(text, 0, pygame.Color('grey'))
-    text_location = pygame.Rect(0, 0, WIDTH, HEIGHT).move(HEIGHT/2 - text_object.get_width()/2, HEIGHT/2 -
-                                                          text_object.get_height()/2)
+    text_object = render_text(text, 'grey', False)
+    text_location = text_object.get_rect(center=(HEIGHT // 2, HEIGHT // 2))
     screen.blit(text_object, text_location)
-    text_object = font.render(text, 0, pygame.Color('black'))
+    text_object = render_text(text, 'black', False)
     screen.blit(text_object, text_location.move(1, 1))
-
-
-def animate_move(player_clicks, screen, chessboard, clock, moved_piece, removed_piece):
-    """Animate the given chess move"""
-
-    colors = [pygame.Color('white'), pygame.Color('gray')]
-
-    # Store starting/ending columns in prettier variables
-    start_column = player_clicks[0][0]
-    end_column = player_clicks[1][0]
-
-    start_row = player_clicks[0][1]
-    end_row = player_clicks[1][1]
-
-    delta_column = end_column - start_column
-    delta_row = end_row - start_row
-
-    frames_per_square = 10
-    frame_count = (abs(delta_row) + abs(delta_column)) * frames_per_square
-
-    # Draw the animation one frame at a time
-    for frame in range(frame_count + 1):
-        column, row = (start_column + delta_column*frame/frame_count, FLIP_ROW[start_row] - delta_row*frame/frame_count)
-        draw_chessboard(screen)
-        draw_pieces(screen, chessboard)
-
-        # Erase piece moved from ending square
-        color = colors[(FLIP_ROW[end_row] + end_column) % 2]
-        end_square = pygame.Rect(end_column * SQ_SIZE, FLIP_ROW[end_row] * SQ_SIZE, SQ_SIZE, SQ_SIZE)
-        pygame.draw.rect(screen, color, end_square)
-
-        # Draw captured piece onto ending square:
-        if removed_piece:
-            screen.blit(IMAGES[removed_piece], end_square)
-
-        # Draw moving piece
-        screen.blit(IMAGES[moved_piece], pygame.Rect(column * SQ_SIZE, row * SQ_SIZE, SQ_SIZE, SQ_SIZE))
-        pygame.display.flip()
-        clock.tick(frame_count / 0.5)
+    return text_location.union(text_location.move(1, 1))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,273 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: Unit Tests for the drawing code in ChessGUI.py and ChessRender.py, run without a window through SDL's
+#              dummy video driver
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from ChessVar import ChessVar, SQUARE_INDEX
+from ChessRecord import GameRecordWriter
+import ChessGUI
+import ChessRender
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+
+class ChessGUITestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame = ChessGUI.import_pygame()
+        pygame.init()
+        pygame.display.set_mode((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        ChessGUI.load_images()
+
+    @classmethod
+    def tearDownClass(cls):
+        # Stop SDL's threads so later tests can fork worker processes safely
+        ChessGUI.import_pygame().quit()
+        ChessGUI.LAYERS.clear()
+        ChessGUI.TEXT.clear()
+        ChessGUI.FONTS.clear()
+
+    def test_imports_without_pygame(self):
+        code = 'import sys, ChessVar, ChessEngine, ChessSimulator, ChessGUI, ChessRender; print("pygame" in sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        self.assertEqual(output.strip(), 'False')
+
+    def test_atlas_cache(self):
+        pygame = ChessGUI.import_pygame()
+        saved = ChessGUI.IMAGE_DIR, ChessGUI.ATLAS_DIR, dict(ChessGUI.IMAGES), dict(ChessGUI.LAYERS)
+        with tempfile.TemporaryDirectory() as directory:
+            ChessGUI.IMAGE_DIR = os.path.join(directory, 'images')
+            ChessGUI.ATLAS_DIR = os.path.join(ChessGUI.IMAGE_DIR, 'cache')
+            shutil.copytree(saved[0], ChessGUI.IMAGE_DIR, ignore=shutil.ignore_patterns('cache'))
+            try:
+                ChessGUI.LAYERS.clear()
+                ChessGUI.load_images()
+                first_path = ChessGUI.atlas_path()
+                self.assertEqual(os.listdir(ChessGUI.ATLAS_DIR), [os.path.basename(first_path)])
+
+                # Sprites are views into the atlas with the same pixels as the scaled source image
+                sprite = ChessGUI.IMAGES['BQ']
+                self.assertEqual(sprite.get_size(), (ChessGUI.SQ_SIZE, ChessGUI.SQ_SIZE))
+                self.assertIs(sprite.get_parent(), ChessGUI.LAYERS['atlas'])
+                image = pygame.transform.scale(pygame.image.load(os.path.join(ChessGUI.IMAGE_DIR, 'BQ.png')),
+                                               (ChessGUI.SQ_SIZE, ChessGUI.SQ_SIZE)).convert_alpha()
+                self.assertEqual(pygame.image.tobytes(sprite, 'RGBA'), pygame.image.tobytes(image, 'RGBA'))
+
+                # Touching a source image replaces the cached atlas
+                pawn_path = os.path.join(ChessGUI.IMAGE_DIR, 'WP.png')
+                status = os.stat(pawn_path)
+                os.utime(pawn_path, ns=(status.st_atime_ns, status.st_mtime_ns + 10 ** 9))
+                self.assertNotEqual(ChessGUI.atlas_path(), first_path)
+                ChessGUI.load_images()
+                self.assertEqual(os.listdir(ChessGUI.ATLAS_DIR), [os.path.basename(ChessGUI.atlas_path())])
+            finally:
+                ChessGUI.IMAGE_DIR, ChessGUI.ATLAS_DIR = saved[0], saved[1]
+                ChessGUI.IMAGES.update(saved[2])
+                ChessGUI.LAYERS.clear()
+                ChessGUI.LAYERS.update(saved[3])
+
+    def test_renderer_matches_full_redraw(self):
+        pygame = ChessGUI.import_pygame()
+        surface = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        expected = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        renderer = ChessGUI.BoardRenderer(surface)
+        game = ChessVar()
+
+        # The first draw repaints everything, a draw with nothing changed touches nothing, and a move only redraws its
+        # own squares and the turn box
+        self.assertIn(surface.get_rect(), renderer.draw(game))
+        self.assertEqual(renderer.draw(game), [])
+        game.make_move('e2', 'e4')
+        dirty = renderer.draw(game)
+        self.assertEqual(dirty[-1], ChessGUI.print_turn(expected, game))
+        self.assertEqual(sorted(tuple(rect) for rect in dirty[:-1]),
+                         sorted(tuple(ChessGUI.square_rect(SQUARE_INDEX[name])) for name in ('e2', 'e4')))
+
+        rng = random.Random(4)
+        while game.get_game_state() == 'UNFINISHED' and game.legal_moves():
+            selection = () if rng.random() < 0.5 else (rng.randint(1, 8), rng.randint(1, 8))
+            renderer.draw(game, selection)
+            ChessGUI.draw_game_state(expected, game, selection)
+            self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+            game.push(rng.choice(game.legal_moves()))
+
+        # Invalidating repaints the whole surface, including the result message
+        renderer.draw(game)
+        renderer.invalidate()
+        self.assertIn(surface.get_rect(), renderer.draw(game))
+        ChessGUI.draw_game_state(expected, game, ())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+    def test_move_animation(self):
+        pygame = ChessGUI.import_pygame()
+        source, destination = SQUARE_INDEX['d1'], SQUARE_INDEX['g4']
+        animation = ChessGUI.MoveAnimation(source, destination, 4, None, 1000)
+        self.assertEqual(animation.get_progress(900), 0.0)
+        self.assertEqual(animation.get_progress(1000 + ChessGUI.ANIMATION_TIME // 2), 0.5)
+        self.assertEqual(animation.get_progress(1000 + 2 * ChessGUI.ANIMATION_TIME), 1.0)
+        self.assertEqual(animation.get_rect(0.0), ChessGUI.square_rect(source))
+        self.assertEqual(animation.get_rect(1.0), ChessGUI.square_rect(destination))
+        self.assertEqual(animation.get_rect(0.5).center, ChessGUI.square_rect(source).union(
+            ChessGUI.square_rect(destination)).center)
+
+        surface = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        expected = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        renderer = ChessGUI.BoardRenderer(surface)
+        game = ChessVar()
+        for move in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(*move)
+        renderer.draw(game)
+
+        # While the bishop slides, only the area it covers changes, and the queen stays on g4 until the bishop lands
+        source, destination = SQUARE_INDEX['c8'], SQUARE_INDEX['g4']
+        queen = game.get_mailbox()[destination]
+        game.make_move_idx(source, destination)
+        renderer.animate(source, destination, game.get_mailbox()[destination], queen, now=0)
+        dirty = renderer.draw(game, now=ChessGUI.ANIMATION_TIME // 2)
+        self.assertTrue(renderer.is_animating())
+        self.assertIn(ChessGUI.square_rect(source), dirty)
+        self.assertNotIn(ChessGUI.square_rect(destination), dirty)
+        sprite = renderer.draw(game, now=ChessGUI.ANIMATION_TIME * 3 // 4)
+        self.assertEqual(len(sprite), 2)
+
+        # Finishing the animation leaves the same picture as a full redraw
+        renderer.draw(game, now=ChessGUI.ANIMATION_TIME)
+        self.assertFalse(renderer.is_animating())
+        ChessGUI.draw_game_state(expected, game, ())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+        self.assertEqual(renderer.draw(game), [])
+
+        # An animation stopped half way does not leave the piece behind
+        renderer.animate(source, destination, game.get_mailbox()[destination], queen, now=0)
+        renderer.draw(game, now=ChessGUI.ANIMATION_TIME // 3)
+        renderer.stop_animation()
+        renderer.draw(game, now=ChessGUI.ANIMATION_TIME // 3)
+        ChessGUI.draw_game_state(expected, game, ())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+    def test_reset_in_place(self):
+        pygame = ChessGUI.import_pygame()
+        surface = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        expected = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        renderer = ChessGUI.BoardRenderer(surface)
+        game = ChessVar()
+        for move in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(*move)
+
+        # Reset while the winning capture animates and its message shows, as the Reset button does
+        source, destination = SQUARE_INDEX['c8'], SQUARE_INDEX['g4']
+        queen = game.get_mailbox()[destination]
+        game.make_move_idx(source, destination)
+        renderer.animate(source, destination, game.get_mailbox()[destination], queen, now=0)
+        renderer.draw(game, now=ChessGUI.ANIMATION_TIME // 2)
+        self.assertEqual(game.get_game_state(), 'BLACK_WON')
+        game.reset()
+        renderer.stop_animation()
+        dirty = renderer.draw(game)
+
+        # The same game object is back at the start, and only the changed areas were redrawn to show it
+        self.assertEqual(game.to_position(), ChessVar().to_position())
+        self.assertEqual(game.get_hash(), ChessVar().get_hash())
+        self.assertNotIn(surface.get_rect(), dirty)
+        ChessGUI.draw_game_state(expected, ChessVar(), ())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+    def test_no_legal_moves(self):
+        pygame = ChessGUI.import_pygame()
+        surface = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        expected = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        renderer = ChessGUI.BoardRenderer(surface)
+
+        # Black's pawn is blocked and nothing else can move, so the unfinished game is shown as a draw
+        game = ChessVar.from_position('8/8/8/8/8/1p6/1P6/8 b -')
+        self.assertEqual(game.get_game_state(), 'UNFINISHED')
+        self.assertEqual(ChessGUI.get_result(game), 'DRAW')
+        self.assertEqual(renderer.get_result(game), 'DRAW')
+        dirty = renderer.draw(game)
+        ChessGUI.draw_game_state(expected, game, ())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+        self.assertIn(ChessGUI.display_text(expected, ChessGUI.MESSAGES['DRAW']), dirty)
+
+        # A forfeit still decides the game, and positions with a legal move are unfinished
+        game.forfeit(display=False)
+        self.assertEqual(renderer.get_result(game), 'WHITE_WON')
+        self.assertEqual(renderer.get_result(ChessVar()), 'UNFINISHED')
+
+    def test_position_renderer(self):
+        pygame = ChessGUI.import_pygame()
+        game = ChessVar()
+        expected = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT))
+        full_size = ChessRender.PositionRenderer(None, 'window')
+        board = ChessRender.PositionRenderer(None, 'board')
+        thumbnail = ChessRender.PositionRenderer(80)
+        self.assertEqual(board.get_size(), (ChessGUI.HEIGHT, ChessGUI.HEIGHT))
+        self.assertEqual(thumbnail.get_size(), (80, 80))
+        with self.assertRaises(ValueError):
+            ChessRender.PositionRenderer(80, 'corner')
+
+        rng = random.Random(9)
+        for _ in range(12):
+            game.push(rng.choice(game.legal_moves()))
+            ChessGUI.draw_game_state(expected, game, ())
+            self.assertEqual(pygame.image.tobytes(full_size.render(game), 'RGB'),
+                             pygame.image.tobytes(expected, 'RGB'))
+            board_area = expected.subsurface(pygame.Rect(0, 0, ChessGUI.HEIGHT, ChessGUI.HEIGHT))
+            self.assertEqual(pygame.image.tobytes(board.render(game), 'RGB'), pygame.image.tobytes(board_area, 'RGB'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'position.png')
+            thumbnail.save(game, path)
+            self.assertEqual(pygame.image.load(path).get_size(), (80, 80))
+
+    def test_render_games(self):
+        pygame = ChessGUI.import_pygame()
+        rng = random.Random(2)
+        with tempfile.TemporaryDirectory() as directory:
+            record_path = os.path.join(directory, 'games.cvgr')
+            games = []
+            with GameRecordWriter(record_path) as writer:
+                for _ in range(5):
+                    game = ChessVar()
+                    moves = []
+                    for _ in range(rng.randint(1, 8)):
+                        moves.append(rng.choice(game.legal_moves()))
+                        game.push(moves[-1])
+                    writer.write_game('DRAW', moves)
+                    games.append(game)
+
+            # Final positions in worker processes, and every frame of two games in this process
+            thumbs = os.path.join(directory, 'thumbs')
+            paths = [path for chunk in ChessRender.render_games(record_path, thumbs, processes=2, chunk_size=2)
+                     for path in chunk]
+            self.assertEqual(sorted(paths), [ChessRender.game_image_path(thumbs, number) for number in range(5)])
+
+            frames = os.path.join(directory, 'frames')
+            paths = [path for chunk in ChessRender.render_games(record_path, frames, [1, 3], frames=True,
+                                                                processes=1)
+                     for path in chunk]
+            expected_count = sum(len(games[number]._undo_stack) + 1 for number in (1, 3))
+            self.assertEqual(len(paths), expected_count)
+            self.assertEqual(len(os.listdir(frames)), expected_count)
+
+            # The last frame of a game matches its thumbnail and a rendering of its final position
+            last_frame = ChessRender.game_image_path(frames, 3, len(games[3]._undo_stack))
+            positions = os.path.join(directory, 'positions')
+            paths = list(ChessRender.render_positions([games[3].to_position(), games[3].to_position(True)], positions,
+                                                      processes=1))[0]
+            for path in (ChessRender.game_image_path(thumbs, 3), paths[0], paths[1]):
+                self.assertEqual(pygame.image.tobytes(pygame.image.load(path), 'RGB'),
+                                 pygame.image.tobytes(pygame.image.load(last_frame), 'RGB'))
+
+
+if __name__ == '__main__':
+    unittest.main()
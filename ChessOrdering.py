@@ -0,0 +1,235 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains the move ordering used by the search engine for the chess game defined in ChessVar.
+#              Alpha-beta search cuts off sooner when the best move is searched first, so moves are sorted by how
+#              likely they are to refute the position: the transposition table move, captures that wipe out a piece
+#              type, other captures, killer moves, then quiet moves by their history. Cutoff statistics show how well
+#              the ordering works.
+
+from ChessVar import PIECE_NAMES
+
+# Move categories, in the order they are searched
+TABLE_MOVE = 0
+EXTINCTION_CAPTURE = 1
+CAPTURE = 2
+KILLER = 3
+QUIET = 4
+CATEGORY_NAMES = ['table move', 'extinction capture', 'capture', 'killer', 'quiet']
+
+# Sort priority of each category. Captures and quiet moves are sorted within their band by the scores below.
+TABLE_MOVE_PRIORITY = 1 << 30
+EXTINCTION_PRIORITY = 1 << 28
+CAPTURE_PRIORITY = 1 << 24
+KILLER_PRIORITY = 1 << 22
+
+# Killer moves kept per ply, and the history score at which every history score is halved
+KILLER_SLOTS = 2
+HISTORY_LIMIT = 1 << 20
+
+# A capture's victim value is multiplied by SCARCITY / (pieces of the victim's type left). Taking one of two rooks
+# brings that type one capture from extinction, so it ranks above taking one of eight pawns.
+SCARCITY = 8
+
+
+class CutoffStatistics:
+    """
+    A class used to count how often the searched moves cause beta cutoffs.
+
+    Attributes
+    ----------
+    nodes : int
+        Number of nodes whose moves were searched
+    cutoffs : int
+        Number of those nodes that ended with a beta cutoff
+    first_move_cutoffs : int
+        Number of cutoffs caused by the first move searched
+    cutoff_move_numbers : int
+        Sum of the positions (0 for the first) of the moves that caused cutoffs
+    category_cutoffs : list
+        Number of cutoffs caused by moves of each category, indexed by TABLE_MOVE to QUIET
+
+    Methods
+    -------
+    get_cutoff_rate()
+        Returns the fraction of nodes that ended with a cutoff
+    get_first_move_rate()
+        Returns the fraction of cutoffs caused by the first move searched
+    get_average_cutoff_move()
+        Returns the average position of the move that caused a cutoff
+    reset()
+        Sets every count back to 0
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Sets every count back to 0"""
+        self.nodes = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.cutoff_move_numbers = 0
+        self.category_cutoffs = [0] * len(CATEGORY_NAMES)
+
+    def get_cutoff_rate(self):
+        """Returns the fraction of nodes that ended with a cutoff"""
+        return self.cutoffs / self.nodes if self.nodes else 0.0
+
+    def get_first_move_rate(self):
+        """Returns the fraction of cutoffs caused by the first move searched"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def get_average_cutoff_move(self):
+        """Returns the average position of the move that caused a cutoff, 0 for the first move"""
+        return self.cutoff_move_numbers / self.cutoffs if self.cutoffs else 0.0
+
+    def __str__(self):
+        categories = ' '.join('{} {}'.format(name.replace(' ', '-'), count)
+                              for name, count in zip(CATEGORY_NAMES, self.category_cutoffs))
+        return 'nodes {} cutoffs {} ({:.1%}) first move {:.1%} average move {:.2f} {}'.format(
+            self.nodes, self.cutoffs, self.get_cutoff_rate(), self.get_first_move_rate(),
+            self.get_average_cutoff_move(), categories)
+
+
+class MoveOrderer:
+    """
+    A class used to sort the moves of a search so the moves most likely to cause a cutoff come first.
+
+    Captures are read from the game's mailbox, and a capture wipes out a piece type when the game's piece inventory
+    holds one piece of the victim's type. Other captures are sorted by most valuable victim, weighted by how few
+    pieces of its type are left, then least valuable attacker. Killer moves are the quiet moves that caused the latest
+    cutoffs at the same ply in sibling positions. The history table scores every quiet move by the cutoffs it caused
+    anywhere in the search, weighted by depth.
+
+    Attributes
+    ----------
+    piece_values : list
+        Material value of each piece type within a color, in PIECE_NAMES order
+    killers : list
+        The KILLER_SLOTS latest killer moves of each ply, most recent first
+    history : list
+        Two lists, for White and Black, of 4096 history scores indexed by move
+    statistics : CutoffStatistics
+        Cutoff counts of the searches since the last reset
+
+    Methods
+    -------
+    order(game, moves, table_move, ply)
+        Sorts moves in place, most promising first, and returns them
+    record_cutoff(game, move, ply, depth, move_number, table_move=0)
+        Records that a move caused a beta cutoff, updating killers, history and statistics
+    record_no_cutoff()
+        Records that every move of a node was searched without a cutoff
+    new_search()
+        Forgets the killer moves and ages the history scores before a new search
+    get_statistics()
+        Returns the CutoffStatistics
+    """
+
+    def __init__(self, piece_values, max_ply):
+        self._piece_values = piece_values
+        self._killers = [[0] * KILLER_SLOTS for _ in range(max_ply + 1)]
+        self._history = [[0] * 4096, [0] * 4096]
+        self._statistics = CutoffStatistics()
+
+    def get_statistics(self):
+        """Returns the cutoff statistics of the searches since the last reset"""
+        return self._statistics
+
+    def get_killers(self, ply):
+        """Returns the killer moves of a ply, most recent first, 0 for an empty slot"""
+        return self._killers[ply]
+
+    def get_history(self, color, move):
+        """Returns the history score of a move for a color, 0 for White and 1 for Black"""
+        return self._history[color][move]
+
+    def new_search(self):
+        """Forgets the killer moves and halves the history scores, so older searches count for less"""
+        for killers in self._killers:
+            killers[:] = [0] * KILLER_SLOTS
+        for history in self._history:
+            history[:] = [score >> 1 for score in history]
+
+    def categorize(self, game, move, table_move):
+        """Returns the category of a move in the game's current position, from TABLE_MOVE to QUIET"""
+        if move == table_move:
+            return TABLE_MOVE
+        victim = game.get_mailbox()[move & 63]
+        if victim is not None:
+            if game.get_piece_inventory()[PIECE_NAMES[victim]] == 1:
+                return EXTINCTION_CAPTURE
+            return CAPTURE
+        return QUIET
+
+    def order(self, game, moves, table_move, ply):
+        """
+        Sorts moves so the most promising are searched first
+
+        :param game: the ChessVar object the moves belong to
+        :param moves: a list of legal moves, sorted in place
+        :param table_move: the best move stored in the transposition table, or 0
+        :param ply: distance from the root, which selects the killer moves
+        :return: the sorted list
+        """
+        mailbox = game.get_mailbox()
+        inventory = game.get_piece_inventory()
+        values = self._piece_values
+        killers = self._killers[ply]
+        history = self._history[0 if game.get_player_turn() == 'WHITE' else 1]
+
+        def priority(move):
+            if move == table_move:
+                return TABLE_MOVE_PRIORITY
+            victim = mailbox[move & 63]
+            if victim is not None:
+                left = inventory[PIECE_NAMES[victim]]
+                if left == 1:
+                    return EXTINCTION_PRIORITY + values[victim % 6]
+                return CAPTURE_PRIORITY + values[victim % 6] * SCARCITY // left - values[mailbox[move >> 6] % 6]
+            if move in killers:
+                return KILLER_PRIORITY + KILLER_SLOTS - killers.index(move)
+            return history[move]
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    def record_cutoff(self, game, move, ply, depth, move_number, table_move=0):
+        """
+        Records that a move caused a beta cutoff. A quiet move becomes the ply's first killer and gains history.
+
+        :param game: the ChessVar object, at the position the move was made from
+        :param move: the move that caused the cutoff
+        :param ply: distance from the root
+        :param depth: remaining search depth, which weights the history bonus
+        :param move_number: position of the move in the searched order, 0 for the first
+        :param table_move: the transposition table move of the position, or 0
+        """
+        statistics = self._statistics
+        statistics.nodes += 1
+        statistics.cutoffs += 1
+        statistics.cutoff_move_numbers += move_number
+        if move_number == 0:
+            statistics.first_move_cutoffs += 1
+
+        category = self.categorize(game, move, table_move)
+        killers = self._killers[ply]
+        if category == QUIET and move in killers:
+            category = KILLER
+        statistics.category_cutoffs[category] += 1
+        if game.get_mailbox()[move & 63] is not None:
+            return
+
+        if killers[0] != move:
+            killers[1:] = killers[:-1]
+            killers[0] = move
+        history = self._history[0 if game.get_player_turn() == 'WHITE' else 1]
+        history[move] += depth * depth
+        if history[move] >= HISTORY_LIMIT:
+            for color_history in self._history:
+                color_history[:] = [score >> 1 for score in color_history]
+
+    def record_no_cutoff(self):
+        """Records that every move of a node was searched without a cutoff"""
+        self._statistics.nodes += 1
@@ -0,0 +1,209 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a parallel search for the chess game defined in ChessVar. Several worker processes
+#              search the same position at once (Lazy SMP), each with its own SearchEngine and slightly different
+#              settings, and share what they find through one lock-free transposition table in shared memory. The
+#              module can also report how much faster a fixed-depth search gets as workers are added.
+
+import argparse
+import multiprocessing
+import os
+import time
+from ChessVar import ChessVar, move_to_algebraic
+from ChessEngine import SearchEngine, SearchResult
+from ChessTransposition import SharedTranspositionTable
+
+
+def _parallel_worker(connection, worker_number, table_name, table_size_mb, stop_event, max_depth, time_limit):
+    """
+    Worker process entry point. Searches each position it receives and sends back the SearchResult.
+
+    Worker 0 searches the normal way and sets the stop event when it is done. The helpers search one ply deeper on
+    every second worker and shuffle their root moves, so they reach different parts of the tree first and fill the
+    shared table with results worker 0 needs later.
+    """
+    table = SharedTranspositionTable(table_size_mb, name=table_name)
+    helper = worker_number > 0
+    engine = SearchEngine(max_depth + worker_number % 2, None, time_limit, stop_event=stop_event, table=table,
+                          root_seed=worker_number if helper else None)
+    connection.send('ready')
+    try:
+        while True:
+            position = connection.recv()
+            if position is None:
+                return
+            result = engine.search(ChessVar.from_position(position))
+            if not helper:
+                stop_event.set()
+            connection.send(result)
+    finally:
+        table.close()
+
+
+class ParallelSearch:
+    """
+    A class used to search one position with several worker processes that share a transposition table.
+
+    The workers are started once and kept for every search, along with their transposition table. A search ends when
+    worker 0 completes max_depth or reaches the time limit; the helpers are stopped at that moment. The result is the
+    one that completed the deepest iteration, with the nodes of every worker added up.
+
+    Attributes
+    ----------
+    workers : int
+        Number of worker processes
+    max_depth : int
+        The deepest iteration worker 0 searches
+    time_limit : float
+        The number of seconds after which the search stops, or None for no limit
+    table : SharedTranspositionTable
+        The transposition table every worker reads and writes
+
+    Methods
+    -------
+    search(game)
+        Searches the game's current position with every worker and returns a SearchResult
+    get_workers()
+        Returns the number of worker processes
+    close()
+        Stops the worker processes and frees the shared table
+    """
+
+    def __init__(self, workers=None, max_depth=6, time_limit=None, table_size_mb=64):
+        self._workers = workers or os.cpu_count() or 1
+        self._table = SharedTranspositionTable(table_size_mb)
+
+        # Spawn rather than fork, so the workers inherit nothing from a process that has already started pygame
+        context = multiprocessing.get_context('spawn')
+        self._stop_event = context.Event()
+        self._connections = []
+        self._processes = []
+        for worker_number in range(self._workers):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(target=_parallel_worker, daemon=True,
+                                      args=(worker_connection, worker_number, self._table.get_name(), table_size_mb,
+                                            self._stop_event, max_depth, time_limit))
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+        # Wait until every worker has started, so the first search is not timed with the workers' imports
+        for connection in self._connections:
+            connection.recv()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_workers(self):
+        """Returns the number of worker processes"""
+        return self._workers
+
+    def get_table(self):
+        """Returns the shared transposition table"""
+        return self._table
+
+    def search(self, game):
+        """
+        Searches the game's current position with every worker and waits for the result
+
+        :param game: a ChessVar object. It is not changed.
+        :return: the SearchResult of the deepest completed iteration. Its nodes are the total of every worker, and its
+                 elapsed time is the wall-clock time of the whole search.
+        """
+        start = time.perf_counter()
+        self._stop_event.clear()
+        position = game.to_position(binary=True)
+        for connection in self._connections:
+            connection.send(position)
+        results = [connection.recv() for connection in self._connections]
+
+        # Prefer worker 0's result when a helper reached the same depth
+        best = results[0]
+        for result in results[1:]:
+            if result.depth > best.depth and result.best_move is not None:
+                best = result
+        return SearchResult(best.best_move, best.score, best.depth, sum(result.nodes for result in results),
+                            time.perf_counter() - start, best.principal_variation)
+
+    def close(self):
+        """Stops the worker processes and frees the shared table"""
+        for connection, process in zip(self._connections, self._processes):
+            if process.is_alive():
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+        for connection, process in zip(self._connections, self._processes):
+            process.join(2.0)
+            if process.is_alive():
+                process.terminate()
+            connection.close()
+        self._connections = []
+        self._processes = []
+        self._table.close()
+
+
+def measure_speedup(game, worker_counts, max_depth, table_size_mb=64, repeats=1):
+    """
+    Times a fixed-depth search of one position with each number of workers
+
+    Every search starts from an empty table. The time of the fastest repeat is kept.
+
+    :param game: a ChessVar object
+    :param worker_counts: the numbers of workers to try, such as [1, 2, 4, 8]
+    :param max_depth: the depth worker 0 completes
+    :param table_size_mb: size of the shared transposition table
+    :param repeats: number of times each search is repeated
+    :return: a list of dicts, one per worker count, with keys workers, seconds, nodes, nodes_per_second, speedup,
+             depth and best_move. best_move is None if the position has no legal move or the game is over. Speedup
+             is relative to the first worker count.
+    """
+    rows = []
+    for workers in worker_counts:
+        best = None
+        with ParallelSearch(workers, max_depth, None, table_size_mb) as search:
+            for _ in range(repeats):
+                search.get_table().clear()
+                result = search.search(game)
+                if best is None or result.elapsed < best.elapsed:
+                    best = result
+        rows.append({'workers': workers, 'seconds': best.elapsed, 'nodes': best.nodes,
+                     'nodes_per_second': best.get_nodes_per_second(), 'depth': best.depth,
+                     'best_move': best.best_move, 'speedup': rows[0]['seconds'] / best.elapsed if rows else 1.0})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the speedup of a parallel search as workers are added.')
+    parser.add_argument('--depth', type=int, default=6, help='depth the main worker completes')
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='worker counts to try (default: 1, 2, 4, ... up to the CPU count)')
+    parser.add_argument('--hash', type=int, default=64, help='shared transposition table size in MB')
+    parser.add_argument('--repeats', type=int, default=1, help='searches per worker count, the fastest is kept')
+    parser.add_argument('--position', default=None, help='position string to search instead of the starting one')
+    arguments = parser.parse_args()
+
+    worker_counts = arguments.workers
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= (os.cpu_count() or 1):
+            worker_counts.append(worker_counts[-1] * 2)
+    game = ChessVar() if arguments.position is None else ChessVar.from_position(arguments.position)
+
+    print('cpus {} depth {}'.format(os.cpu_count(), arguments.depth))
+    print('{:>7} {:>8} {:>10} {:>9} {:>7} {:>5} {}'.format('workers', 'seconds', 'nodes', 'nps', 'speedup', 'depth',
+                                                          'bestmove'))
+    for row in measure_speedup(game, worker_counts, arguments.depth, arguments.hash, arguments.repeats):
+        best_move = '-' if row['best_move'] is None else ''.join(move_to_algebraic(row['best_move']))
+        print('{:>7} {:>8.2f} {:>10} {:>9} {:>7.2f} {:>5} {}'.format(
+            row['workers'], row['seconds'], row['nodes'], row['nodes_per_second'], row['speedup'], row['depth'],
+            best_move))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a perft (performance test) tool for the chess game defined in ChessVar. Perft
+#              counts the leaf positions of the full move tree to a fixed depth, which checks move generation against
+#              stored reference counts and measures its speed. Counts follow this variant's rules: a game ends as soon
+#              as every piece of one type has been captured, and there is no castling, en passant or pawn promotion.
+
+import argparse
+import sys
+import time
+from ChessVar import ChessVar, SQUARE_INDEX, move_to_algebraic
+
+# Test positions, each reached from the starting position by playing its moves, with reference leaf counts by depth
+TEST_POSITIONS = [
+    ('start', [], [20, 400, 8902, 197742]),
+    ('open center', [('e2', 'e4'), ('d7', 'd5')], [31, 892, 28190, 840960]),
+    ('queen exposed', [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')], [28, 1114, 32448, 1256263]),
+    ('knights out', [('g1', 'f3'), ('g8', 'f6'), ('b1', 'c3'), ('b8', 'c6')], [24, 572, 14721, 376994]),
+]
+
+
+def setup_position(moves):
+    """Returns a ChessVar object after playing the given (source, destination) moves from the starting position"""
+    game = ChessVar()
+    for source, destination in moves:
+        game.push((SQUARE_INDEX[source] << 6) | SQUARE_INDEX[destination])
+    return game
+
+
+def perft(game, depth):
+    """
+    Counts the leaf positions of the move tree below the game's current position
+
+    :param game: a ChessVar object. It is returned to its original position when the count is done.
+    :param depth: the number of moves (plies) to look ahead
+    :return: the number of positions reached after exactly depth moves. Games that end earlier add nothing.
+    """
+    if depth == 0:
+        return 1
+
+    moves = game.legal_moves()
+
+    # Count the last ply without making the moves
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        game.push(move)
+        nodes += perft(game, depth - 1)
+        game.pop()
+    return nodes
+
+
+def divide(game, depth):
+    """Returns a dictionary of leaf counts below each legal move, keyed by the move in algebraic notation"""
+    counts = {}
+    for move in game.legal_moves():
+        game.push(move)
+        counts[''.join(move_to_algebraic(move))] = perft(game, depth - 1)
+        game.pop()
+    return counts
+
+
+def run_suite(max_depth, output=sys.stdout):
+    """
+    Runs perft on every test position up to max_depth and compares the counts with the reference counts
+
+    :param max_depth: the deepest depth to count (limited to the depths with stored reference counts)
+    :param output: file object the report is written to
+    :return: True if every count matched its reference count. False otherwise.
+    """
+    passed = True
+    total_nodes = 0
+    total_time = 0.0
+
+    for name, moves, reference_counts in TEST_POSITIONS:
+        game = setup_position(moves)
+        for depth, expected in enumerate(reference_counts[:max_depth], start=1):
+            start = time.perf_counter()
+            nodes = perft(game, depth)
+            elapsed = time.perf_counter() - start
+            total_nodes += nodes
+            total_time += elapsed
+
+            status = 'ok' if nodes == expected else 'MISMATCH (expected {})'.format(expected)
+            passed = passed and nodes == expected
+            print('{:<16} depth {} nodes {:>9} time {:7.3f}s nps {:>9} {}'.format(
+                name, depth, nodes, elapsed, int(nodes / elapsed) if elapsed else 0, status), file=output)
+
+    print('total nodes {} time {:.3f}s nps {}'.format(
+        total_nodes, total_time, int(total_nodes / total_time) if total_time else 0), file=output)
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count move tree leaves and compare them with reference counts.')
+    parser.add_argument('--depth', type=int, default=3, help='deepest depth to count (1-4)')
+    parser.add_argument('--divide', action='store_true',
+                        help='print the leaf count below each move of the starting position instead')
+    arguments = parser.parse_args()
+
+    if arguments.divide:
+        for move, nodes in sorted(divide(ChessVar(), arguments.depth).items()):
+            print(move, nodes)
+        return
+
+    if not run_suite(arguments.depth):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a compact binary file format for storing many games of the chess variant defined
+#              in ChessVar. Each move is packed into 2 bytes, and a fixed header plus an offset index let the reader
+#              memory-map the file and read any game without loading the others into Python objects.
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from ChessVar import PIECE_NAMES
+
+# File layout (all integers little-endian):
+#
+#   header   MAGIC, version (uint16), reserved (uint16), game count (uint64), index offset (uint64), reserved (8 bytes)
+#   games    one block per game: result (uint8), extinct piece index (uint8, 255 for none), reserved (uint16),
+#            move count (uint32), then one uint16 per move holding (source << 6) | destination in its low 12 bits
+#   index    one uint64 per game holding the file offset of its block
+MAGIC = b'CVGR'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQ8x')
+GAME_HEADER = struct.Struct('<BBHI')
+
+RESULT_CODES = {'DRAW': 0, 'WHITE_WON': 1, 'BLACK_WON': 2}
+RESULT_NAMES = ['DRAW', 'WHITE_WON', 'BLACK_WON']
+NO_PIECE = 255
+
+
+class GameRecordWriter:
+    """
+    A class used to write games to a game record file. Use it as a context manager, or call close when done so the
+    index and header are written.
+
+    Methods
+    -------
+    write_game(result, moves, extinct_type=None)
+        Appends one game to the file
+    write_result(game_result)
+        Appends a ChessSimulator GameResult to the file
+    close()
+        Writes the offset index and the final header, then closes the file
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._offsets = array('Q')
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_game(self, result, moves, extinct_type=None):
+        """
+        Appends one game to the file
+
+        :param result: 'WHITE_WON', 'BLACK_WON' or 'DRAW'
+        :param moves: a sequence of moves encoded as (source << 6) | destination
+        :param extinct_type: name of the piece type that was wiped out, such as 'BQ', or None
+        """
+        moves = array('H', moves)
+        if sys.byteorder != 'little':
+            moves.byteswap()
+        extinct = NO_PIECE if extinct_type is None else PIECE_NAMES.index(extinct_type)
+
+        self._offsets.append(self._file.tell())
+        self._file.write(GAME_HEADER.pack(RESULT_CODES[result], extinct, 0, len(moves)))
+        self._file.write(moves.tobytes())
+
+    def write_result(self, game_result):
+        """Appends a ChessSimulator GameResult to the file"""
+        self.write_game(game_result.result, game_result.moves, game_result.extinct_type)
+
+    def close(self):
+        """Writes the offset index and the final header, then closes the file"""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        offsets = array('Q', self._offsets)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        self._file.write(offsets.tobytes())
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, len(self._offsets), index_offset))
+        self._file.close()
+
+
+class StoredGame:
+    """
+    A class used to represent one game inside a memory-mapped game record file.
+
+    Attributes
+    ----------
+    result : string
+        'WHITE_WON', 'BLACK_WON' or 'DRAW'
+    extinct_type : string
+        Name of the piece type that was wiped out, such as 'BQ', or None
+    moves : array
+        The moves, encoded as (source << 6) | destination, copied out of the mapped file in one block. The game stays
+        valid after the reader is closed.
+    """
+
+    def __init__(self, result, extinct_type, moves):
+        self.result = result
+        self.extinct_type = extinct_type
+        self.moves = moves
+
+    def __len__(self):
+        return len(self.moves)
+
+
+class GameRecordReader:
+    """
+    A class used to read a game record file through a memory map. Games are only decoded when they are accessed, so
+    the reader can iterate over or randomly access millions of games without loading them.
+
+    Methods
+    -------
+    __len__()
+        Returns the number of games in the file
+    __getitem__(number)
+        Returns the StoredGame with the given position in the file
+    get_move_count(number)
+        Returns the number of moves of a game without reading them
+    close()
+        Closes the memory map
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise ValueError('{} is too short to be a game record file'.format(path))
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version, _, game_count, index_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('{} is not a version {} game record file'.format(path, VERSION))
+        if not HEADER.size <= index_offset <= index_offset + 8 * game_count <= len(self._map):
+            self.close()
+            raise ValueError('{} is truncated or corrupt: its index lies outside the file'.format(path))
+
+        self._path = path
+        self._game_count = game_count
+        self._index_offset = index_offset
+        self._index = self._view[index_offset:index_offset + 8 * game_count]
+        if sys.byteorder == 'little':
+            self._index = self._index.cast('Q')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._game_count
+
+    def _game_offset(self, number):
+        """Returns the file offset of the block of the game with the given position in the file"""
+        if number < 0:
+            number += self._game_count
+        if not 0 <= number < self._game_count:
+            raise IndexError('game number out of range')
+        if sys.byteorder == 'little':
+            return self._index[number]
+        return struct.unpack_from('<Q', self._index, 8 * number)[0]
+
+    def _game_header(self, number):
+        """Returns the (offset, result, extinct piece index, move count) of a game, checking that it fits the file"""
+        offset = self._game_offset(number)
+        if not HEADER.size <= offset <= self._index_offset - GAME_HEADER.size:
+            raise ValueError('{} is corrupt: game {} starts outside the file'.format(self._path, number))
+        result, extinct, _, move_count = GAME_HEADER.unpack_from(self._map, offset)
+        if offset + GAME_HEADER.size + 2 * move_count > self._index_offset or result >= len(RESULT_NAMES) or \
+                (extinct != NO_PIECE and extinct >= len(PIECE_NAMES)):
+            raise ValueError('{} is corrupt: game {} has an invalid header'.format(self._path, number))
+        return offset, result, extinct, move_count
+
+    def get_move_count(self, number):
+        """Returns the number of moves of the game with the given position in the file, without reading them"""
+        return self._game_header(number)[3]
+
+    def __getitem__(self, number):
+        """Returns the StoredGame with the given position in the file"""
+        offset, result, extinct, move_count = self._game_header(number)
+
+        # The moves are copied, so no view into the map outlives the call and the reader can always be closed
+        start = offset + GAME_HEADER.size
+        moves = array('H')
+        with self._view[start:start + 2 * move_count] as data:
+            moves.frombytes(data)
+        if sys.byteorder != 'little':
+            moves.byteswap()
+
+        return StoredGame(RESULT_NAMES[result], None if extinct == NO_PIECE else PIECE_NAMES[extinct], moves)
+
+    def __iter__(self):
+        for number in range(self._game_count):
+            yield self[number]
+
+    def close(self):
+        """Closes the memory map"""
+        if self._map.closed:
+            return
+        if hasattr(self, '_index') and isinstance(self._index, memoryview):
+            self._index.release()
+        self._view.release()
+        self._map.close()
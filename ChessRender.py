@@ -0,0 +1,304 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module renders chess variant positions and stored games to PNG files without opening a window.
+#              It draws with the BoardRenderer and cached layers of ChessGUI onto an offscreen surface through SDL's
+#              dummy video driver, and spreads games across a process pool. Each worker keeps its own surface, sprite
+#              atlas and background layer for every image it renders. Requires pygame.
+
+import argparse
+import multiprocessing
+import os
+import time
+import ChessGUI
+from ChessVar import ChessVar
+from ChessRecord import GameRecordReader
+
+# Parts of the GUI picture that can be saved: the board with its border and coordinates, or the whole window
+CROPS = ['board', 'window']
+THUMBNAIL_SIZE = 160  # pixels per side of a thumbnail, or None for full size
+
+# Renderer and open game record files of this worker process, reused across tasks
+_worker_renderer = None
+_worker_readers = {}
+
+
+def init_headless():
+    """
+    Starts pygame with the dummy video driver, unless a display is already open, and loads the piece images
+
+    :return: the pygame module
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    # SDL turns SIGTERM into a quit event by default, which would keep a pool from terminating its workers
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+    pygame = ChessGUI.import_pygame()
+    if pygame.display.get_surface() is None:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    ChessGUI.load_images()
+    return pygame
+
+
+class PositionRenderer:
+    """
+    A class used to draw positions onto an offscreen surface and save them as PNG files.
+
+    Positions are drawn by a ChessGUI.BoardRenderer, so a position that follows another one only redraws the squares
+    that differ. Rendering the positions of a game in order costs a few squares per frame.
+
+    Attributes
+    ----------
+    size : int
+        Width and height in pixels of the saved images, or None to save them at the GUI's size
+    crop : string
+        'board' to save the board with its border and coordinates, or 'window' for the whole GUI picture
+
+    Methods
+    -------
+    render(game)
+        Draws a game's current position and returns the surface holding the image
+    save(game, path)
+        Draws a game's current position and writes it to a PNG file
+    """
+
+    def __init__(self, size=THUMBNAIL_SIZE, crop='board'):
+        if crop not in CROPS:
+            raise ValueError('Unknown crop: {}'.format(crop))
+        pygame = init_headless()
+        self._surface = pygame.Surface((ChessGUI.WIDTH, ChessGUI.HEIGHT)).convert()
+        self._board_renderer = ChessGUI.BoardRenderer(self._surface)
+        if crop == 'board':
+            self._area = self._surface.subsurface(pygame.Rect(0, 0, ChessGUI.HEIGHT, ChessGUI.HEIGHT))
+        else:
+            self._area = self._surface
+        self._size = size
+        self._thumbnail = None
+        if size is not None:
+            width, height = self._area.get_size()
+            self._thumbnail = pygame.Surface((size, round(size * height / width))).convert()
+
+    def get_size(self):
+        """Returns the width and height of the saved images"""
+        return (self._thumbnail or self._area).get_size()
+
+    def render(self, game):
+        """
+        Draws a game's current position
+
+        :param game: a ChessVar object
+        :return: the surface holding the image. It is reused by the next call.
+        """
+        self._board_renderer.draw(game)
+        if self._thumbnail is None:
+            return self._area
+        return ChessGUI.pygame.transform.smoothscale(self._area, self._thumbnail.get_size(), self._thumbnail)
+
+    def save(self, game, path):
+        """Draws a game's current position and writes it to a PNG file at path"""
+        ChessGUI.pygame.image.save(self.render(game), path)
+
+
+def game_image_path(output_dir, game_number, ply=None):
+    """
+    Returns the path of the image of a stored game
+
+    :param output_dir: directory the images are written to
+    :param game_number: position of the game in its game record file
+    :param ply: number of moves played before the position of a frame, or None for the final position
+    """
+    if ply is None:
+        return os.path.join(output_dir, 'game-{:06d}.png'.format(game_number))
+    return os.path.join(output_dir, 'game-{:06d}-{:04d}.png'.format(game_number, ply))
+
+
+def position_image_path(output_dir, number):
+    """Returns the path of the image of the position with the given number"""
+    return os.path.join(output_dir, 'position-{:06d}.png'.format(number))
+
+
+def _init_worker(size, crop):
+    """Pool initializer. Starts pygame in the worker and builds its renderer."""
+    global _worker_renderer
+    _worker_renderer = PositionRenderer(size, crop)
+
+
+def render_stored_game(renderer, stored_game, game_number, output_dir, frames=False):
+    """
+    Replays a stored game and saves its final position, or every position as a numbered frame
+
+    :param renderer: the PositionRenderer to draw with
+    :param stored_game: a ChessRecord.StoredGame
+    :param game_number: position of the game in its game record file, used in the file names
+    :param output_dir: directory to write the images to
+    :param frames: if True, saves the starting position and the position after each move
+    :return: the list of paths written
+    """
+    game = ChessVar()
+    paths = []
+    if frames:
+        paths.append(game_image_path(output_dir, game_number, 0))
+        renderer.save(game, paths[-1])
+    for move in stored_game.moves:
+        game.push(move)
+        if frames:
+            paths.append(game_image_path(output_dir, game_number, len(paths)))
+            renderer.save(game, paths[-1])
+    if not frames:
+        paths.append(game_image_path(output_dir, game_number))
+        renderer.save(game, paths[-1])
+    return paths
+
+
+def render_game_chunk(task):
+    """
+    Worker entry point. Renders a chunk of the games in a game record file.
+
+    :param task: a (game record path, first game number, game count, output directory, frames) tuple
+    :return: the list of paths written
+    """
+    record_path, first_game, count, output_dir, frames = task
+    reader = _worker_readers.get(record_path)
+    if reader is None:
+        reader = _worker_readers[record_path] = GameRecordReader(record_path)
+
+    paths = []
+    for game_number in range(first_game, first_game + count):
+        paths.extend(render_stored_game(_worker_renderer, reader[game_number], game_number, output_dir, frames))
+    return paths
+
+
+def render_position_chunk(task):
+    """
+    Worker entry point. Renders a chunk of positions.
+
+    :param task: a (first position number, list of position strings or bytes, output directory) tuple
+    :return: the list of paths written
+    """
+    first_number, positions, output_dir = task
+    game = ChessVar()
+    paths = []
+    for number, position in enumerate(positions, start=first_number):
+        game.set_position(position)
+        paths.append(position_image_path(output_dir, number))
+        _worker_renderer.save(game, paths[-1])
+    return paths
+
+
+def _run(worker, tasks, processes, size, crop):
+    """Runs tasks in this process or across a pool of rendering workers and yields each task's paths"""
+    if processes == 1:
+        _init_worker(size, crop)
+        try:
+            for task in tasks:
+                yield worker(task)
+        finally:
+            # Do not keep files mapped after the call, since they may be rewritten before the next one
+            for reader in _worker_readers.values():
+                reader.close()
+            _worker_readers.clear()
+        return
+
+    # Workers are spawned rather than forked, since forking a process that has started SDL is not safe
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes, initializer=_init_worker, initargs=(size, crop)) as pool:
+        yield from pool.imap_unordered(worker, tasks)
+        pool.close()
+        pool.join()
+
+
+def render_games(record_path, output_dir, games=None, frames=False, size=THUMBNAIL_SIZE, crop='board',
+                 processes=None, chunk_size=16):
+    """
+    Renders the games of a game record file to PNG files across a process pool
+
+    :param record_path: path of a ChessRecord game record file
+    :param output_dir: directory to write the images to, created if needed. Final positions are written to
+                       game-NNNNNN.png and frames to game-NNNNNN-PPPP.png, numbered by game and ply.
+    :param games: the game numbers to render, or None for every game in the file
+    :param frames: if True, saves every position of each game instead of only its final position
+    :param size: width and height of the images in pixels, or None for full size
+    :param crop: one of CROPS
+    :param processes: number of worker processes, defaults to the number of CPUs. 1 renders in this process.
+    :param chunk_size: number of games each worker renders before sending results back
+    :return: an iterator of lists of written paths, one list per chunk, in completion order
+    """
+    if crop not in CROPS:
+        raise ValueError('Unknown crop: {}'.format(crop))
+    os.makedirs(output_dir, exist_ok=True)
+    if games is None:
+        with GameRecordReader(record_path) as reader:
+            games = range(len(reader))
+
+    # Consecutive game numbers are grouped into one task
+    tasks = []
+    for game_number in sorted(games):
+        if tasks and tasks[-1][1] + tasks[-1][2] == game_number and tasks[-1][2] < chunk_size:
+            tasks[-1][2] += 1
+        else:
+            tasks.append([record_path, game_number, 1, output_dir, frames])
+    return _run(render_game_chunk, [tuple(task) for task in tasks], processes, size, crop)
+
+
+def render_positions(positions, output_dir, size=THUMBNAIL_SIZE, crop='board', processes=None, chunk_size=64):
+    """
+    Renders positions to PNG files across a process pool
+
+    :param positions: a sequence of position strings or position bytes, as returned by ChessVar.to_position
+    :param output_dir: directory to write the images to, created if needed. Position n is written to
+                       position-NNNNNN.png.
+    :param size: width and height of the images in pixels, or None for full size
+    :param crop: one of CROPS
+    :param processes: number of worker processes, defaults to the number of CPUs. 1 renders in this process.
+    :param chunk_size: number of positions each worker renders before sending results back
+    :return: an iterator of lists of written paths, one list per chunk, in completion order
+    """
+    if crop not in CROPS:
+        raise ValueError('Unknown crop: {}'.format(crop))
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(first, list(positions[first:first + chunk_size]), output_dir)
+             for first in range(0, len(positions), chunk_size)]
+    return _run(render_position_chunk, tasks, processes, size, crop)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render chess variant positions or stored games to PNG files.')
+    parser.add_argument('--size', type=int, default=THUMBNAIL_SIZE, help='image size in pixels, 0 for full size')
+    parser.add_argument('--crop', choices=CROPS, default='board', help='part of the GUI picture to save')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: CPU count)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    games_parser = subparsers.add_parser('games', help='render the games of a game record file')
+    games_parser.add_argument('record', help='game record file written by ChessSimulator.py --output')
+    games_parser.add_argument('output', help='directory to write the images to')
+    games_parser.add_argument('--frames', action='store_true', help='save every position, not only the last one')
+    games_parser.add_argument('--first', type=int, default=0, help='number of the first game to render')
+    games_parser.add_argument('--count', type=int, default=None, help='number of games to render')
+
+    positions_parser = subparsers.add_parser('positions', help='render positions read from a text file')
+    positions_parser.add_argument('positions', help='file holding one position string per line')
+    positions_parser.add_argument('output', help='directory to write the images to')
+    arguments = parser.parse_args()
+
+    size = arguments.size or None
+    start = time.perf_counter()
+    if arguments.command == 'games':
+        with GameRecordReader(arguments.record) as reader:
+            last = len(reader) if arguments.count is None else min(len(reader), arguments.first + arguments.count)
+        chunks = render_games(arguments.record, arguments.output, range(arguments.first, last), arguments.frames,
+                              size, arguments.crop, arguments.processes)
+    else:
+        with open(arguments.positions) as file:
+            positions = [line.strip() for line in file if line.strip()]
+        chunks = render_positions(positions, arguments.output, size, arguments.crop, arguments.processes)
+
+    images = sum(len(paths) for paths in chunks)
+    elapsed = time.perf_counter() - start
+    print('images {} time {:.2f}s images/s {:.1f}'.format(images, elapsed, images / elapsed if elapsed else 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains an asyncio TCP server that hosts many games of the chess variant defined in
+#              ChessVar in one process, and a load generator that plays games against it and reports move latency.
+#              Clients speak a line protocol: one command per line, answered by one line starting with OK or ERR.
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from ChessVar import ChessVar, MoveResult, MOVE_RESULT_MESSAGES, move_to_algebraic
+
+# Protocol (commands are case-insensitive, squares are algebraic such as e2):
+#
+#   CREATE [SOLO]              -> OK <game id> WHITE       (SOLO: this connection plays both sides, answers BOTH)
+#   JOIN <game id>             -> OK <game id> BLACK
+#   MOVE <game id> <src> <dst> -> OK <game state>
+#   FORFEIT <game id>          -> OK <game state>
+#   STATE <game id>            -> OK <position string>     (see ChessVar.to_position)
+#   QUIT                       -> OK BYE
+#
+# Errors are answered with ERR <code> <message>, where code is a MoveResult name or one of the protocol errors below.
+# The opponent of a player who moves or forfeits is sent an event line that does not answer any command:
+#
+#   JOINED <game id>
+#   MOVED <game id> <src> <dst> <game state>
+#   FORFEITED <game id> <game state>
+#   LEFT <game id>
+#   EVICTED <game id>
+#
+# A player who disconnects forfeits their unfinished games, so the opponent is sent FORFEITED. If the game was already
+# over the opponent is sent LEFT. Games with no players left are removed.
+UNKNOWN_COMMAND = 'UNKNOWN_COMMAND'
+BAD_ARGUMENTS = 'BAD_ARGUMENTS'
+NO_SUCH_GAME = 'NO_SUCH_GAME'
+GAME_FULL = 'GAME_FULL'
+NOT_A_PLAYER = 'NOT_A_PLAYER'
+NOT_YOUR_TURN = 'NOT_YOUR_TURN'
+
+MAX_LINE = 1024
+
+# Bytes of unsent output a connection may queue. A client that stops reading is disconnected once it passes this, so
+# the server never buffers events for it without limit.
+MAX_WRITE_BUFFER = 256 * 1024
+
+
+class GameSession:
+    """
+    A class used to represent one hosted game.
+
+    Attributes
+    ----------
+    game_id : string
+        The id clients use to refer to the game
+    game : ChessVar
+        The game itself
+    players : dictionary
+        The Connection playing 'WHITE' and 'BLACK', or None for a seat nobody has taken
+    last_active : float
+        time.monotonic() of the last command that touched the game
+    """
+
+    def __init__(self, game_id, creator, solo):
+        self.game_id = game_id
+        self.game = ChessVar()
+        self.players = {'WHITE': creator, 'BLACK': creator if solo else None}
+        self.last_active = time.monotonic()
+
+    def colors_of(self, connection):
+        """Returns the colors the connection plays in this game"""
+        return [color for color, player in self.players.items() if player is connection]
+
+    def opponents_of(self, connection):
+        """Returns the other connections seated in this game"""
+        return {player for player in self.players.values() if player is not None and player is not connection}
+
+
+class Connection:
+    """A class used to represent one connected client: its stream writer and the games it sits in"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.games = set()
+
+    def send(self, line):
+        """Queues one line to the client, and drops the client if too much output is already waiting for it"""
+        if self.writer.is_closing():
+            return
+        self.writer.write(line.encode() + b'\n')
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.writer.transport.abort()
+
+
+class GameServer:
+    """
+    A class used to host many ChessVar games for clients connected over TCP.
+
+    Commands are handled without awaiting anything between reading a game and sending its events, so commands on one
+    game are applied in order without locks. Games that see no command for idle_timeout seconds are evicted by a
+    background sweep.
+
+    Methods
+    -------
+    start(host='127.0.0.1', port=8765)
+        Starts listening and the eviction sweep. Returns the port actually bound.
+    close()
+        Stops listening, stops the sweep and disconnects every client
+    handle_command(connection, line)
+        Runs one protocol command and returns its answer line
+    evict_idle(now=None)
+        Removes the games that have been idle for longer than idle_timeout and returns how many were removed
+    get_game_count()
+        Returns the number of hosted games
+    """
+
+    def __init__(self, idle_timeout=300.0, sweep_interval=10.0):
+        self._idle_timeout = idle_timeout
+        self._sweep_interval = sweep_interval
+        self._sessions = {}
+        self._connections = set()
+        self._ids = itertools.count(1)
+        self._server = None
+        self._sweeper = None
+
+    def get_game_count(self):
+        """Returns the number of hosted games"""
+        return len(self._sessions)
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Starts listening for clients and sweeping idle games. Returns the port actually bound."""
+        self._server = await asyncio.start_server(self._serve_client, host, port, limit=MAX_LINE)
+        self._sweeper = asyncio.create_task(self._sweep())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Serves clients until cancelled"""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stops listening, stops the sweep and disconnects every client"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+        for connection in list(self._connections):
+            connection.writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def _serve_client(self, reader, writer):
+        """Reads commands from one client until it disconnects or quits"""
+        connection = Connection(writer)
+        self._connections.add(connection)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                answer = await self.handle_command(connection, line.decode(errors='replace'))
+                connection.send(answer)
+                await writer.drain()
+                if answer == 'OK BYE':
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+            self._leave_games(connection)
+
+    async def handle_command(self, connection, line):
+        """
+        Runs one protocol command
+
+        :param connection: the Connection the command came from
+        :param line: the command line
+        :return: the answer line, without its newline
+        """
+        words = line.split()
+        if not words:
+            return 'ERR {} empty command'.format(UNKNOWN_COMMAND)
+        command = words[0].upper()
+        arguments = words[1:]
+
+        if command == 'CREATE':
+            if arguments and [word.upper() for word in arguments] != ['SOLO']:
+                return 'ERR {} usage: CREATE [SOLO]'.format(BAD_ARGUMENTS)
+            return self._create(connection, bool(arguments))
+        if command == 'QUIT':
+            return 'OK BYE'
+        if command not in ('JOIN', 'MOVE', 'FORFEIT', 'STATE'):
+            return 'ERR {} {}'.format(UNKNOWN_COMMAND, command)
+
+        expected = 3 if command == 'MOVE' else 1
+        if len(arguments) != expected:
+            return 'ERR {} {} takes {} arguments'.format(BAD_ARGUMENTS, command, expected)
+        session = self._sessions.get(arguments[0])
+        if session is None:
+            return 'ERR {} {}'.format(NO_SUCH_GAME, arguments[0])
+        session.last_active = time.monotonic()
+
+        if command == 'JOIN':
+            return self._join(connection, session)
+        if command == 'STATE':
+            return 'OK ' + session.game.to_position()
+        if command == 'MOVE':
+            return self._move(connection, session, arguments[1], arguments[2])
+        return self._forfeit(connection, session)
+
+    def _create(self, connection, solo):
+        """Hosts a new game with the connection playing White, or both sides if solo"""
+        game_id = str(next(self._ids))
+        self._sessions[game_id] = GameSession(game_id, connection, solo)
+        connection.games.add(game_id)
+        return 'OK {} {}'.format(game_id, 'BOTH' if solo else 'WHITE')
+
+    def _join(self, connection, session):
+        """Seats the connection as Black"""
+        if session.players['BLACK'] is not None:
+            return 'ERR {} {}'.format(GAME_FULL, session.game_id)
+        session.players['BLACK'] = connection
+        connection.games.add(session.game_id)
+        for opponent in session.opponents_of(connection):
+            opponent.send('JOINED {}'.format(session.game_id))
+        return 'OK {} BLACK'.format(session.game_id)
+
+    def _move(self, connection, session, source, destination):
+        """Makes a move for the connection if it plays the side that has the turn"""
+        colors = session.colors_of(connection)
+        if not colors:
+            return 'ERR {} {}'.format(NOT_A_PLAYER, session.game_id)
+        game = session.game
+        if game.get_game_state() == 'UNFINISHED' and game.get_player_turn() not in colors:
+            return 'ERR {} {}'.format(NOT_YOUR_TURN, session.game_id)
+
+        result = game.try_move(source.lower(), destination.lower())
+        if result != MoveResult.OK:
+            return 'ERR {} {}'.format(result.name, MOVE_RESULT_MESSAGES[result])
+
+        state = game.get_game_state()
+        for opponent in session.opponents_of(connection):
+            opponent.send('MOVED {} {} {} {}'.format(session.game_id, source.lower(), destination.lower(), state))
+        return 'OK ' + state
+
+    def _forfeit(self, connection, session):
+        """Ends the game with the connection's side losing. In a solo game the side that has the turn loses."""
+        colors = session.colors_of(connection)
+        if not colors:
+            return 'ERR {} {}'.format(NOT_A_PLAYER, session.game_id)
+        game = session.game
+        game.forfeit(display=False, player=colors[0] if len(colors) == 1 else None)
+
+        state = game.get_game_state()
+        for opponent in session.opponents_of(connection):
+            opponent.send('FORFEITED {} {}'.format(session.game_id, state))
+        return 'OK ' + state
+
+    def _leave_games(self, connection):
+        """Frees the seats of a disconnected client, forfeiting its unfinished games and telling its opponents"""
+        for game_id in list(connection.games):
+            session = self._sessions.get(game_id)
+            if session is None:
+                continue
+            colors = session.colors_of(connection)
+            opponents = session.opponents_of(connection)
+            game = session.game
+            if opponents and game.get_game_state() == 'UNFINISHED':
+                game.forfeit(display=False, player=colors[0])
+                event = 'FORFEITED {} {}'.format(game_id, game.get_game_state())
+            else:
+                event = 'LEFT ' + game_id
+            for color in colors:
+                session.players[color] = None
+            for opponent in opponents:
+                opponent.send(event)
+            if not opponents:
+                del self._sessions[game_id]
+        connection.games.clear()
+
+    def evict_idle(self, now=None):
+        """
+        Removes the games that have not seen a command for longer than idle_timeout and tells their players
+
+        :param now: the time.monotonic() value to measure idleness against, defaults to the current time
+        :return: the number of games removed
+        """
+        if now is None:
+            now = time.monotonic()
+        idle = [session for session in self._sessions.values()
+                if now - session.last_active > self._idle_timeout]
+        for session in idle:
+            del self._sessions[session.game_id]
+            for player in set(session.players.values()):
+                if player is not None:
+                    player.games.discard(session.game_id)
+                    player.send('EVICTED {}'.format(session.game_id))
+        return len(idle)
+
+    async def _sweep(self):
+        """Evicts idle games every sweep_interval seconds"""
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            self.evict_idle()
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at the given fraction (0-1) of a sorted list, using the nearest rank"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def _request(reader, writer, line):
+    """Sends one command and returns its answer, skipping event lines"""
+    writer.write(line.encode() + b'\n')
+    await writer.drain()
+    while True:
+        answer = (await reader.readline()).decode().rstrip('\n')
+        if not answer or answer.startswith('OK') or answer.startswith('ERR'):
+            return answer
+
+
+async def _load_client(host, port, moves, rng, latencies):
+    """Plays solo games of random moves until it has made the given number of moves, recording each move's latency"""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    try:
+        game_id = None
+        legal_moves = []
+        for _ in range(moves):
+            if not legal_moves:
+                game = ChessVar()
+                game_id = (await _request(reader, writer, 'CREATE SOLO')).split()[1]
+                legal_moves = game.legal_moves()
+
+            move = rng.choice(legal_moves)
+            source, destination = move_to_algebraic(move)
+            start = time.perf_counter()
+            answer = await _request(reader, writer, 'MOVE {} {} {}'.format(game_id, source, destination))
+            latencies.append(time.perf_counter() - start)
+            if not answer.startswith('OK'):
+                raise RuntimeError('server rejected {}{}: {}'.format(source, destination, answer))
+            game.push(move)
+            legal_moves = game.legal_moves() if game.get_game_state() == 'UNFINISHED' else []
+        await _request(reader, writer, 'QUIT')
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, clients, moves, seed=0):
+    """
+    Connects many clients at once, each playing random solo games, and measures how long every move takes to answer
+
+    :param host: server host
+    :param port: server port
+    :param clients: number of concurrent connections
+    :param moves: number of moves each client makes
+    :param seed: base random seed, client n uses seed + n
+    :return: a dictionary with the move count, elapsed seconds, moves per second, and p50/p99/max latency in seconds
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_load_client(host, port, moves, random.Random(seed + number), latencies)
+                           for number in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {'moves': len(latencies), 'elapsed': elapsed, 'moves_per_second': len(latencies) / elapsed,
+            'p50': percentile(latencies, 0.50), 'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else 0.0}
+
+
+async def _serve(arguments):
+    server = GameServer(arguments.idle_timeout)
+    port = await server.start(arguments.host, arguments.port)
+    print('serving on {}:{}'.format(arguments.host, port))
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+async def _load(arguments):
+    server = None
+    port = arguments.port
+    if arguments.local:
+        server = GameServer()
+        port = await server.start(arguments.host, 0)
+    try:
+        report = await run_load(arguments.host, port, arguments.clients, arguments.moves, arguments.seed)
+    finally:
+        if server is not None:
+            await server.close()
+    print('clients {} moves {} time {:.2f}s moves/s {:.0f}'.format(
+        arguments.clients, report['moves'], report['elapsed'], report['moves_per_second']))
+    print('latency p50 {:.3f}ms p99 {:.3f}ms max {:.3f}ms'.format(
+        report['p50'] * 1000, report['p99'] * 1000, report['max'] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Host many games over TCP, or generate load against a server.')
+    subparsers = parser.add_subparsers(dest='mode', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='run the game server')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--idle-timeout', type=float, default=300.0, help='seconds before an idle game is evicted')
+
+    load_parser = subparsers.add_parser('load', help='play many concurrent games and report move latency')
+    load_parser.add_argument('--host', default='127.0.0.1')
+    load_parser.add_argument('--port', type=int, default=8765)
+    load_parser.add_argument('--local', action='store_true', help='start a server in this process to test against')
+    load_parser.add_argument('--clients', type=int, default=100, help='concurrent connections')
+    load_parser.add_argument('--moves', type=int, default=100, help='moves per connection')
+    load_parser.add_argument('--seed', type=int, default=0)
+
+    arguments = parser.parse_args()
+    try:
+        asyncio.run(_serve(arguments) if arguments.mode == 'serve' else _load(arguments))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: Unit Tests for the game server in ChessServer.py
+
+import asyncio
+import time
+import unittest
+from ChessServer import GameServer, Connection, run_load, MAX_LINE, MAX_WRITE_BUFFER
+
+
+class StalledWriter:
+    """A stream writer stand-in whose client never reads, so everything written stays buffered"""
+
+    def __init__(self):
+        self.transport = self
+        self.buffered = 0
+        self.aborted = False
+
+    def is_closing(self):
+        return self.aborted
+
+    def write(self, data):
+        self.buffered += len(data)
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def abort(self):
+        self.aborted = True
+
+
+class GameServerTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = GameServer(idle_timeout=60.0)
+        self.port = await self.server.start('127.0.0.1', 0)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port, limit=MAX_LINE)
+        self.addAsyncCleanup(self.disconnect, writer)
+        return reader, writer
+
+    @staticmethod
+    async def disconnect(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    async def send(client, line):
+        reader, writer = client
+        writer.write(line.encode() + b'\n')
+        await writer.drain()
+        return (await reader.readline()).decode().rstrip('\n')
+
+    @staticmethod
+    async def receive(client):
+        return (await client[0].readline()).decode().rstrip('\n')
+
+    async def test_two_player_game(self):
+        white = await self.connect()
+        black = await self.connect()
+
+        game_id, color = (await self.send(white, 'CREATE')).split()[1:]
+        self.assertEqual(color, 'WHITE')
+        self.assertEqual(await self.send(black, 'JOIN ' + game_id), 'OK {} BLACK'.format(game_id))
+        self.assertEqual(await self.receive(white), 'JOINED ' + game_id)
+        self.assertTrue((await self.send(await self.connect(), 'JOIN ' + game_id)).startswith('ERR GAME_FULL'))
+
+        # Players may only move their own side on their own turn
+        self.assertTrue((await self.send(black, 'MOVE {} e7 e5'.format(game_id))).startswith('ERR NOT_YOUR_TURN'))
+        self.assertTrue((await self.send(white, 'MOVE {} e2 e5'.format(game_id))).startswith('ERR ILLEGAL_GEOMETRY'))
+        self.assertEqual(await self.send(white, 'MOVE {} e2 e4'.format(game_id)), 'OK UNFINISHED')
+        self.assertEqual(await self.receive(black), 'MOVED {} e2 e4 UNFINISHED'.format(game_id))
+
+        self.assertEqual(await self.send(black, 'STATE ' + game_id),
+                         'OK rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b -')
+
+        # White forfeits on Black's turn
+        self.assertEqual(await self.send(white, 'FORFEIT ' + game_id), 'OK BLACK_WON')
+        self.assertEqual(await self.receive(black), 'FORFEITED {} BLACK_WON'.format(game_id))
+        self.assertTrue((await self.send(black, 'MOVE {} d7 d5'.format(game_id))).startswith('ERR GAME_OVER'))
+
+    async def test_bad_commands(self):
+        client = await self.connect()
+        self.assertTrue((await self.send(client, 'HELLO')).startswith('ERR UNKNOWN_COMMAND'))
+        self.assertTrue((await self.send(client, 'MOVE 1 e2')).startswith('ERR BAD_ARGUMENTS'))
+        self.assertTrue((await self.send(client, 'STATE 99')).startswith('ERR NO_SUCH_GAME'))
+        game_id = (await self.send(client, 'create solo')).split()[1]
+        self.assertTrue((await self.send(client, 'MOVE {} z9 e4'.format(game_id))).startswith('ERR INVALID_SQUARE'))
+        self.assertTrue((await self.send(await self.connect(), 'FORFEIT ' + game_id)).startswith('ERR NOT_A_PLAYER'))
+        self.assertEqual(await self.send(client, 'QUIT'), 'OK BYE')
+
+    async def test_idle_eviction(self):
+        client = await self.connect()
+        first = (await self.send(client, 'CREATE SOLO')).split()[1]
+        second = (await self.send(client, 'CREATE SOLO')).split()[1]
+        self.assertEqual(self.server.get_game_count(), 2)
+
+        # Only games idle for longer than the timeout are evicted, and their players are told
+        self.assertEqual(self.server.evict_idle(), 0)
+        self.assertEqual(self.server.evict_idle(time.monotonic() + 61.0), 2)
+        self.assertEqual({await self.receive(client), await self.receive(client)},
+                         {'EVICTED ' + first, 'EVICTED ' + second})
+        self.assertTrue((await self.send(client, 'STATE ' + first)).startswith('ERR NO_SUCH_GAME'))
+
+    async def test_disconnect(self):
+        white = await self.connect()
+        black = await self.connect()
+        playing = (await self.send(white, 'CREATE')).split()[1]
+        await self.send(black, 'JOIN ' + playing)
+        await self.receive(white)
+        finished = (await self.send(white, 'CREATE')).split()[1]
+        await self.send(black, 'JOIN ' + finished)
+        await self.receive(white)
+        await self.send(white, 'FORFEIT ' + finished)
+        await self.receive(black)
+        waiting = (await self.send(white, 'CREATE')).split()[1]
+        solo = (await self.send(white, 'CREATE SOLO')).split()[1]
+        self.assertEqual(self.server.get_game_count(), 4)
+
+        # White's unfinished game is forfeited, Black is told about both games, and games nobody is left in are removed
+        await self.disconnect(white[1])
+        self.assertEqual({await self.receive(black), await self.receive(black)},
+                         {'FORFEITED {} BLACK_WON'.format(playing), 'LEFT ' + finished})
+        self.assertEqual(self.server.get_game_count(), 2)
+        for game_id in (waiting, solo):
+            self.assertTrue((await self.send(black, 'STATE ' + game_id)).startswith('ERR NO_SUCH_GAME'))
+
+        # Once Black leaves too, nothing is left
+        self.assertEqual(await self.send(black, 'QUIT'), 'OK BYE')
+        for _ in range(100):
+            if self.server.get_game_count() == 0:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.server.get_game_count(), 0)
+
+    def test_stalled_client(self):
+        # A client that stops reading is dropped once its unsent output passes the limit, and nothing more is queued
+        writer = StalledWriter()
+        connection = Connection(writer)
+        line = 'MOVED 1 e2 e4 UNFINISHED'
+        while not writer.aborted:
+            connection.send(line)
+        self.assertGreater(writer.buffered, MAX_WRITE_BUFFER)
+        self.assertLessEqual(writer.buffered, MAX_WRITE_BUFFER + len(line) + 1)
+        buffered = writer.buffered
+        connection.send(line)
+        self.assertEqual(writer.buffered, buffered)
+
+    async def test_load(self):
+        report = await run_load('127.0.0.1', self.port, clients=8, moves=30)
+        self.assertEqual(report['moves'], 240)
+        self.assertLessEqual(report['p50'], report['p99'])
+
+
+if __name__ == '__main__':
+    unittest.main()
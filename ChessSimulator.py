@@ -0,0 +1,244 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a headless self-play simulator for the chess game defined in ChessVar. Games are
+#              played between configurable policies (random, greedy-capture or the search engine) and spread across a
+#              process pool. Each worker runs its own game loop with its own ChessVar objects, so nothing mutable is
+#              shared between processes, and finished games stream back to the caller one chunk at a time.
+
+import argparse
+import multiprocessing
+import random
+import time
+from array import array
+from ChessVar import ChessVar, PIECE_NAMES
+from ChessEngine import SearchEngine, PIECE_VALUES
+from ChessRecord import GameRecordWriter
+
+POLICY_NAMES = ['random', 'greedy', 'search']
+
+
+class RandomPolicy:
+    """A policy that plays a uniformly random legal move"""
+
+    def choose_move(self, game, moves, rng):
+        """Returns a random move from the legal moves of the player who has the turn"""
+        return rng.choice(moves)
+
+
+class GreedyCapturePolicy:
+    """
+    A policy that captures whenever it can. It prefers a capture that wins the game by wiping out a piece type, then
+    the most valuable victim, and plays a random move when there is nothing to capture.
+    """
+
+    def choose_move(self, game, moves, rng):
+        """Returns the greediest move from the legal moves of the player who has the turn"""
+        mailbox = game.get_mailbox()
+        captures = [move for move in moves if mailbox[move & 63] is not None]
+        if not captures:
+            return rng.choice(moves)
+
+        inventory = game.get_piece_inventory()
+        best_priority = None
+        best_moves = []
+        for move in captures:
+            victim = mailbox[move & 63]
+            priority = 10000 if inventory[PIECE_NAMES[victim]] == 1 else PIECE_VALUES[victim % 6]
+            if best_priority is None or priority > best_priority:
+                best_priority = priority
+                best_moves = [move]
+            elif priority == best_priority:
+                best_moves.append(move)
+        return rng.choice(best_moves)
+
+
+class SearchPolicy:
+    """A policy that plays the best move found by a SearchEngine with a fixed depth and node budget"""
+
+    def __init__(self, depth, node_limit):
+        self._engine = SearchEngine(max_depth=depth, node_limit=node_limit, table_size_mb=4)
+
+    def choose_move(self, game, moves, rng):
+        """Returns the engine's best move for the player who has the turn. The engine generates its own moves."""
+        return self._engine.search(game).best_move
+
+
+class GameResult:
+    """
+    A class used to represent one finished self-play game.
+
+    Attributes
+    ----------
+    game_number : int
+        The position of the game in the batch, which also fixes its random seed
+    result : string
+        'WHITE_WON', 'BLACK_WON', or 'DRAW' if the ply limit was reached or the player to move had no legal move
+    extinct_type : string
+        Name of the piece type that was wiped out, such as 'BQ', or None for a draw
+    moves : array
+        Every move played, encoded as (source << 6) | destination
+    """
+
+    def __init__(self, game_number, result, extinct_type, moves):
+        self.game_number = game_number
+        self.result = result
+        self.extinct_type = extinct_type
+        self.moves = moves
+
+    def __repr__(self):
+        return 'GameResult({}, {}, {}, {} plies)'.format(self.game_number, self.result, self.extinct_type,
+                                                        len(self.moves))
+
+
+# Policies built by this worker process, reused across the games it plays
+_worker_policies = {}
+
+
+def make_policy(name, search_depth=2, search_nodes=20000):
+    """Returns a policy object for one of the names in POLICY_NAMES"""
+    if name == 'random':
+        return RandomPolicy()
+    if name == 'greedy':
+        return GreedyCapturePolicy()
+    if name == 'search':
+        return SearchPolicy(search_depth, search_nodes)
+    raise ValueError('Unknown policy: {}'.format(name))
+
+
+def play_game(game_number, white_policy, black_policy, seed, max_plies):
+    """
+    Plays one game between two policies
+
+    :param game_number: the position of the game in the batch
+    :param white_policy: the policy object playing White
+    :param black_policy: the policy object playing Black
+    :param seed: random seed for this game, so every game can be replayed on its own
+    :param max_plies: the number of moves after which the game is scored as a draw
+    :return: a GameResult
+    """
+    rng = random.Random(seed)
+    game = ChessVar()
+    moves = array('H')
+    policies = {'WHITE': white_policy, 'BLACK': black_policy}
+
+    while len(moves) < max_plies and game.get_game_state() == 'UNFINISHED':
+        # The moves are generated once per ply, for the end-of-game check and for the policy
+        legal_moves = game.legal_moves()
+        if not legal_moves:
+            break
+        move = policies[game.get_player_turn()].choose_move(game, legal_moves, rng)
+        game.push(move)
+        moves.append(move)
+
+    if game.get_game_state() == 'UNFINISHED':
+        return GameResult(game_number, 'DRAW', None, moves)
+
+    extinct_type = None
+    for name, count in game.get_piece_inventory().items():
+        if count == 0:
+            extinct_type = name
+    return GameResult(game_number, game.get_game_state(), extinct_type, moves)
+
+
+def play_games(task):
+    """
+    Worker entry point. Plays a chunk of games and returns their results as one list.
+
+    :param task: a (first game number, game count, white policy name, black policy name, seed, max plies,
+                 search depth) tuple
+    :return: a list of GameResult objects
+    """
+    first_game, count, white_name, black_name, seed, max_plies, search_depth = task
+    for name in (white_name, black_name):
+        if (name, search_depth) not in _worker_policies:
+            _worker_policies[(name, search_depth)] = make_policy(name, search_depth)
+    white_policy = _worker_policies[(white_name, search_depth)]
+    black_policy = _worker_policies[(black_name, search_depth)]
+
+    return [play_game(game_number, white_policy, black_policy, seed + game_number, max_plies)
+            for game_number in range(first_game, first_game + count)]
+
+
+def simulate(games, white='random', black='random', processes=None, chunk_size=64, seed=0, max_plies=400,
+             search_depth=2):
+    """
+    Plays a batch of games across a process pool and yields each result as its chunk finishes
+
+    :param games: the number of games to play
+    :param white: policy name for White, one of POLICY_NAMES
+    :param black: policy name for Black, one of POLICY_NAMES
+    :param processes: number of worker processes, defaults to the number of CPUs. 1 plays in this process.
+    :param chunk_size: number of games each worker plays before sending results back
+    :param seed: base random seed. Game n uses seed + n, so results do not depend on scheduling.
+    :param max_plies: the number of moves after which a game is scored as a draw
+    :param search_depth: depth used by the 'search' policy
+    :return: an iterator of GameResult objects, in completion order
+    """
+    # Arguments are checked here, when simulate is called, rather than when the first result is requested
+    for name in (white, black):
+        if name not in POLICY_NAMES:
+            raise ValueError('Unknown policy: {}'.format(name))
+    if games < 0 or chunk_size < 1 or max_plies < 0 or search_depth < 1:
+        raise ValueError('games and max_plies must not be negative, chunk_size and search_depth must be positive')
+    if processes is not None and processes < 1:
+        raise ValueError('processes must be positive: {}'.format(processes))
+
+    tasks = [(first_game, min(chunk_size, games - first_game), white, black, seed, max_plies, search_depth)
+             for first_game in range(0, games, chunk_size)]
+    return _run_tasks(tasks, processes)
+
+
+def _run_tasks(tasks, processes):
+    """Plays game chunks in this process or across a pool and yields each GameResult as its chunk finishes"""
+    if processes == 1:
+        for task in tasks:
+            yield from play_games(task)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for results in pool.imap_unordered(play_games, tasks):
+            yield from results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play self-play games of the chess variant across processes.')
+    parser.add_argument('--games', type=int, default=1000, help='number of games to play')
+    parser.add_argument('--white', choices=POLICY_NAMES, default='random', help='policy playing White')
+    parser.add_argument('--black', choices=POLICY_NAMES, default='random', help='policy playing Black')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='games per worker task')
+    parser.add_argument('--max-plies', type=int, default=400, help='plies before a game is scored as a draw')
+    parser.add_argument('--depth', type=int, default=2, help='depth of the search policy')
+    parser.add_argument('--seed', type=int, default=0, help='base random seed')
+    parser.add_argument('--output', default=None, help='game record file to store every game in')
+    arguments = parser.parse_args()
+
+    writer = None if arguments.output is None else GameRecordWriter(arguments.output)
+
+    start = time.perf_counter()
+    outcomes = {'WHITE_WON': 0, 'BLACK_WON': 0, 'DRAW': 0}
+    extinctions = {}
+    plies = 0
+    for result in simulate(arguments.games, arguments.white, arguments.black, arguments.processes,
+                           arguments.chunk_size, arguments.seed, arguments.max_plies, arguments.depth):
+        outcomes[result.result] += 1
+        plies += len(result.moves)
+        if result.extinct_type:
+            extinctions[result.extinct_type] = extinctions.get(result.extinct_type, 0) + 1
+        if writer is not None:
+            writer.write_result(result)
+    if writer is not None:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    print('games {} plies {} time {:.2f}s games/s {:.1f} plies/s {:.0f}'.format(
+        arguments.games, plies, elapsed, arguments.games / elapsed, plies / elapsed))
+    for outcome, count in outcomes.items():
+        print('{:<10} {:>7} {:6.1%}'.format(outcome, count, count / arguments.games))
+    for name, count in sorted(extinctions.items(), key=lambda item: -item[1]):
+        print('extinct {} {:>7} {:6.1%}'.format(name, count, count / arguments.games))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: Unit Tests for the self-play and game data modules built on ChessVar.py
+
+import os
+import random
+import struct
+import tempfile
+import unittest
+from ChessVar import ChessVar, SQUARE_INDEX
+from ChessSimulator import simulate, GreedyCapturePolicy
+from ChessRecord import GameRecordWriter, GameRecordReader
+
+
+class SimulatorTestCase(unittest.TestCase):
+
+    def test_results_replay(self):
+        results = list(simulate(12, 'random', 'greedy', processes=1, chunk_size=5, seed=11))
+        self.assertEqual(sorted(result.game_number for result in results), list(range(12)))
+
+        # Replaying the recorded moves reaches the recorded result
+        for result in results:
+            game = ChessVar()
+            for move in result.moves:
+                self.assertIn(move, game.legal_moves())
+                game.push(move)
+            self.assertEqual(game.get_game_state(), result.result)
+            self.assertEqual(game.get_piece_inventory()[result.extinct_type], 0)
+
+    def test_processes_match(self):
+        # Each game's seed depends only on its number, so the pool plays exactly the same games
+        single = {result.game_number: list(result.moves) for result in simulate(6, processes=1, chunk_size=2)}
+        pooled = {result.game_number: list(result.moves) for result in simulate(6, processes=2, chunk_size=2)}
+        self.assertEqual(single, pooled)
+
+    def test_ply_limit(self):
+        results = list(simulate(3, 'search', 'random', processes=1, max_plies=4, search_depth=1))
+        for result in results:
+            self.assertLessEqual(len(result.moves), 4)
+            if result.result == 'DRAW':
+                self.assertIsNone(result.extinct_type)
+
+        # Bad arguments are rejected by the call itself, before any game is played
+        for arguments in [{'white': 'perfect'}, {'chunk_size': 0}, {'processes': 0}, {'games': -1}]:
+            with self.assertRaises(ValueError):
+                simulate(**dict({'games': 1}, **arguments))
+
+    def test_greedy_policy(self):
+        game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('d1', 'g4')]:
+            game.make_move(source, destination)
+
+        # The policy picks from the moves it is given, and prefers the capture of White's only queen
+        policy = GreedyCapturePolicy()
+        capture = (SQUARE_INDEX['c8'] << 6) | SQUARE_INDEX['g4']
+        self.assertEqual(policy.choose_move(game, game.legal_moves(), random.Random(0)), capture)
+        quiet_moves = [move for move in game.legal_moves() if game.get_mailbox()[move & 63] is None]
+        self.assertIn(policy.choose_move(game, quiet_moves, random.Random(0)), quiet_moves)
+
+
+class GameRecordTestCase(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.cvgr')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        results = list(simulate(10, 'greedy', 'random', processes=1, seed=5))
+        with GameRecordWriter(self.path) as writer:
+            for result in results:
+                writer.write_result(result)
+            writer.write_game('DRAW', [])
+        self.assertEqual(os.path.getsize(self.path), 32 + 11 * (8 + 8) + 2 * sum(len(r.moves) for r in results))
+
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(len(reader), 11)
+            for result, stored in zip(results, reader):
+                self.assertEqual(stored.result, result.result)
+                self.assertEqual(stored.extinct_type, result.extinct_type)
+                self.assertEqual(list(stored.moves), list(result.moves))
+
+            last = reader[-1]
+            self.assertEqual((last.result, last.extinct_type, len(last)), ('DRAW', None, 0))
+            with self.assertRaises(IndexError):
+                reader[11]
+
+        # Games hold their own moves, so they outlive the reader and do not keep it from closing
+        with GameRecordReader(self.path) as reader:
+            games = list(reader)
+            self.assertEqual([reader.get_move_count(number) for number in range(len(reader))],
+                             [len(game) for game in games])
+        self.assertEqual([list(game.moves) for game in games[:-1]], [list(result.moves) for result in results])
+
+    def test_bad_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(bytes(64))
+        with self.assertRaises(ValueError):
+            GameRecordReader(self.path)
+
+    def test_truncated_file(self):
+        with GameRecordWriter(self.path) as writer:
+            writer.write_game('WHITE_WON', [(12 << 6) | 28, (52 << 6) | 36], 'BQ')
+        with open(self.path, 'rb') as file:
+            data = file.read()
+
+        # Too short for a header, or cut off before the end of the index
+        for length in (0, 2, len(data) - 1):
+            with open(self.path, 'wb') as file:
+                file.write(data[:length])
+            with self.assertRaises(ValueError):
+                GameRecordReader(self.path)
+
+    def test_corrupt_file(self):
+        with GameRecordWriter(self.path) as writer:
+            writer.write_game('DRAW', [(12 << 6) | 28])
+            writer.write_game('DRAW', [(52 << 6) | 36])
+        with open(self.path, 'rb') as file:
+            data = bytearray(file.read())
+        index_offset = struct.unpack_from('<Q', data, 16)[0]
+
+        # A game count that runs past the end of the file
+        corrupt = bytearray(data)
+        struct.pack_into('<Q', corrupt, 8, 1000)
+        with open(self.path, 'wb') as file:
+            file.write(corrupt)
+        with self.assertRaises(ValueError):
+            GameRecordReader(self.path)
+
+        # A game offset outside the file, and a move count that runs into the index
+        corrupt = bytearray(data)
+        struct.pack_into('<Q', corrupt, index_offset, len(data) + 100)
+        struct.pack_into('<I', corrupt, struct.unpack_from('<Q', data, index_offset + 8)[0] + 4, 1000)
+        with open(self.path, 'wb') as file:
+            file.write(corrupt)
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(len(reader), 2)
+            for number in range(2):
+                with self.assertRaises(ValueError):
+                    reader[number]
+
+if __name__ == '__main__':
+    unittest.main()
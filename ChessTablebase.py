@@ -0,0 +1,519 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module generates and probes endgame tablebases for the chess game defined in ChessVar. A game
+#              ends as soon as a piece type is wiped out, so every position with a few pieces on the board can be
+#              solved exactly. Tables are built by retrograde analysis, stored with one byte per position, and read
+#              through a memory map, so a probe is a single index computation and byte lookup.
+
+import argparse
+import itertools
+import mmap
+import os
+import struct
+import time
+from ChessVar import ChessVar, PIECE_NAMES, PIECE_INDEX, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, \
+    BISHOP_DIRECTIONS, ROOK_DIRECTIONS, QUEEN_DIRECTIONS, sliding_attacks
+
+MAX_PIECES = 3
+MAGIC = b'CVTB'
+VERSION = 1
+EXTENSION = '.cvtb'
+
+# File header: magic, version, piece count, the bitboard index of each piece padded with NO_PIECE
+HEADER = struct.Struct('<4sHB3s6x')
+NO_PIECE = 255
+
+# Each position is one byte, from the point of view of the player who has the turn:
+#   0          a draw (neither player can force a win, or the player to move has no legal move), or no position
+#   1-127      a WIN: the player to move wipes out a piece type on ply d at the latest
+#   128 + d    a LOSS: the opponent wipes out a piece type on ply d at the latest
+DRAW = 0
+LOSS = 128
+MAX_DISTANCE = 127
+
+# Piece kinds within a color, in PIECE_NAMES order
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+SLIDER_DIRECTIONS = {BISHOP: BISHOP_DIRECTIONS, ROOK: ROOK_DIRECTIONS, QUEEN: QUEEN_DIRECTIONS}
+
+
+def material_name(pieces):
+    """Returns the name of a material set, such as 'WQ-WK-BK'"""
+    return '-'.join(PIECE_NAMES[piece] for piece in sorted(pieces))
+
+
+def parse_material(names):
+    """Returns the material set, a sorted tuple of bitboard indexes, for piece names such as ['WK', 'WQ', 'BK']"""
+    try:
+        return tuple(sorted(PIECE_INDEX[name] for name in names))
+    except KeyError as error:
+        raise ValueError('Unknown piece name: {}'.format(error.args[0])) from None
+
+
+def table_path(directory, pieces):
+    """Returns the path of the table file for a material set"""
+    return os.path.join(directory, material_name(pieces) + EXTENSION)
+
+
+def table_size(pieces):
+    """Returns the number of entries in the table of a material set: two turns times 64 squares per piece"""
+    return 2 << (6 * len(pieces))
+
+
+def decode_value(value):
+    """
+    Converts a table byte to a result for the player who has the turn
+
+    :return: a ('WIN', distance), ('LOSS', distance) or ('DRAW', 0) tuple, distances counted in plies
+    """
+    if value == DRAW:
+        return 'DRAW', 0
+    if value < LOSS:
+        return 'WIN', value
+    return 'LOSS', value - LOSS
+
+
+def position_index(game):
+    """
+    Returns where a game's current position is stored
+
+    :param game: a ChessVar object
+    :return: a (material set, index) tuple. The index holds the player turn in its top bit and then six bits per
+             piece giving its square, with the pieces in material set order.
+    """
+    occupancy = game.get_occupancy()
+    occupied = occupancy[0] | occupancy[1]
+    mailbox = game.get_mailbox()
+    placed = []
+    while occupied:
+        square = (occupied & -occupied).bit_length() - 1
+        occupied &= occupied - 1
+        placed.append((mailbox[square], square))
+    placed.sort()
+
+    index = 1 if game.get_player_turn() == 'BLACK' else 0
+    for _, square in placed:
+        index = (index << 6) | square
+    return tuple(piece for piece, _ in placed), index
+
+
+def _bits(bitboard):
+    """Yields the square indexes set in a bitboard, lowest first"""
+    while bitboard:
+        yield (bitboard & -bitboard).bit_length() - 1
+        bitboard &= bitboard - 1
+
+
+def _destinations(piece, square, own, enemy):
+    """Returns the bitboard of squares a piece can move to, following the same rules as ChessVar.legal_moves"""
+    occupied = own | enemy
+    kind = piece % 6
+    if kind == PAWN:
+        color = piece // 6
+        forward = 8 if color == 0 else -8
+        destinations = PAWN_ATTACKS[color][square] & enemy
+        push = square + forward
+        if 0 <= push < 64 and not (occupied >> push) & 1:
+            destinations |= 1 << push
+            if square // 8 == (1 if color == 0 else 6) and not (occupied >> (push + forward)) & 1:
+                destinations |= 1 << (push + forward)
+        return destinations
+    if kind == KNIGHT:
+        return KNIGHT_ATTACKS[square] & ~own
+    if kind == KING:
+        return KING_ATTACKS[square] & ~own
+    return sliding_attacks(square, occupied, SLIDER_DIRECTIONS[kind]) & ~own
+
+
+def _origins(piece, square, occupied):
+    """Returns the bitboard of empty squares from which a piece could have reached its square without capturing"""
+    kind = piece % 6
+    if kind == PAWN:
+        color = piece // 6
+        backward = -8 if color == 0 else 8
+        origins = 0
+        source = square + backward
+        if 0 <= source < 64 and not (occupied >> source) & 1:
+            origins |= 1 << source
+            start = source + backward
+            if 0 <= start < 64 and start // 8 == (1 if color == 0 else 6) and not (occupied >> start) & 1:
+                origins |= 1 << start
+        return origins
+    if kind == KNIGHT:
+        return KNIGHT_ATTACKS[square] & ~occupied
+    if kind == KING:
+        return KING_ATTACKS[square] & ~occupied
+    return sliding_attacks(square, occupied, SLIDER_DIRECTIONS[kind]) & ~occupied
+
+
+def generate_table(pieces, subtables=None):
+    """
+    Solves every position of a material set by retrograde analysis
+
+    Positions where the player to move can wipe out a piece type at once are won in 1. The other positions count
+    their moves. Solved positions are then taken from a queue in order of distance, and each one is un-moved to find
+    its predecessors: a predecessor of a lost position is won one ply later, and a predecessor whose moves all lead to
+    won positions for the opponent is lost once its last move is solved. Whatever is left unsolved is a draw.
+
+    :param pieces: the material set, a sorted tuple of at most MAX_PIECES bitboard indexes
+    :param subtables: dict from material set to table, holding the tables of the material sets left after capturing
+                      a piece whose type has more than one piece. Every table of a material set with a type repeated
+                      needs them; the other material sets end with any capture.
+    :return: a bytearray of table_size(pieces) values, as described at DRAW, LOSS and MAX_DISTANCE
+    """
+    count = len(pieces)
+    if not 1 <= count <= MAX_PIECES:
+        raise ValueError('A table holds 1 to {} pieces'.format(MAX_PIECES))
+    shift = 6 * count
+    slot_shifts = [6 * (count - 1 - slot) for slot in range(count)]
+    colors = [piece // 6 for piece in pieces]
+    last_of_type = [pieces.count(piece) == 1 for piece in pieces]
+
+    values = bytearray(table_size(pieces))
+    moves_left = bytearray(len(values))
+    loss_floors = {}
+    queue = [[] for _ in range(MAX_DISTANCE + 2)]
+
+    for index in range(len(values)):
+        turn = index >> shift
+        squares = [(index >> slot_shift) & 63 for slot_shift in slot_shifts]
+        own = enemy = 0
+        for slot in range(count):
+            if colors[slot] == turn:
+                own |= 1 << squares[slot]
+            else:
+                enemy |= 1 << squares[slot]
+        if (own | enemy).bit_count() != count:
+            continue
+
+        moves = 0
+        floor = 0
+        won = False
+        for slot in range(count):
+            if colors[slot] != turn:
+                continue
+            destinations = _destinations(pieces[slot], squares[slot], own, enemy)
+            captures = destinations & enemy
+            moves += (destinations ^ captures).bit_count()
+            for destination in _bits(captures):
+                victim = squares.index(destination)
+                if last_of_type[victim]:
+                    won = True
+                    break
+
+                # Capturing one of several pieces of a type continues in the smaller table. The move still counts
+                # unless it lets the opponent win, since it is solved already and is never taken off the count.
+                remaining = list(squares)
+                remaining[slot] = destination
+                del remaining[victim]
+                child = 1 - turn
+                for square in remaining:
+                    child = (child << 6) | square
+                value = subtables[pieces[:victim] + pieces[victim + 1:]][child]
+                if value >= LOSS:
+                    queue[value - LOSS + 1].append(index)
+                    moves += 1
+                elif value:
+                    floor = max(floor, value)
+                else:
+                    moves += 1
+            if won:
+                break
+
+        if won:
+            queue[1].append(index)
+            continue
+        moves_left[index] = moves
+        if floor:
+            loss_floors[index] = floor
+            if not moves:
+                queue[floor + 1].append(index)
+
+    board_mask = (1 << shift) - 1
+    for distance in range(1, MAX_DISTANCE + 1):
+        solved = queue[distance]
+        queue[distance] = None
+        for index in solved:
+            if values[index]:
+                continue
+            values[index] = distance if distance % 2 else LOSS + distance
+
+            mover = 1 - (index >> shift)
+            occupied = 0
+            for slot_shift in slot_shifts:
+                occupied |= 1 << ((index >> slot_shift) & 63)
+            board = index & board_mask
+            for slot in range(count):
+                if colors[slot] != mover:
+                    continue
+                square = (board >> slot_shifts[slot]) & 63
+                for source in _bits(_origins(pieces[slot], square, occupied)):
+                    predecessor = (mover << shift) | (board ^ ((square ^ source) << slot_shifts[slot]))
+                    if values[predecessor]:
+                        continue
+                    if distance % 2 == 0:
+                        if distance + 1 > MAX_DISTANCE:
+                            raise ValueError('A win is longer than {} plies'.format(MAX_DISTANCE))
+                        queue[distance + 1].append(predecessor)
+                    elif moves_left[predecessor]:
+                        moves_left[predecessor] -= 1
+                        if not moves_left[predecessor]:
+                            loss = max(loss_floors.get(predecessor, 0), distance) + 1
+                            if loss > MAX_DISTANCE:
+                                raise ValueError('A win is longer than {} plies'.format(MAX_DISTANCE))
+                            queue[loss].append(predecessor)
+
+    if queue[MAX_DISTANCE + 1]:
+        raise ValueError('A win is longer than {} plies'.format(MAX_DISTANCE))
+    return values
+
+
+def write_table(path, pieces, values):
+    """Writes a table file. The file is written under a temporary name first, so readers never see half a table."""
+    header = HEADER.pack(MAGIC, VERSION, len(pieces), bytes(pieces).ljust(MAX_PIECES, bytes([NO_PIECE])))
+    temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temporary_path, 'wb') as file:
+        file.write(header)
+        file.write(values)
+    os.replace(temporary_path, path)
+
+
+class Tablebase:
+    """
+    A class used to read one table file through a memory map.
+
+    Attributes
+    ----------
+    pieces : tuple
+        The material set: the bitboard index of every piece, sorted
+    map : mmap
+        The memory-mapped file
+
+    Methods
+    -------
+    __len__()
+        Returns the number of entries in the table
+    __getitem__(index)
+        Returns the byte stored for a position index
+    probe(game)
+        Returns the result of a game's current position for the player who has the turn
+    close()
+        Closes the memory map
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, pieces = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or not 1 <= count <= MAX_PIECES:
+            self.close()
+            raise ValueError('{} is not a version {} tablebase file'.format(path, VERSION))
+        self._pieces = tuple(pieces[:count])
+        if len(self._map) != HEADER.size + table_size(self._pieces):
+            self.close()
+            raise ValueError('{} is truncated'.format(path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return table_size(self._pieces)
+
+    def __getitem__(self, index):
+        """Returns the byte stored for a position index"""
+        return self._map[HEADER.size + index]
+
+    def get_pieces(self):
+        """Returns the material set of the table"""
+        return self._pieces
+
+    def probe(self, game):
+        """
+        Looks up a game's current position
+
+        :param game: a ChessVar object whose pieces are this table's material set
+        :return: a ('WIN', distance), ('LOSS', distance) or ('DRAW', 0) tuple for the player who has the turn
+        """
+        pieces, index = position_index(game)
+        if pieces != self._pieces:
+            raise ValueError('The position does not have the material set {}'.format(material_name(self._pieces)))
+        return decode_value(self._map[HEADER.size + index])
+
+    def close(self):
+        """Closes the memory map"""
+        self._map.close()
+
+
+class Tablebases:
+    """
+    A class used to probe every table file in a directory.
+
+    Methods
+    -------
+    probe(game)
+        Returns the result of a game's current position, or None if no table holds it
+    get_max_pieces()
+        Returns the largest number of pieces of any table
+    close()
+        Closes every table
+    """
+
+    def __init__(self, directory):
+        self._tables = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(EXTENSION):
+                table = Tablebase(os.path.join(directory, name))
+                self._tables[table.get_pieces()] = table
+        self._max_pieces = max((len(pieces) for pieces in self._tables), default=0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._tables)
+
+    def get_max_pieces(self):
+        """Returns the largest number of pieces of any table, 0 if there are none"""
+        return self._max_pieces
+
+    def probe(self, game):
+        """
+        Looks up a game's current position. Positions with more pieces than any table are rejected after counting
+        the occupied squares, so probing is cheap enough to do at every node of a search.
+
+        :param game: a ChessVar object
+        :return: a ('WIN', distance), ('LOSS', distance) or ('DRAW', 0) tuple for the player who has the turn, or None
+                 if the game is over or no table holds the position
+        """
+        occupancy = game.get_occupancy()
+        if (occupancy[0] | occupancy[1]).bit_count() > self._max_pieces or game.get_game_state() != 'UNFINISHED':
+            return None
+        pieces, index = position_index(game)
+        table = self._tables.get(pieces)
+        if table is None:
+            return None
+        return decode_value(table[index])
+
+    def close(self):
+        """Closes every table"""
+        for table in self._tables.values():
+            table.close()
+        self._tables.clear()
+
+
+def generate_tables(pieces, directory, on_table=None):
+    """
+    Generates the table of a material set and the smaller tables it needs, skipping tables already in the directory
+
+    :param pieces: the material set, a sequence of bitboard indexes
+    :param directory: directory to write the table files to, created if needed
+    :param on_table: optional function called with (material set, number of positions, seconds) after each table is
+                     written
+    :return: the path of the material set's table
+    """
+    os.makedirs(directory, exist_ok=True)
+    pieces = tuple(sorted(pieces))
+    opened = {}
+
+    def build(material):
+        path = table_path(directory, material)
+        if material in opened:
+            return path
+        if os.path.exists(path):
+            opened[material] = Tablebase(path)
+            return path
+
+        # Capturing one of several pieces of a type continues in the table without that piece
+        subtables = {}
+        for piece in set(material):
+            if material.count(piece) > 1:
+                smaller = list(material)
+                smaller.remove(piece)
+                smaller = tuple(smaller)
+                build(smaller)
+                subtables[smaller] = opened[smaller]
+
+        start = time.perf_counter()
+        values = generate_table(material, subtables)
+        write_table(path, material, values)
+        opened[material] = Tablebase(path)
+        if on_table is not None:
+            on_table(material, len(values), time.perf_counter() - start)
+        return path
+
+    try:
+        return build(pieces)
+    finally:
+        for table in opened.values():
+            table.close()
+
+
+def material_sets(max_pieces):
+    """Yields every material set with 1 to max_pieces pieces"""
+    for count in range(1, max_pieces + 1):
+        yield from itertools.combinations_with_replacement(range(len(PIECE_NAMES)), count)
+
+
+def summarize(values):
+    """Returns a dict counting the wins and losses in a table's bytes, the remaining entries, and the longest win"""
+    summary = {'WIN': 0, 'LOSS': 0, 'DRAW': 0, 'longest': 0}
+    for value in range(256):
+        occurrences = values.count(value)
+        if occurrences:
+            result, distance = decode_value(value)
+            summary[result] += occurrences
+            summary['longest'] = max(summary['longest'], distance)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate and probe endgame tablebases for the chess variant.')
+    parser.add_argument('--directory', default='tablebases', help='directory holding the table files')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = subparsers.add_parser('generate', help='generate tables')
+    generate_parser.add_argument('pieces', nargs='*', help='piece names of one material set, such as WQ WK BK')
+    generate_parser.add_argument('--all', type=int, default=None, metavar='N',
+                                 help='generate every material set with up to N pieces instead')
+
+    probe_parser = subparsers.add_parser('probe', help='look up a position')
+    probe_parser.add_argument('position', help="position string, such as '8/8/8/8/8/8/8/KQ5k w -'")
+    arguments = parser.parse_args()
+
+    if arguments.command == 'probe':
+        with Tablebases(arguments.directory) as tablebases:
+            print(tablebases.probe(ChessVar.from_position(arguments.position)))
+        return
+
+    if arguments.all is not None:
+        if not 1 <= arguments.all <= MAX_PIECES:
+            parser.error('--all takes 1 to {} pieces'.format(MAX_PIECES))
+        material_list = list(material_sets(arguments.all))
+    elif arguments.pieces:
+        try:
+            material_list = [parse_material(arguments.pieces)]
+        except ValueError as error:
+            parser.error(str(error))
+    else:
+        parser.error('give the pieces of a material set or --all')
+
+    def report(material, positions, elapsed):
+        with open(table_path(arguments.directory, material), 'rb') as file:
+            summary = summarize(file.read()[HEADER.size:])
+        print('{:<12} positions {} time {:.2f}s positions/s {:.0f} win {} loss {} draw {} longest {}'.format(
+            material_name(material), positions, elapsed, positions / elapsed if elapsed else 0, summary['WIN'],
+            summary['LOSS'], summary['DRAW'], summary['longest']))
+
+    for material in material_list:
+        generate_tables(material, arguments.directory, report)
+
+
+if __name__ == '__main__':
+    main()
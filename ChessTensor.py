@@ -0,0 +1,166 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module exports chess variant positions as NumPy tensors for machine learning: twelve 8x8 piece
+#              planes plus a feature vector holding the side to move and the number of pieces left of each type.
+#              Positions are written into buffers the caller allocates, so a ChessVar object, a ChessVarBatch, or a
+#              whole stored game corpus can be exported without allocating per position. Requires NumPy.
+
+import argparse
+import struct
+import time
+import numpy as np
+from ChessVar import ChessVar, PIECE_NAMES
+from ChessRecord import GameRecordReader
+
+# Plane p holds the pieces with bitboard index p. planes[p, row, column] is square row * 8 + column, so row 0 is rank 1.
+PLANES = 12
+# Feature 0 is the side to move (0 White, 1 Black), features 1-12 are the piece counts in PIECE_NAMES order
+FEATURES = 1 + len(PIECE_NAMES)
+PLANE_SHAPE = (PLANES, 8, 8)
+
+# Outcome labels stored with each dataset position, from the side to move's point of view
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+# The twelve bitboards of the position being exported are packed into this scratch buffer, which the byte view reads
+# without copying. Exports in one process share it, so they must not run in several threads at once.
+_bitboard_packer = struct.Struct('<12Q')
+_bitboard_buffer = bytearray(_bitboard_packer.size)
+_bitboard_bytes = np.frombuffer(_bitboard_buffer, dtype=np.uint8)
+
+# Bit b of byte value v, in each dtype that has been exported to
+_byte_bits = {}
+
+
+def _bits_table(dtype):
+    """Returns a (256, 8) table in the given dtype whose row v holds the bits of byte value v, lowest bit first"""
+    dtype = np.dtype(dtype)
+    if dtype not in _byte_bits:
+        values = np.arange(256, dtype=np.uint8).reshape(256, 1)
+        _byte_bits[dtype] = ((values >> np.arange(8, dtype=np.uint8)) & 1).astype(dtype)
+    return _byte_bits[dtype]
+
+
+def _flat_view(array, shape):
+    """Returns array reshaped to shape without copying, raising ValueError if that is not possible"""
+    view = array.view()
+    try:
+        view.shape = shape
+    except AttributeError:
+        raise ValueError('output buffer must be contiguous') from None
+    return view
+
+
+def allocate(count=None, dtype=np.float32):
+    """
+    Allocates buffers for exported positions
+
+    :param count: number of positions, or None for a single position
+    :param dtype: dtype of the planes. Features are always int16.
+    :return: a (planes, features) tuple shaped (12, 8, 8) and (13,), or (count, 12, 8, 8) and (count, 13)
+    """
+    if count is None:
+        return np.zeros(PLANE_SHAPE, dtype=dtype), np.zeros(FEATURES, dtype=np.int16)
+    return np.zeros((count,) + PLANE_SHAPE, dtype=dtype), np.zeros((count, FEATURES), dtype=np.int16)
+
+
+def export_position(game, planes, features):
+    """
+    Writes one ChessVar position into caller-provided buffers
+
+    :param game: a ChessVar object
+    :param planes: a contiguous (12, 8, 8) array of any numeric dtype
+    :param features: a (13,) array
+    """
+    _bitboard_packer.pack_into(_bitboard_buffer, 0, *game.get_bitboards())
+    np.take(_bits_table(planes.dtype), _bitboard_bytes, axis=0, out=_flat_view(planes, (PLANES * 8, 8)))
+
+    inventory = game.get_piece_inventory()
+    features[0] = 1 if game.get_player_turn() == 'BLACK' else 0
+    for index, name in enumerate(PIECE_NAMES, start=1):
+        features[index] = inventory.get(name, 0)
+
+
+def export_boards(boards, turns, inventories, planes, features):
+    """
+    Writes a batch of positions stored as arrays into caller-provided buffers
+
+    :param boards: a (K, 64) array of square codes, 0 for empty or bitboard index + 1, as stored by ChessVarBatch
+    :param turns: a (K,) array, 0 where White has the turn and 1 where Black has the turn
+    :param inventories: a (K, 12) array of piece counts in PIECE_NAMES order
+    :param planes: a contiguous (K, 12, 8, 8) array of any numeric dtype
+    :param features: a (K, 13) array
+    """
+    count = boards.shape[0]
+    codes = np.arange(1, PLANES + 1, dtype=boards.dtype).reshape(1, PLANES, 1)
+    np.equal(boards.reshape(count, 1, 64), codes, out=_flat_view(planes, (count, PLANES, 64)), casting='unsafe')
+    features[:, 0] = turns
+    features[:, 1:] = inventories
+
+
+def export_batch(batch, planes, features):
+    """Writes every position of a ChessBatch.ChessVarBatch into (K, 12, 8, 8) and (K, 13) buffers"""
+    export_boards(batch.get_boards(), batch.get_turns(), batch.get_inventories(), planes, features)
+
+
+def write_dataset(record_path, output_prefix, dtype=np.uint8):
+    """
+    Replays every game of a game record file and writes each position before a move into memory-mapped .npy files
+
+    The files are created at their final size before any game is replayed, and each position is exported straight
+    into the mapped planes and features, so corpora larger than memory can be converted. Load them with
+    numpy.load(path, mmap_mode='r').
+
+    :param record_path: path of a ChessRecord game record file
+    :param output_prefix: the files written are <prefix>.planes.npy (N, 12, 8, 8), <prefix>.features.npy (N, 13),
+                          <prefix>.moves.npy (N,) holding the move played from each position, and
+                          <prefix>.outcomes.npy (N,) holding WIN, DRAW or LOSS for the side to move
+    :param dtype: dtype of the planes
+    :return: the number of positions written
+    """
+    with GameRecordReader(record_path) as reader:
+        count = sum(reader.get_move_count(number) for number in range(len(reader)))
+
+        open_memmap = np.lib.format.open_memmap
+        planes = open_memmap(output_prefix + '.planes.npy', mode='w+', dtype=dtype, shape=(count,) + PLANE_SHAPE)
+        features = open_memmap(output_prefix + '.features.npy', mode='w+', dtype=np.int16, shape=(count, FEATURES))
+        moves = open_memmap(output_prefix + '.moves.npy', mode='w+', dtype=np.uint16, shape=(count,))
+        outcomes = open_memmap(output_prefix + '.outcomes.npy', mode='w+', dtype=np.int8, shape=(count,))
+
+        position = 0
+        for stored_game in reader:
+            game = ChessVar()
+            first = position
+            for move in stored_game.moves:
+                export_position(game, planes[position], features[position])
+                game.push(move)
+                position += 1
+            moves[first:position] = stored_game.moves
+
+            # White moves from the even positions of each game, Black from the odd ones
+            if stored_game.result != 'DRAW':
+                white_outcome = WIN if stored_game.result == 'WHITE_WON' else LOSS
+                outcomes[first:position:2] = white_outcome
+                outcomes[first + 1:position:2] = -white_outcome
+
+    for array in (planes, features, moves, outcomes):
+        array.flush()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert a game record file into memory-mapped training tensors.')
+    parser.add_argument('record', help='game record file written by ChessSimulator.py --output')
+    parser.add_argument('prefix', help='prefix of the .npy files to write')
+    arguments = parser.parse_args()
+
+    start = time.perf_counter()
+    count = write_dataset(arguments.record, arguments.prefix)
+    elapsed = time.perf_counter() - start
+    print('positions {} time {:.2f}s positions/s {:.0f}'.format(count, elapsed, count / elapsed if elapsed else 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+# Author: Nolan Reichkitzer
+# GitHub username: nolanreichkitzer
+# Date: 10/17/2026
+# Description: This module contains a fixed-size transposition table for searches over ChessVar positions. Entries are
+#              keyed by the Zobrist hash that ChessVar keeps up to date as moves are made, so a position reached
+#              through different move orders is only searched once. The shared version lets the processes of a
+#              parallel search read and write one table in shared memory without locks.
+
+from array import array
+from multiprocessing import shared_memory
+
+# Bound types stored with each score
+EXACT = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+# Each entry is one 64-bit key and one 64-bit packed data word
+ENTRY_BYTES = 16
+
+# Layout of the packed data word:
+#   bits  0-31  score + SCORE_OFFSET
+#   bits 32-43  best move, (source << 6) | destination, 0 if there is none
+#   bits 44-51  search depth
+#   bits 52-53  bound type (never 0, so an empty slot always has a zero data word)
+#   bits 54-61  age of the search that stored the entry
+SCORE_OFFSET = 1 << 31
+
+
+def pack_entry(depth, bound, score, move, age):
+    """Packs the fields of a transposition table entry into one 64-bit data word. Depths above 255 are stored as 255."""
+    return (score + SCORE_OFFSET) | (move << 32) | (min(depth, 0xFF) << 44) | (bound << 52) | (age << 54)
+
+
+def slot_count(size_mb):
+    """
+    Returns the number of slots of a table of about size_mb megabytes, rounded down to a power of two so a hash maps
+    to its slot with one mask operation
+
+    :param size_mb: table size in megabytes, such as 16 or 0.5
+    :return: the slot count, at least 1
+    """
+    if not size_mb > 0:
+        raise ValueError('Table size must be positive: {!r}'.format(size_mb))
+    slots = max(1, int(size_mb * 1024 * 1024) // ENTRY_BYTES)
+    return 1 << (slots.bit_length() - 1)
+
+
+def unpack_entry(data):
+    """Unpacks a 64-bit data word into a (depth, bound, score, move) tuple"""
+    return (data >> 44) & 0xFF, (data >> 52) & 3, (data & 0xFFFFFFFF) - SCORE_OFFSET, (data >> 32) & 0xFFF
+
+
+class TranspositionTable:
+    """
+    A class used to represent a fixed-size transposition table keyed by ChessVar Zobrist hashes.
+
+    The table holds a power-of-two number of slots in two flat arrays of 64-bit integers, so its memory use is fixed
+    when it is created. Each hash maps to exactly one slot. A new entry replaces the stored one if the slot is empty,
+    holds the same position, was written by an older search, or was searched to a depth no greater than the new one.
+
+    Attributes
+    ----------
+    keys : array
+        The full Zobrist hash of the position stored in each slot
+    data : array
+        The packed (depth, bound, score, move, age) word of each slot
+    mask : int
+        Slot count minus one, used to map a hash to its slot
+    age : int
+        Age of the current search, from 0 to 255. Entries from older searches are always replaceable.
+
+    Methods
+    -------
+    probe(key)
+        Returns the (depth, bound, score, move) stored for the position, or None if it is not in the table
+    store(key, depth, bound, score, move)
+        Stores a search result, following the depth and age replacement policy
+    new_search()
+        Advances the age of the current search. No entry is removed, but older entries become replaceable.
+    clear()
+        Empties every slot
+    hashfull()
+        Returns how many of the first 1000 slots are used by the current search
+    """
+
+    def __init__(self, size_mb=16):
+        slots = slot_count(size_mb)
+        self._keys = array('Q', bytes(8 * slots))
+        self._data = array('Q', bytes(8 * slots))
+        self._mask = slots - 1
+        self._age = 0
+
+    def __len__(self):
+        return self._mask + 1
+
+    def probe(self, key):
+        """
+        Looks up a position in the table
+
+        :param key: the Zobrist hash of the position, as returned by ChessVar.get_hash
+        :return: a (depth, bound, score, move) tuple, or None if the position is not stored
+        """
+        slot = key & self._mask
+        data = self._data[slot]
+        if data == 0 or self._keys[slot] != key:
+            return None
+        return unpack_entry(data)
+
+    def store(self, key, depth, bound, score, move):
+        """
+        Stores a search result unless the slot holds a deeper result for another position from the current search
+
+        :param key: the Zobrist hash of the position, as returned by ChessVar.get_hash
+        :param depth: the remaining search depth the score was computed with, stored as at most 255
+        :param bound: EXACT, LOWER_BOUND or UPPER_BOUND
+        :param score: the score of the position for the player who has the turn
+        :param move: the best move found, encoded as (source << 6) | destination, or 0 if there is none
+        """
+        slot = key & self._mask
+        stored = self._data[slot]
+        if stored and self._keys[slot] != key and (stored >> 54) == self._age and ((stored >> 44) & 0xFF) > depth:
+            return
+
+        # Keep the previous best move if the new result did not find one
+        if move == 0 and stored and self._keys[slot] == key:
+            move = (stored >> 32) & 0xFFF
+
+        self._keys[slot] = key
+        self._data[slot] = pack_entry(depth, bound, score, move, self._age)
+
+    def new_search(self):
+        """
+        Advances the age of the current search. Stored entries are kept and can still be probed, but entries from
+        older searches may be replaced by any new result.
+        """
+        self._age = (self._age + 1) & 0xFF
+
+    def clear(self):
+        """Empties every slot"""
+        slots = self._mask + 1
+        self._keys = array('Q', bytes(8 * slots))
+        self._data = array('Q', bytes(8 * slots))
+
+    def hashfull(self):
+        """Returns how many of the first 1000 slots hold entries from the current search"""
+        sample = min(1000, self._mask + 1)
+        used = sum(1 for data in self._data[:sample] if data and (data >> 54) == self._age)
+        return used * 1000 // sample
+
+
+class SharedTranspositionTable:
+    """
+    A class used to share one transposition table between processes through a multiprocessing.shared_memory block.
+
+    The table follows the same replacement policy and entry layout as TranspositionTable, without any lock. Each slot
+    holds two 64-bit words: the position's key XOR the data word, then the data word. Two processes may write a slot at
+    the same time, so a reader can see one process's first word next to the other's second. The key computed from
+    such a torn slot does not match, and the probe misses instead of returning another position's result.
+
+    Attributes
+    ----------
+    memory : SharedMemory
+        The shared block, created by the table that was given no name and attached to by the others
+    words : memoryview
+        The block viewed as 64-bit words, two per slot
+    mask : int
+        Slot count minus one, used to map a hash to its slot
+    age : int
+        Age of the current search. Every process sharing the table ages it once per search, so they agree.
+
+    Methods
+    -------
+    probe(key)
+        Returns the (depth, bound, score, move) stored for the position, or None if it is not in the table
+    store(key, depth, bound, score, move)
+        Stores a search result, following the depth and age replacement policy
+    new_search()
+        Advances the age of the current search. No entry is removed, but older entries become replaceable.
+    clear()
+        Empties every slot
+    hashfull()
+        Returns how many of the first 1000 slots are used by the current search
+    get_name()
+        Returns the name other processes attach to the table with
+    close()
+        Detaches from the block, and frees it if this table created it
+    """
+
+    def __init__(self, size_mb=16, name=None):
+        # Every process computes the same power-of-two slot count from size_mb
+        slots = slot_count(size_mb)
+        self._owner = name is None
+        if self._owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=slots * ENTRY_BYTES)  # Starts zeroed
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self._words = self._memory.buf[:slots * ENTRY_BYTES].cast('Q')
+        self._mask = slots - 1
+        self._age = 0
+
+    def __len__(self):
+        return self._mask + 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_name(self):
+        """Returns the name of the shared block, which other processes pass as name to attach to this table"""
+        return self._memory.name
+
+    def probe(self, key):
+        """
+        Looks up a position in the table
+
+        :param key: the Zobrist hash of the position, as returned by ChessVar.get_hash
+        :return: a (depth, bound, score, move) tuple, or None if the position is not stored or the slot was torn
+        """
+        slot = (key & self._mask) << 1
+        data = self._words[slot + 1]
+        if data == 0 or self._words[slot] ^ data != key:
+            return None
+        return unpack_entry(data)
+
+    def store(self, key, depth, bound, score, move):
+        """
+        Stores a search result unless the slot holds a deeper result for another position from the current search
+
+        :param key: the Zobrist hash of the position, as returned by ChessVar.get_hash
+        :param depth: the remaining search depth the score was computed with, stored as at most 255
+        :param bound: EXACT, LOWER_BOUND or UPPER_BOUND
+        :param score: the score of the position for the player who has the turn
+        :param move: the best move found, encoded as (source << 6) | destination, or 0 if there is none
+        """
+        slot = (key & self._mask) << 1
+        stored = self._words[slot + 1]
+        same_position = stored and self._words[slot] ^ stored == key
+        if stored and not same_position and (stored >> 54) == self._age and ((stored >> 44) & 0xFF) > depth:
+            return
+
+        # Keep the previous best move if the new result did not find one
+        if move == 0 and same_position:
+            move = (stored >> 32) & 0xFFF
+
+        data = pack_entry(depth, bound, score, move, self._age)
+        self._words[slot + 1] = data
+        self._words[slot] = key ^ data
+
+    def new_search(self):
+        """
+        Advances the age of the current search. Stored entries are kept and can still be probed, but entries from
+        older searches may be replaced by any new result.
+        """
+        self._age = (self._age + 1) & 0xFF
+
+    def clear(self):
+        """Empties every slot, for every process sharing the table"""
+        size = (self._mask + 1) * ENTRY_BYTES
+        self._memory.buf[:size] = bytes(size)
+
+    def hashfull(self):
+        """Returns how many of the first 1000 slots hold entries from the current search"""
+        sample = min(1000, self._mask + 1)
+        used = sum(1 for slot in range(sample) if self._words[2 * slot + 1] and
+                   (self._words[2 * slot + 1] >> 54) == self._age)
+        return used * 1000 // sample
+
+    def close(self):
+        """Detaches this process from the table. The table that created the block also frees it."""
+        if self._words is None:
+            return
+        self._words.release()
+        self._words = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
@@ -6,6 +6,159 @@
 #              from the normal rules. In this version, the winner is the first player to capture all of an opponent's
 #              pieces of one type. Also, castling, en passant, and pawn promotion are not allowed.
 
+import random
+from collections.abc import Mapping
+from enum import IntEnum
+
+# Board geometry. Squares are indexed 0-63 with a1 = 0, b1 = 1, ..., h8 = 63.
+COLUMNS = 'abcdefgh'
+SQUARE_NAMES = [column + str(row) for row in range(1, 9) for column in COLUMNS]
+SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+# Every accepted spelling of every square ('e4', 'E4') mapped to its index, so input is parsed with one lookup
+SQUARE_LOOKUP = dict(SQUARE_INDEX)
+SQUARE_LOOKUP.update({name.upper(): index for name, index in SQUARE_INDEX.items()})
+
+# Order in which the chessboard dictionary has always been iterated (row 8 down to row 1, a to h)
+BOARD_ORDER = [column + str(row) for row in range(8, 0, -1) for column in COLUMNS]
+
+# One bitboard per (color, piece type). The index of a piece name in this list is its bitboard index.
+PIECE_NAMES = ['WP', 'WN', 'WB', 'WR', 'WQ', 'WK', 'BP', 'BN', 'BB', 'BR', 'BQ', 'BK']
+PIECE_INDEX = {name: index for index, name in enumerate(PIECE_NAMES)}
+COLOR_INDEX = {'WHITE': 0, 'BLACK': 1}
+
+
+def _build_between_table():
+    """Returns a 64x64 table of bitboards holding the squares strictly between two squares on a shared line"""
+    table = [[0] * 64 for _ in range(64)]
+    for source in range(64):
+        source_column, source_row = source % 8, source // 8
+        for destination in range(64):
+            delta_column = (destination % 8) - source_column
+            delta_row = (destination // 8) - source_row
+
+            # Only vertical, horizontal and diagonal lines have squares in between
+            if (delta_column, delta_row) == (0, 0) or \
+                    (delta_column != 0 and delta_row != 0 and abs(delta_column) != abs(delta_row)):
+                continue
+
+            step_column = (delta_column > 0) - (delta_column < 0)
+            step_row = (delta_row > 0) - (delta_row < 0)
+            column, row = source_column + step_column, source_row + step_row
+            mask = 0
+            while (column, row) != (source_column + delta_column, source_row + delta_row):
+                mask |= 1 << (row * 8 + column)
+                column, row = column + step_column, row + step_row
+            table[source][destination] = mask
+    return table
+
+
+BETWEEN = _build_between_table()
+
+# Move generation tables, computed once at import
+FULL_BOARD = (1 << 64) - 1
+ROW_3 = 0xFF << 16
+ROW_6 = 0xFF << 40
+
+# Sliding directions as (column step, row step). The first four increase the square index, the last four decrease it.
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (-1, 1), (0, -1), (-1, 0), (-1, -1), (1, -1)]
+ROOK_DIRECTIONS = (0, 1, 4, 5)
+BISHOP_DIRECTIONS = (2, 3, 6, 7)
+QUEEN_DIRECTIONS = (0, 1, 2, 3, 4, 5, 6, 7)
+
+
+def _build_step_table(steps, max_distance):
+    """Returns, for every square, a bitboard of the squares reached by repeating each step up to max_distance times"""
+    table = []
+    for square in range(64):
+        mask = 0
+        for step_column, step_row in steps:
+            column, row = square % 8 + step_column, square // 8 + step_row
+            distance = 1
+            while 0 <= column < 8 and 0 <= row < 8 and distance <= max_distance:
+                mask |= 1 << (row * 8 + column)
+                column, row = column + step_column, row + step_row
+                distance += 1
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _build_step_table([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)], 1)
+KING_ATTACKS = _build_step_table(DIRECTIONS, 1)
+PAWN_ATTACKS = [_build_step_table([(-1, 1), (1, 1)], 1), _build_step_table([(-1, -1), (1, -1)], 1)]
+RAYS = [_build_step_table([step], 7) for step in DIRECTIONS]
+
+
+def sliding_attacks(square, occupied, directions):
+    """
+    Returns the bitboard of squares a sliding piece attacks along the given directions
+
+    :param square: the index (0-63) of the square the sliding piece stands on
+    :param occupied: a bitboard of every occupied square
+    :param directions: indexes into DIRECTIONS the piece may slide along
+    :return: a bitboard of every square reachable up to and including the first blocker on each ray
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAYS[direction][square]
+        blockers = ray & occupied
+        if blockers:
+            # The nearest blocker is the lowest set bit on increasing rays and the highest on decreasing rays
+            if direction < 4:
+                ray ^= RAYS[direction][(blockers & -blockers).bit_length() - 1]
+            else:
+                ray ^= RAYS[direction][blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+# Zobrist hashing keys: one random 64-bit key per (piece, square) and one for black to move. A fixed seed keeps
+# hashes identical across processes and runs.
+_zobrist_random = random.Random(0x5EED)
+ZOBRIST_PIECES = [[_zobrist_random.getrandbits(64) for _ in range(64)] for _ in range(12)]
+ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+
+# Position notation: FEN-style piece letters (upper case for White), turn letters and game state letters
+POSITION_LETTERS = 'PNBRQKpnbrqk'
+TURN_LETTERS = {'WHITE': 'w', 'BLACK': 'b'}
+STATE_LETTERS = {'UNFINISHED': '-', 'WHITE_WON': 'W', 'BLACK_WON': 'B'}
+GAME_STATES = ['UNFINISHED', 'WHITE_WON', 'BLACK_WON']
+POSITION_BYTES = 33
+START_POSITION = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w -'
+
+
+def move_to_algebraic(move):
+    """Converts a move returned by ChessVar.legal_moves into a (source, destination) pair of algebraic strings"""
+    return SQUARE_NAMES[move >> 6], SQUARE_NAMES[move & 63]
+
+
+class MoveResult(IntEnum):
+    """Result codes returned by ChessVar.try_move. OK means the move was made, every other code names why it wasn't."""
+    OK = 0
+    GAME_OVER = 1
+    INVALID_SQUARE = 2
+    EMPTY_SOURCE = 3
+    WRONG_COLOR = 4
+    NO_MOVE = 5
+    ILLEGAL_GEOMETRY = 6
+    BLOCKED = 7
+    OWN_PIECE = 8
+
+
+# Messages displayed by ChessVar.make_move when try_move rejects a move
+MOVE_RESULT_MESSAGES = {
+    MoveResult.GAME_OVER: 'This game has already been won!',
+    MoveResult.INVALID_SQUARE: "One or both of your move entries is invalid.",
+    MoveResult.EMPTY_SOURCE: "You didn't select a piece to move. Try a different move.",
+    MoveResult.WRONG_COLOR: "You can't move the other player's piece. Try a different move.",
+    MoveResult.NO_MOVE: "You didn't actually move the piece. Try a different move.",
+    MoveResult.ILLEGAL_GEOMETRY: "That move isn't legal for this piece. Try a different move.",
+    MoveResult.BLOCKED: "You tried to move through other chess pieces. Only the Knight can do that. "
+                        "Try a different move",
+    MoveResult.OWN_PIECE: "You can't remove your own piece from the board. Try a different move.",
+}
+
+
 class ChessPiece:
     """
     A class used to represent a Chess piece.  Subclasses of ChessPiece are Pawn, Knight, Bishop, Rook, Queen, and King.
@@ -28,12 +181,49 @@ class ChessPiece:
         Returns the type of chess piece
     get_name()
         Returns the name identifier of the chess piece
+
+    ChessPiece objects are immutable flyweights: there is only one object per class and color, shared by every
+    chessboard, and calling a class again with the same color returns that same object. The objects have no per-instance
+    dictionary and hold no reference to a game.
     """
 
-    def __init__(self, color):
-        self._color = color
-        self._type = None
-        self._name = None
+    __slots__ = ('_color', '_type', '_name')
+
+    # Shared objects by (class, color)
+    _flyweights = {}
+
+    # Overwritten by subclasses
+    piece_type = None
+    letter = None
+
+    def __new__(cls, color):
+        piece = ChessPiece._flyweights.get((cls, color))
+        if piece is None:
+            piece = object.__new__(cls)
+            object.__setattr__(piece, '_color', color)
+            object.__setattr__(piece, '_type', cls.piece_type)
+            object.__setattr__(piece, '_name', None if cls.letter is None else color[0] + cls.letter)
+            ChessPiece._flyweights[(cls, color)] = piece
+        return piece
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ChessPiece objects are shared and cannot be changed')
+
+    def __delattr__(self, name):
+        raise AttributeError('ChessPiece objects are shared and cannot be changed')
+
+    def __reduce__(self):
+        # Unpickling returns the shared object of this process
+        return self.__class__, (self._color,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._color)
 
     def get_color(self):
         """Returns the color of the chess piece"""
@@ -60,56 +250,51 @@ class Pawn(ChessPiece):
         Represents the type of ChessPiece (same as the name of this class)
     name : string
         Represents a name identifier for the chess piece. 'BP' for a black Pawn or 'WP' for white
-    chess_var_object : ChessVar class Object
-        ChessVar Object representing the chess game that the chess piece is being used in
-        The Pawn's legal_move method needs to access the chessboard data member from ChessVar
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece. The
+        Pawn's legal_move needs the chessboard because Pawns move and capture differently.
     """
 
-    def __init__(self, color, chess_var_object):
-        super().__init__(color)
-        self._type = 'PAWN'
-        self._name = color[0] + self._type[0]
-        self._chess_var_object = chess_var_object
+    __slots__ = ()
+    piece_type = 'PAWN'
+    letter = 'P'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
-
-        # Use ChessVar get_board method to return the chessboard dictionary to this class
-        chessboard = self._chess_var_object.get_board()
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # Determine legal moves for White pawn
 
         if self._color == 'WHITE':
 
             # White can only move from row 2 to 8, and can move 2 spaces forward if source space is on row 2
-            if source_row == 2 and (destination_row - source_row) == 2 and \
-                    (destination_column - source_column) == 0 and not chessboard[destination]:
+            if source_row == 1 and (destination_row - source_row) == 2 and \
+                    (destination_column - source_column) == 0 and chessboard[destination] is None:
                 return True
 
             # Normally, Pawns can only move forward 1 space and can't capture while moving forward
             elif (destination_row - source_row) == 1 and (destination_column - source_column) == 0 \
-                    and not chessboard[destination]:
+                    and chessboard[destination] is None:
                 return True
 
-            # Pawn can move forward 1 space diagonally if it is capturing an enemy piece
+            # Pawn can move forward 1 space diagonally if it is capturing an enemy (black) piece
             elif (destination_row - source_row) == 1 and abs(destination_column - source_column) == 1 \
-                    and chessboard[destination] and chessboard[destination].get_color() == 'BLACK':
+                    and chessboard[destination] is not None and chessboard[destination] >= 6:
                 return True
 
             else:
@@ -119,18 +304,18 @@ class Pawn(ChessPiece):
         else:
 
             # Black can only move from row 7 to 1, and can move 2 spaces forward if source space is on row 7
-            if source_row == 7 and (source_row - destination_row) == 2 and \
-                    (destination_column - source_column) == 0 and not chessboard[destination]:
+            if source_row == 6 and (source_row - destination_row) == 2 and \
+                    (destination_column - source_column) == 0 and chessboard[destination] is None:
                 return True
 
             # Normally, Pawns can only move forward 1 space and can't capture while moving forward
             elif (source_row - destination_row) == 1 and (destination_column - source_column) == 0 \
-                    and not chessboard[destination]:
+                    and chessboard[destination] is None:
                 return True
 
-            # Pawn can move forward 1 space diagonally if it is capturing an enemy piece
+            # Pawn can move forward 1 space diagonally if it is capturing an enemy (white) piece
             elif (source_row - destination_row) == 1 and abs(destination_column - source_column) == 1 \
-                    and chessboard[destination] and chessboard[destination].get_color() == 'WHITE':
+                    and chessboard[destination] is not None and chessboard[destination] < 6:
                 return True
 
             else:
@@ -152,28 +337,29 @@ class Knight(ChessPiece):
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard=None)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece
     """
 
-    def __init__(self, color):
-        super().__init__(color)
-        self._type = 'KNIGHT'
-        self._name = color[0] + 'N'
+    __slots__ = ()
+    piece_type = 'KNIGHT'
+    letter = 'N'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard=None):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # Determine legal moves for Knights
 
@@ -204,28 +390,29 @@ class Bishop(ChessPiece):
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard=None)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece
     """
 
-    def __init__(self, color):
-        super().__init__(color)
-        self._type = 'BISHOP'
-        self._name = color[0] + self._type[0]
+    __slots__ = ()
+    piece_type = 'BISHOP'
+    letter = 'B'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard=None):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # Determine legal moves for Bishops
 
@@ -251,28 +438,29 @@ class Rook(ChessPiece):
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard=None)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece
     """
 
-    def __init__(self, color):
-        super().__init__(color)
-        self._type = 'ROOK'
-        self._name = color[0] + self._type[0]
+    __slots__ = ()
+    piece_type = 'ROOK'
+    letter = 'R'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard=None):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # Determine legal moves for Rooks
 
@@ -298,27 +486,28 @@ class Queen(ChessPiece):
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard=None)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece
     """
-    def __init__(self, color):
-        super().__init__(color)
-        self._type = 'QUEEN'
-        self._name = color[0] + self._type[0]
+    __slots__ = ()
+    piece_type = 'QUEEN'
+    letter = 'Q'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard=None):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # Determine legal moves for Queen
 
@@ -346,28 +535,29 @@ class King(ChessPiece):
 
     Methods
     -------
-    legal_move(source, destination)
-        Determines if the proposed move is legal for this type of chess piece
+    legal_move(source, destination, chessboard=None)
+        Determines if the proposed move (between square indexes 0-63) is legal for this type of chess piece
     """
 
-    def __init__(self, color):
-        super().__init__(color)
-        self._type = 'KING'
-        self._name = color[0] + self._type[0]
+    __slots__ = ()
+    piece_type = 'KING'
+    letter = 'K'
 
-    def legal_move(self, source, destination):
+    def legal_move(self, source, destination, chessboard=None):
         """
         Determines if the proposed move is legal for this type of chess piece
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :param chessboard: the game's list of 64 bitboard indexes (None for empty squares), as returned by
+                           ChessVar.get_mailbox. Only needed by Pawns.
         :return: True if the move is legal. False if the move is illegal.
         """
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
+        # Store row and column values (0-7) of the square indexes
+        source_column = source & 7
+        source_row = source >> 3
+        destination_column = destination & 7
+        destination_row = destination >> 3
 
         # King can move one space in any direction
         if abs(destination_column - source_column) <= 1 and abs(destination_row - source_row) <= 1:
@@ -376,6 +566,43 @@ class King(ChessPiece):
             return False
 
 
+# The twelve shared ChessPiece objects, in PIECE_NAMES order
+PIECES = [Pawn('WHITE'), Knight('WHITE'), Bishop('WHITE'), Rook('WHITE'), Queen('WHITE'), King('WHITE'),
+          Pawn('BLACK'), Knight('BLACK'), Bishop('BLACK'), Rook('BLACK'), Queen('BLACK'), King('BLACK')]
+
+
+class ChessboardView(Mapping):
+    """
+    A read-only, dictionary-compatible view of a ChessVar chessboard. Keys are the chessboard grid squares in algebraic
+    notation, values are the ChessPiece objects occupying the squares or None for empty squares. The view reads
+    directly from the game's board storage, so it always reflects the current position.
+
+    Methods
+    -------
+    __getitem__(square)
+        Returns the ChessPiece object occupying the square, or None if the square is empty
+    """
+
+    def __init__(self, chess_var_object):
+        self._chess_var_object = chess_var_object
+
+    def __getitem__(self, square):
+        """Returns the ChessPiece object occupying the square, or None if the square is empty"""
+        piece = self._chess_var_object._mailbox[SQUARE_INDEX[square]]
+        if piece is None:
+            return None
+        return self._chess_var_object._pieces[piece]
+
+    def __iter__(self):
+        return iter(BOARD_ORDER)
+
+    def __len__(self):
+        return 64
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class ChessVar:
     """
     A class used to represent a Chess game. The game is a variant of Chess with different rules.
@@ -390,10 +617,17 @@ class ChessVar:
 
     Attributes
     ----------
-    chessboard : dictionary
-        A dictionary representing the chessboard grid. Keys are the chessboard grid squares, values are ChessPiece
-        objects occupying the squares. Dictionary is initialized to the starting state of a normal chess game using the
-        set_board method and will be populated by ChessPiece objects.
+    bitboards : list
+        A list of twelve 64-bit integers, one per (color, piece type) in PIECE_NAMES order. Bit n of a bitboard is set
+        when a piece of that color and type occupies square n (a1 = 0, h8 = 63).
+    occupancy : list
+        Two bitboards holding every square occupied by white pieces and by black pieces respectively.
+    mailbox : list
+        A list of 64 bitboard indexes (or None for empty squares) used to look up the piece on a given square.
+    chessboard : ChessboardView
+        A read-only, dictionary-compatible view of the board. Keys are the chessboard grid squares, values are
+        ChessPiece objects occupying the squares. The board is initialized to the starting state of a normal chess game
+        using the set_board method.
     piece_inventory : dictionary
         A dictionary representing the piece inventory with piece names as keys and piece counts as values.
         Dictionary is initialized to empty dictionary and filled after the chessboard is set using the
@@ -403,17 +637,40 @@ class ChessVar:
     game_state : string
         Represents the status of the game. Data member is initialized to 'UNFINISHED' and will be set to 'WHITE_WON'
         if white makes a winning move or 'BLACK_WON' if black makes a winning move
+    undo_stack : list
+        One (move, captured piece, captured piece's previous count, previous game_state, previous hash) tuple per move
+        made, used by pop to take moves back
+    hash : int
+        The 64-bit Zobrist hash of the position, updated incrementally as pieces move and the turn changes
 
     Methods
     -------
+    reset()
+        Returns the game to the starting position, reusing its board storage
     set_board()
         Populates the chessboard data member with ChessPiece Objects.
+    from_position(position)
+        Creates a game directly at a position given as a position string or position bytes
+    set_position(position)
+        Replaces the current position, reusing the game's board storage
+    to_position(binary=False)
+        Returns the current position as a position string or as 33 position bytes
     get_board()
-        Returns the chessboard dictionary
+        Returns a read-only, dictionary-compatible view of the chessboard
+    get_bitboards()
+        Returns the list of twelve bitboards
+    get_mailbox()
+        Returns the list of 64 bitboard indexes, one per square
+    get_occupancy()
+        Returns the occupied-square bitboards of White and Black
     display_board()
         Displays the current chessboard arrangement to the user
     update_piece_inventory()
         Updates the piece_inventory data member with current ChessPiece counts
+    validate_piece_inventory()
+        Recounts every piece on the chessboard and compares the result with the piece_inventory data member
+    get_piece_inventory()
+        Returns the piece_inventory dictionary
     display_piece_inventory():
         Displays the piece_inventory dictionary to the user
     get_player_turn()
@@ -422,82 +679,223 @@ class ChessVar:
         Switches current player_turn to the other player
     get_game_state()
         Returns the value of the game_state data member
-    current_player_wins()
+    current_player_wins(display=True)
         Sets game_state data member to 'WHITE_WON' if it is white's turn or 'BLACK_WON' if it is black's turn
-    forfeit()
-        Sets game_state data member to 'BLACK_WON' if it is white's turn or 'WHITE_WON' if it is black's turn
+    forfeit(display=True, player=None)
+        Sets game_state data member so the forfeiting player (by default the player who has the turn) loses
     make_move(source, destination)
         Takes a piece's source square and proposed destination as strings and moves the piece if it is a legal move
+    try_move(source, destination)
+        Same as make_move, but returns a MoveResult code instead of displaying anything
+    make_move_idx(source, destination)
+        Same as try_move, but takes square indexes (0-63) instead of algebraic strings
     make_move_and_display_board(source, destination):
         Calls the make_move and display_board methods if the user wants to automatically display the board
     spaces_between_source_and_destination_clear(source, destination)
         Determines if the spaces in between the source and destination squares are clear.
+    legal_moves(captures_only=False)
+        Returns every legal move (or every legal capture) for the player who has the current turn
+    push(move)
+        Makes a move from legal_moves without validation or display, recording it so it can be taken back
+    pop()
+        Takes back the last move made with push or make_move
+    get_hash()
+        Returns the 64-bit Zobrist hash of the current position
+    validate_hash()
+        Recomputes the Zobrist hash from scratch and compares the result with the incrementally updated hash
     """
 
     def __init__(self):
-        self._chessboard = {}
+        self._bitboards = [0] * 12
+        self._occupancy = [0, 0]
+        self._mailbox = [None] * 64
+        self._pieces = PIECES
+        self._chessboard = ChessboardView(self)
         self._piece_inventory = {}
+        self._undo_stack = []
+        self._hash = 0
         self.set_board()
         self.update_piece_inventory()
         self._player_turn = 'WHITE'
         self._game_state = 'UNFINISHED'
 
+    def reset(self):
+        """Returns the game to the starting position, reusing its board storage. Moves made before are forgotten."""
+        self.set_board()
+        self._player_turn = 'WHITE'
+        self._game_state = 'UNFINISHED'
+        self._undo_stack.clear()
+        self._piece_inventory.clear()
+        self.update_piece_inventory()
+
     def set_board(self):
         """Populates the chessboard data member with ChessPiece Objects"""
 
-        # Populate blank spaces for every square of the chessboard
-        columns = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
-        for row in range(8, 0, -1):
-            for column in columns:
-                self._chessboard[str(column) + str(row)] = None
-
-        # Generate Black Pawns
-        for column in columns:
-            self._chessboard[str(column) + '7'] = Pawn('BLACK', self)
-
-        # Generate Black Knights
-        self._chessboard['b8'] = Knight('BLACK')
-        self._chessboard['g8'] = Knight('BLACK')
+        # Clear every square of the chessboard
+        self._clear_board()
+
+        # Back rank layout shared by both colors, from column a to column h
+        back_rank = ['R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R']
+
+        # Generate Black pieces on rows 8 and 7, then White pieces on rows 1 and 2
+        for column, letter in enumerate(back_rank):
+            self._place_piece(PIECE_INDEX['B' + letter], 56 + column)
+            self._place_piece(PIECE_INDEX['BP'], 48 + column)
+            self._place_piece(PIECE_INDEX['W' + letter], column)
+            self._place_piece(PIECE_INDEX['WP'], 8 + column)
+
+    def _clear_board(self):
+        """Empties every square in place, so lists returned by get_bitboards and get_mailbox stay current"""
+        for piece in range(12):
+            self._bitboards[piece] = 0
+        self._occupancy[0] = self._occupancy[1] = 0
+        for square in range(64):
+            self._mailbox[square] = None
+        self._hash = 0
+
+    def _place_piece(self, piece, square):
+        """Puts the piece with the given bitboard index on an empty square"""
+        bit = 1 << square
+        self._bitboards[piece] |= bit
+        self._occupancy[piece // 6] |= bit
+        self._mailbox[square] = piece
+        self._hash ^= ZOBRIST_PIECES[piece][square]
+
+    @classmethod
+    def from_position(cls, position):
+        """
+        Creates a game directly at a position, without replaying moves
 
-        # Generate Black Bishops
-        self._chessboard['c8'] = Bishop('BLACK')
-        self._chessboard['f8'] = Bishop('BLACK')
+        :param position: a position string or 33 position bytes, as returned by to_position
+        :return: a ChessVar object at that position
+        """
+        game = cls()
+        game.set_position(position)
+        return game
 
-        # Generate Black Rooks
-        self._chessboard['a8'] = Rook('BLACK')
-        self._chessboard['h8'] = Rook('BLACK')
+    def set_position(self, position):
+        """
+        Replaces the current position, reusing the game's board storage. Moves made before are forgotten.
 
-        # Generate Black Queen
-        self._chessboard['d8'] = Queen('BLACK')
+        :param position: a position string such as START_POSITION, or the 33 bytes returned by to_position(True)
+        """
+        if isinstance(position, (bytes, bytearray, memoryview)):
+            placement, turn, game_state = self._decode_position_bytes(position)
+        else:
+            placement, turn, game_state = self._decode_position_text(position)
 
-        # Generate Black King
-        self._chessboard['e8'] = King('BLACK')
+        self._clear_board()
+        for square in range(64):
+            if placement[square] is not None:
+                self._place_piece(placement[square], square)
 
-        # Generate White Pawns
-        for column in columns:
-            self._chessboard[str(column) + '2'] = Pawn('WHITE', self)
+        self._player_turn = 'WHITE'
+        if turn == 'BLACK':
+            self.swap_player_turn()
+        self._game_state = game_state
+        self._undo_stack.clear()
 
-        # Generate White Knights
-        self._chessboard['b1'] = Knight('WHITE')
-        self._chessboard['g1'] = Knight('WHITE')
+        # Only piece types on the board are in play, so a type that starts at 0 cannot end the game
+        self._piece_inventory.clear()
+        self.update_piece_inventory()
 
-        # Generate White Bishops
-        self._chessboard['c1'] = Bishop('WHITE')
-        self._chessboard['f1'] = Bishop('WHITE')
+    @staticmethod
+    def _decode_position_text(position):
+        """Parses a position string into (list of 64 bitboard indexes or None, player turn, game state)"""
+        fields = position.split()
+        rows = fields[0].split('/') if fields else []
+        if len(fields) != 3 or len(rows) != 8 or fields[1] not in ('w', 'b') or fields[2] not in ('-', 'W', 'B'):
+            raise ValueError('Invalid position: {!r}'.format(position))
+
+        placement = [None] * 64
+        for row_number, row in enumerate(rows):
+            square = (7 - row_number) * 8
+            row_end = square + 8
+            for letter in row:
+                if letter in '12345678':
+                    square += int(letter)
+                elif letter in POSITION_LETTERS and square < row_end:
+                    placement[square] = POSITION_LETTERS.index(letter)
+                    square += 1
+                else:
+                    raise ValueError('Invalid position: {!r}'.format(position))
+            if square != row_end:
+                raise ValueError('Invalid position: {!r}'.format(position))
+
+        turn = 'WHITE' if fields[1] == 'w' else 'BLACK'
+        game_state = GAME_STATES['-WB'.index(fields[2])]
+        return placement, turn, game_state
+
+    @staticmethod
+    def _decode_position_bytes(position):
+        """Parses 33 position bytes into (list of 64 bitboard indexes or None, player turn, game state)"""
+        if len(position) != POSITION_BYTES or position[32] >> 3 or (position[32] >> 1) > 2:
+            raise ValueError('Invalid position bytes')
+
+        placement = [None] * 64
+        for index in range(32):
+            for square, code in ((2 * index, position[index] & 15), (2 * index + 1, position[index] >> 4)):
+                if code > 12:
+                    raise ValueError('Invalid position bytes')
+                if code:
+                    placement[square] = code - 1
+
+        turn = 'BLACK' if position[32] & 1 else 'WHITE'
+        return placement, turn, GAME_STATES[position[32] >> 1]
+
+    def to_position(self, binary=False):
+        """
+        Returns the current position (piece placement, player turn and game state) in a compact form
+
+        :param binary: if False, returns a FEN-style string such as START_POSITION: the rows from 8 to 1 separated by
+                       '/', with digits counting empty squares, then 'w' or 'b' for the player turn, then '-' for an
+                       unfinished game or 'W'/'B' for the winner. If True, returns 33 bytes: one 4-bit piece code per
+                       square (0 for empty, otherwise bitboard index + 1, low half first, a1 to h8), then a byte
+                       holding the player turn in bit 0 and the game state in bits 1-2.
+        :return: a position string or bytes accepted by from_position and set_position
+        """
+        mailbox = self._mailbox
+        if binary:
+            position = bytearray(POSITION_BYTES)
+            for index in range(32):
+                low = mailbox[2 * index]
+                high = mailbox[2 * index + 1]
+                position[index] = (0 if low is None else low + 1) | ((0 if high is None else high + 1) << 4)
+            position[32] = (self._player_turn == 'BLACK') | (GAME_STATES.index(self._game_state) << 1)
+            return bytes(position)
+
+        rows = []
+        for row in range(7, -1, -1):
+            text = ''
+            empty = 0
+            for piece in mailbox[row * 8:row * 8 + 8]:
+                if piece is None:
+                    empty += 1
+                else:
+                    if empty:
+                        text += str(empty)
+                        empty = 0
+                    text += POSITION_LETTERS[piece]
+            if empty:
+                text += str(empty)
+            rows.append(text)
+        return '/'.join(rows) + ' ' + TURN_LETTERS[self._player_turn] + ' ' + STATE_LETTERS[self._game_state]
 
-        # Generate White Rooks
-        self._chessboard['a1'] = Rook('WHITE')
-        self._chessboard['h1'] = Rook('WHITE')
+    def get_board(self):
+        """Returns a read-only, dictionary-compatible view of the chessboard"""
+        return self._chessboard
 
-        # Generate White Queen
-        self._chessboard['d1'] = Queen('WHITE')
+    def get_bitboards(self):
+        """Returns the list of twelve bitboards in PIECE_NAMES order. The list is updated in place as moves are made."""
+        return self._bitboards
 
-        # Generate White King
-        self._chessboard['e1'] = King('WHITE')
+    def get_mailbox(self):
+        """Returns the list of 64 bitboard indexes (None for empty squares). The list is updated in place."""
+        return self._mailbox
 
-    def get_board(self):
-        """Returns the chessboard dictionary"""
-        return self._chessboard
+    def get_occupancy(self):
+        """Returns the [White, Black] list of occupied-square bitboards. The list is updated in place."""
+        return self._occupancy
 
     def display_board(self):
         """Displays the current chessboard arrangement to the user"""
@@ -532,28 +930,32 @@ class ChessVar:
         # If piece_inventory is empty, initialize key-value pairs with piece name as keys
         if self._piece_inventory == {}:
 
-            name_list = []
-
-            # Generate list of piece names to use as keys
-            for piece in self._chessboard.values():
-                if piece and piece.get_name() not in name_list:
-                    name_list.append(piece.get_name())
-
-            # Sort the name list in alphabetical order
-            name_list.sort()
+            # Generate list of piece names to use as keys, sorted in alphabetical order
+            name_list = sorted(name for name, bitboard in zip(PIECE_NAMES, self._bitboards) if bitboard)
 
             # Initialize each value in dictionary to 0
             for name in name_list:
                 self._piece_inventory[name] = 0
 
-        # Set existing counts in the dictionary to 0
-        for piece in self._piece_inventory:
-            self._piece_inventory[piece] = 0
+        # Recount existing ChessPiece objects on chessboard, one population count per bitboard
+        for name in self._piece_inventory:
+            self._piece_inventory[name] = self._bitboards[PIECE_INDEX[name]].bit_count()
+
+    def validate_piece_inventory(self):
+        """
+        Recounts every piece on the chessboard and compares the result with the piece_inventory data member. The
+        inventory is kept up to date incrementally by make_move, so this full recount is only meant for debugging.
+
+        :return: True if the piece_inventory counts match the chessboard. False otherwise.
+        """
+        for name, count in self._piece_inventory.items():
+            if self._bitboards[PIECE_INDEX[name]].bit_count() != count:
+                return False
+        return True
 
-        # Recount existing ChessPiece objects on chessboard
-        for piece in self._chessboard.values():
-            if piece:
-                self._piece_inventory[piece.get_name()] = self._piece_inventory[piece.get_name()] + 1
+    def get_piece_inventory(self):
+        """Returns the piece_inventory dictionary"""
+        return self._piece_inventory
 
     def display_piece_inventory(self):
         """Displays the piece_inventory dictionary to the user"""
@@ -569,12 +971,13 @@ class ChessVar:
             self._player_turn = 'BLACK'
         else:
             self._player_turn = 'WHITE'
+        self._hash ^= ZOBRIST_BLACK_TO_MOVE
 
     def get_game_state(self):
         """Returns the value of the game_state data member"""
         return self._game_state
 
-    def current_player_wins(self):
+    def current_player_wins(self, display=True):
         """Sets game_state data member to 'WHITE_WON' if it is white's turn or 'BLACK_WON' if it is black's turn"""
         if self._player_turn == 'WHITE':
             self._game_state = 'WHITE_WON'
@@ -582,22 +985,32 @@ class ChessVar:
             self._game_state = 'BLACK_WON'
 
         # Display the game state to show who won
-        print(self.get_game_state())
+        if display:
+            print(self.get_game_state())
+
+    def forfeit(self, display=True, player=None):
+        """
+        Sets game_state data member to 'BLACK_WON' if white forfeits or 'WHITE_WON' if black forfeits
 
-    def forfeit(self):
-        """Sets game_state data member to 'BLACK_WON' if it is white's turn or 'WHITE_WON' if it is black's turn"""
+        :param display: if True, prints the game state
+        :param player: 'WHITE' or 'BLACK', the player who forfeits. Defaults to the player who has the turn.
+        """
+        if player is None:
+            player = self._player_turn
         if self._game_state == 'UNFINISHED':
-            if self._player_turn == 'WHITE':
+            if player == 'WHITE':
                 self._game_state = 'BLACK_WON'
             else:
                 self._game_state = 'WHITE_WON'
 
             # Display the game state to show who won
-            print(self.get_game_state())
+            if display:
+                print(self.get_game_state())
 
     def make_move(self, source, destination):
         """
-        Takes a piece's source square and proposed destination and moves the piece if it is a legal move
+        Takes a piece's source square and proposed destination and moves the piece if it is a legal move. Displays why
+        the move was rejected if it is illegal.
 
         :param source: a string representing the current grid location of the piece to be moved
                               Example: '2a'   - not case-sensitive
@@ -605,84 +1018,265 @@ class ChessVar:
                               Example: '3a'   - not case-sensitive
         :return: True if move is legal. False if move is illegal.
                  Updates the chessboard dictionary if move is legal
-                 Updates the piece_inventory dictionary if a piece was taken
+                 Decrements the captured piece's count in the piece_inventory dictionary if a piece was taken
         """
+        result = self.try_move(source, destination)
 
-        # Convert entered string to lowercase to avoid case sensitivity problems
-        source = source.lower()
-        destination = destination.lower()
+        if result != MoveResult.OK:
+            print(MOVE_RESULT_MESSAGES[result])
+            if result == MoveResult.GAME_OVER:
+                print(self.get_game_state())
+            return False
 
-        # Check if game has already been won
+        # Display the game state to show who won if the move was a winning move
         if self._game_state != 'UNFINISHED':
-            print('This game has already been won!')
             print(self.get_game_state())
-            return False
 
-        # Check that source and destination entries are actually board spaces
-        # Entries can only be 2 character strings
-        if len(source) != 2 or len(destination) != 2:
-            print("One or both of your move entries is invalid.")
-            return False
+        return True
+
+    def try_move(self, source, destination):
+        """
+        Takes a piece's source square and proposed destination and moves the piece if it is a legal move, without
+        displaying anything
+
+        :param source: a string representing the current grid location of the piece to be moved - not case-sensitive
+        :param destination: a string representing the proposed destination of the piece to be moved
+        :return: MoveResult.OK if the move was made, otherwise the MoveResult code saying why it was rejected
+        """
+
+        # Check if game has already been won
+        if self._game_state != 'UNFINISHED':
+            return MoveResult.GAME_OVER
+
+        # Check that source and destination entries are actually board spaces. This is the only place the entries are
+        # parsed; every later check works on square indexes.
+        source_square = SQUARE_LOOKUP.get(source)
+        destination_square = SQUARE_LOOKUP.get(destination)
+        if source_square is None or destination_square is None:
+            return MoveResult.INVALID_SQUARE
+
+        return self.make_move_idx(source_square, destination_square)
 
-        # Store row and column values
-        source_column = source[0]
-        source_row = source[1]
-        destination_column = destination[0]
-        destination_row = destination[1]
+    def make_move_idx(self, source, destination):
+        """
+        Moves the piece on the source square to the destination square if it is a legal move, without displaying
+        anything. Takes square indexes instead of algebraic strings.
+
+        :param source: the index (0-63, a1 = 0, h8 = 63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
+        :return: MoveResult.OK if the move was made, otherwise the MoveResult code saying why it was rejected
+        """
+
+        # Check if game has already been won
+        if self._game_state != 'UNFINISHED':
+            return MoveResult.GAME_OVER
 
         # Check that source and destination entries are actually board spaces
-        # Columns must be between a and h (inclusive). Rows must be between 1 and 8 (inclusive).
-        if source_column < 'a' or source_column > 'h' or destination_column < 'a' or destination_column > 'h' or \
-                destination_row < '1' or destination_row > '8' or source_row < '1' or source_row > '8':
-            print("One or both of your move entries is invalid.")
-            return False
+        if not (0 <= source < 64 and 0 <= destination < 64):
+            return MoveResult.INVALID_SQUARE
+
+        piece = self._mailbox[source]
 
         # Check that a piece was selected
-        if not self._chessboard[source]:
-            print("You didn't select a piece to move. Try a different move.")
-            return False
+        if piece is None:
+            return MoveResult.EMPTY_SOURCE
 
         # Check that the player selected their own piece
-        if self._player_turn != self._chessboard[source].get_color():
-            print("You can't move the other player's piece. Try a different move.")
-            return False
+        if COLOR_INDEX[self._player_turn] != piece // 6:
+            return MoveResult.WRONG_COLOR
 
         # Check that the source and destination positions are different
         if source == destination:
-            print("You didn't actually move the piece. Try a different move.")
-            return False
+            return MoveResult.NO_MOVE
 
         # Determine if the selected piece can actually make the proposed move
-        if not self._chessboard[source].legal_move(source, destination):
-            print("That move isn't legal for this piece. Try a different move.")
-            return False
+        if not self._pieces[piece].legal_move(source, destination, self._mailbox):
+            return MoveResult.ILLEGAL_GEOMETRY
 
         # Determine if the player tried to move through other chess pieces. Only the Knight can do this.
-        if self._chessboard[source].get_type() != 'KNIGHT' and \
-                not self.spaces_between_source_and_destination_clear(source, destination):
-            print("You tried to move through other chess pieces. Only the Knight can do that. Try a different move")
-            return False
+        if not self.spaces_between_source_and_destination_clear(source, destination):
+            return MoveResult.BLOCKED
 
         # Check that the player does not try to remove their own piece from the board
-        if self._chessboard[destination] and self._player_turn == self._chessboard[destination].get_color():
-            print("You can't remove your own piece from the board. Try a different move.")
-            return False
+        if (self._occupancy[piece // 6] >> destination) & 1:
+            return MoveResult.OWN_PIECE
 
         # If all previous tests pass, the move is legal
-        # Make the move and update the chessboard
-        self._chessboard[destination] = self._chessboard[source]
-        self._chessboard[source] = None
+        # Make the move, update the chessboard and piece inventory, and give turn to the other player
+        self.push((source << 6) | destination)
+        return MoveResult.OK
 
-        # See if the move was a winning move by updating the piece inventory and seeing if any class of ChessPiece was
-        # completely removed from the board
-        self.update_piece_inventory()
-        if 0 in self._piece_inventory.values():
-            self.current_player_wins()
+    def push(self, move):
+        """
+        Makes a move without validating it or displaying anything, and records what is needed to take it back with pop.
+        Intended for search and simulation, where the move comes from legal_moves.
+
+        :param move: a legal move encoded as (source << 6) | destination, as returned by legal_moves
+        """
+        previous_hash = self._hash
+        captured = self._move_piece(move >> 6, move & 63)
+
+        if captured is None:
+            self._undo_stack.append((move, None, 0, self._game_state, previous_hash))
+        else:
+            # See if the move was a winning move. Only the captured piece's count can change, so decrement it and see
+            # if that class of ChessPiece was completely removed from the board
+            captured_name = PIECE_NAMES[captured]
+            count = self._piece_inventory[captured_name]
+            self._undo_stack.append((move, captured, count, self._game_state, previous_hash))
+            self._piece_inventory[captured_name] = count - 1
+            if count == 1:
+                self._game_state = self._player_turn + '_WON'
 
         # Give turn to the other player
         self.swap_player_turn()
 
-        return True
+    def pop(self):
+        """
+        Takes back the last move made with push or make_move, restoring the chessboard, piece inventory, player turn
+        and game state.
+
+        :return: the move that was taken back, encoded as (source << 6) | destination
+        """
+        move, captured, count, game_state, previous_hash = self._undo_stack.pop()
+        source = move >> 6
+        destination = move & 63
+        piece = self._mailbox[destination]
+        move_mask = (1 << source) | (1 << destination)
+
+        # Return the moved piece to its source square
+        self._bitboards[piece] ^= move_mask
+        self._occupancy[piece // 6] ^= move_mask
+        self._mailbox[source] = piece
+        self._mailbox[destination] = captured
+
+        # Put back the captured piece and its previous count
+        if captured is not None:
+            self._bitboards[captured] |= 1 << destination
+            self._occupancy[captured // 6] |= 1 << destination
+            self._piece_inventory[PIECE_NAMES[captured]] = count
+
+        self._game_state = game_state
+        self.swap_player_turn()
+        self._hash = previous_hash
+
+        return move
+
+    def get_hash(self):
+        """Returns the 64-bit Zobrist hash of the current position (piece placement and player turn)"""
+        return self._hash
+
+    def validate_hash(self):
+        """
+        Recomputes the Zobrist hash from scratch and compares the result with the incrementally updated hash. Only
+        meant for debugging.
+
+        :return: True if the incremental hash matches the recomputed hash. False otherwise.
+        """
+        full_hash = ZOBRIST_BLACK_TO_MOVE if self._player_turn == 'BLACK' else 0
+        for square, piece in enumerate(self._mailbox):
+            if piece is not None:
+                full_hash ^= ZOBRIST_PIECES[piece][square]
+        return full_hash == self._hash
+
+    def _move_piece(self, source, destination):
+        """
+        Moves the piece on the source square to the destination square, removing any piece already there
+
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the destination square
+        :return: the bitboard index of the captured piece, or None if the destination square was empty
+        """
+        piece = self._mailbox[source]
+        captured = self._mailbox[destination]
+        move_mask = (1 << source) | (1 << destination)
+
+        # Remove the captured piece from its bitboard and from the opponent's occupancy
+        if captured is not None:
+            self._bitboards[captured] ^= 1 << destination
+            self._occupancy[captured // 6] ^= 1 << destination
+            self._hash ^= ZOBRIST_PIECES[captured][destination]
+
+        # Lift the moving piece off the source square and drop it on the destination square
+        self._bitboards[piece] ^= move_mask
+        self._occupancy[piece // 6] ^= move_mask
+        self._mailbox[destination] = piece
+        self._mailbox[source] = None
+        self._hash ^= ZOBRIST_PIECES[piece][source] ^ ZOBRIST_PIECES[piece][destination]
+
+        return captured
+
+    def legal_moves(self, captures_only=False):
+        """
+        Returns every legal move for the player who has the current turn. Moves follow this variant's rules: there is
+        no castling, en passant or pawn promotion, and no check, so a king may move onto an attacked square.
+
+        :param captures_only: if True, only moves that capture an opponent's piece are returned
+        :return: a list of moves encoded as (source << 6) | destination, where source and destination are square
+                 indexes (a1 = 0, h8 = 63). Use move_to_algebraic to convert a move to algebraic notation.
+                 The list is empty once the game is over.
+        """
+        if self._game_state != 'UNFINISHED':
+            return []
+
+        color = COLOR_INDEX[self._player_turn]
+        bitboards = self._bitboards
+        own = self._occupancy[color]
+        enemy = self._occupancy[1 - color]
+        empty = 0 if captures_only else FULL_BOARD ^ (own | enemy)
+        targets = enemy if captures_only else FULL_BOARD ^ own
+        occupied = own | enemy
+        first = color * 6
+        moves = []
+
+        # Pawns push one square, or two from their starting row through an empty square, and capture diagonally
+        pawns = bitboards[first]
+        if color == 0:
+            single_pushes = (pawns << 8) & empty
+            double_pushes = ((single_pushes & ROW_3) << 8) & empty
+            push_offset = 8
+        else:
+            single_pushes = (pawns >> 8) & empty
+            double_pushes = ((single_pushes & ROW_6) >> 8) & empty
+            push_offset = -8
+        while single_pushes:
+            destination = (single_pushes & -single_pushes).bit_length() - 1
+            single_pushes &= single_pushes - 1
+            moves.append(((destination - push_offset) << 6) | destination)
+        while double_pushes:
+            destination = (double_pushes & -double_pushes).bit_length() - 1
+            double_pushes &= double_pushes - 1
+            moves.append(((destination - 2 * push_offset) << 6) | destination)
+        pawn_attacks = PAWN_ATTACKS[color]
+        while pawns:
+            source = (pawns & -pawns).bit_length() - 1
+            pawns &= pawns - 1
+            self._append_moves(moves, source, pawn_attacks[source] & enemy)
+
+        # Knights and kings jump using the precomputed tables, sliders walk the ray tables up to the first blocker
+        for offset, table in ((1, KNIGHT_ATTACKS), (5, KING_ATTACKS)):
+            pieces = bitboards[first + offset]
+            while pieces:
+                source = (pieces & -pieces).bit_length() - 1
+                pieces &= pieces - 1
+                self._append_moves(moves, source, table[source] & targets)
+        for offset, directions in ((2, BISHOP_DIRECTIONS), (3, ROOK_DIRECTIONS), (4, QUEEN_DIRECTIONS)):
+            pieces = bitboards[first + offset]
+            while pieces:
+                source = (pieces & -pieces).bit_length() - 1
+                pieces &= pieces - 1
+                self._append_moves(moves, source, sliding_attacks(source, occupied, directions) & targets)
+
+        return moves
+
+    @staticmethod
+    def _append_moves(moves, source, destinations):
+        """Appends a move from the source square to every square set in the destinations bitboard"""
+        source <<= 6
+        while destinations:
+            destination = (destinations & -destinations).bit_length() - 1
+            destinations &= destinations - 1
+            moves.append(source | destination)
 
     def make_move_and_display_board(self, source, destination):
         """Calls the make_move and display_board methods if the user wants to automatically display the board"""
@@ -693,72 +1287,12 @@ class ChessVar:
         """
         Determines if the spaces in between the source and destination squares are clear.
 
-        :param source: a string representing the current grid location of the piece to be moved
-        :param destination: a string representing the proposed destination of the piece to be moved
+        :param source: the index (0-63) of the square holding the piece to be moved
+        :param destination: the index (0-63) of the proposed destination square
         :return: True if the spaces are clear. False if any of the spaces are not clear.
         """
 
-        # Store row and column values, use ord function to convert column character to ASCII integer
-        source_column = ord(source[0])
-        source_row = int(source[1])
-        destination_column = ord(destination[0])
-        destination_row = int(destination[1])
-
         # Determine if there is a chess piece in between source square and destination square
-        # The Knight is the only piece that can move through (jump over) other chess pieces
-
-        # Vertical move forward (1 to 8)
-        if (source_column - destination_column) == 0 and (destination_row - source_row) > 0:
-            for row in range(1, destination_row - source_row):
-                if self._chessboard[chr(source_column) + str(source_row + row)]:
-                    return False
-            return True
-
-        # Vertical move backward (8 to 1)
-        if (source_column - destination_column) == 0 and (source_row - destination_row) > 0:
-            for row in range(1, source_row - destination_row):
-                if self._chessboard[chr(source_column) + str(source_row - row)]:
-                    return False
-            return True
-
-        # Horizontal move right (a to h)
-        if (source_row - destination_row) == 0 and (destination_column - source_column) > 0:
-            for column in range(1, destination_column - source_column):
-                if self._chessboard[chr(source_column + column) + str(source_row)]:
-                    return False
-            return True
-
-        # Horizontal move left (h to a)
-        if (source_row - destination_row) == 0 and (source_column - destination_column) > 0:
-            for column in range(1, source_column - destination_column):
-                if self._chessboard[chr(source_column - column) + str(source_row)]:
-                    return False
-            return True
-
-        # Diagonal move forward right (1 to 8) and (a to h)
-        if (destination_row - source_row) > 0 and (destination_column - source_column) > 0:
-            for square in range(1, destination_row - source_row):
-                if self._chessboard[chr(source_column + square) + str(source_row + square)]:
-                    return False
-            return True
-
-        # Diagonal move forward left (1 to 8) and (h to a)
-        if (destination_row - source_row) > 0 and (source_column - destination_column) > 0:
-            for square in range(1, destination_row - source_row):
-                if self._chessboard[chr(source_column - square) + str(source_row + square)]:
-                    return False
-            return True
-
-        # Diagonal move backward right (8 to 1) and (a to h)
-        if (source_row - destination_row) > 0 and (destination_column - source_column) > 0:
-            for square in range(1, source_row - destination_row):
-                if self._chessboard[chr(source_column + square) + str(source_row - square)]:
-                    return False
-            return True
-
-        # Diagonal move backward left (8 to 1) and (h to a)
-        if (source_row - destination_row) > 0 and (source_column - destination_column) > 0:
-            for square in range(1, source_row - destination_row):
-                if self._chessboard[chr(source_column - square) + str(source_row - square)]:
-                    return False
-            return True
+        # The Knight is the only piece that can move through (jump over) other chess pieces, and a Knight's move
+        # never has squares in between
+        return not BETWEEN[source][destination] & (self._occupancy[0] | self._occupancy[1])
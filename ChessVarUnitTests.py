@@ -3,16 +3,21 @@
 # Date: 11/27/2023
 # Description: Unit Tests for ChessVar.py
 
+import contextlib
+import copy
+import io
+import pickle
+import random
 import unittest
-from ChessVar import ChessVar, Pawn, Knight, Bishop, Rook, Queen, King
+from ChessVar import ChessVar, MoveResult, Pawn, Knight, Bishop, Rook, Queen, King, SQUARE_NAMES, SQUARE_LOOKUP, \
+    START_POSITION, move_to_algebraic
+from ChessPerft import TEST_POSITIONS, setup_position, perft, divide
 
 class MyTestCase(unittest.TestCase):
 
     def test_piece_init_get_methods(self):
 
-        game = ChessVar()
-
-        pawn = Pawn('BLACK', game)
+        pawn = Pawn('BLACK')
         knight = Knight('BLACK')
         bishop = Bishop('BLACK')
         rook = Rook('BLACK')
@@ -32,6 +37,24 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(king.get_name(), 'BK')
         self.assertEqual(king.get_type(), 'KING')
 
+    def test_piece_flyweights(self):
+        game = ChessVar()
+        other = ChessVar()
+
+        # One shared, immutable object per class and color
+        self.assertIs(Knight('WHITE'), Knight('WHITE'))
+        self.assertIsNot(Knight('WHITE'), Knight('BLACK'))
+        self.assertIsNot(Knight('WHITE'), Bishop('WHITE'))
+        self.assertIs(game.get_board()['b1'], other.get_board()['g1'])
+        self.assertFalse(hasattr(Queen('WHITE'), '__dict__'))
+        with self.assertRaises(AttributeError):
+            Queen('WHITE')._color = 'BLACK'
+        self.assertEqual(Queen('WHITE').get_color(), 'WHITE')
+
+        # Copies and pickles of a game keep using the shared objects
+        self.assertIs(copy.deepcopy(game).get_board()['e2'], Pawn('WHITE'))
+        self.assertIs(pickle.loads(pickle.dumps(King('BLACK'))), King('BLACK'))
+
     def test_ChessVar_init_get_methods(self):
 
         game = ChessVar()
@@ -39,6 +62,23 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(game.get_player_turn(), "WHITE")
         self.assertEqual(game.get_game_state(), "UNFINISHED")
 
+    def test_board_view(self):
+
+        game = ChessVar()
+        board = game.get_board()
+
+        self.assertEqual(len(board), 64)
+        self.assertEqual(list(board)[0], 'a8')  # Board is still iterated from a8 down to h1
+        self.assertEqual(board['d1'].get_name(), 'WQ')
+        self.assertIsNone(board['e4'])
+        self.assertEqual(sum(1 for piece in board.values() if piece), 32)
+        with self.assertRaises(TypeError):
+            board['e4'] = board['e2']  # The view is read-only
+
+        game.make_move('e2', 'e4')
+        self.assertEqual(board['e4'].get_name(), 'WP')  # The view reflects moves made after it was returned
+        self.assertIsNone(board['e2'])
+
     def test_forfeit(self):
 
         game = ChessVar()
@@ -46,6 +86,11 @@ class MyTestCase(unittest.TestCase):
         game.forfeit()
         self.assertEqual(game.get_game_state(), 'BLACK_WON')
 
+        # Either player can forfeit, not only the player who has the turn
+        game = ChessVar()
+        game.forfeit(display=False, player='BLACK')
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+
     def test_make_move(self):
 
         game = ChessVar()
@@ -56,6 +101,45 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(game.get_player_turn(),'BLACK')
         self.assertFalse(game.make_move('a3', 'a4'))  # Black tries to move White's piece
 
+    def test_try_move(self):
+        game = ChessVar()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(game.try_move('i2', 'a3'), MoveResult.INVALID_SQUARE)
+            self.assertEqual(game.try_move('a2', 'a33'), MoveResult.INVALID_SQUARE)
+            self.assertEqual(game.try_move('a3', 'a6'), MoveResult.EMPTY_SOURCE)
+            self.assertEqual(game.try_move('a7', 'a6'), MoveResult.WRONG_COLOR)
+            self.assertEqual(game.try_move('a2', 'a2'), MoveResult.NO_MOVE)
+            self.assertEqual(game.try_move('b1', 'b3'), MoveResult.ILLEGAL_GEOMETRY)
+            self.assertEqual(game.try_move('a1', 'a3'), MoveResult.BLOCKED)
+            self.assertEqual(game.try_move('d1', 'd2'), MoveResult.OWN_PIECE)
+            self.assertEqual(game.try_move('G1', 'f3'), MoveResult.OK)
+            self.assertEqual(game.get_player_turn(), 'BLACK')
+            game.forfeit(display=False)
+            self.assertEqual(game.try_move('b8', 'c6'), MoveResult.GAME_OVER)
+        self.assertEqual(output.getvalue(), '')  # try_move never displays anything
+
+        # make_move still explains why a move was rejected
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(ChessVar().make_move('a1', 'a3'))
+        self.assertIn('move through other chess pieces', output.getvalue())
+
+    def test_square_indexes(self):
+        self.assertEqual(SQUARE_LOOKUP['a1'], 0)
+        self.assertEqual(SQUARE_LOOKUP['H8'], 63)
+        self.assertEqual(SQUARE_LOOKUP['E4'], SQUARE_LOOKUP['e4'])
+        self.assertEqual(len(SQUARE_LOOKUP), 128)  # Lower and upper case spelling of every square
+
+        game = ChessVar()
+        self.assertEqual(game.make_move_idx(SQUARE_LOOKUP['b1'], SQUARE_LOOKUP['b3']), MoveResult.ILLEGAL_GEOMETRY)
+        self.assertEqual(game.make_move_idx(12, 64), MoveResult.INVALID_SQUARE)
+        self.assertEqual(game.make_move_idx(12, 28), MoveResult.OK)  # e2 to e4
+        self.assertEqual(game.get_board()['e4'].get_name(), 'WP')
+        self.assertEqual(game.make_move_idx(51, 35), MoveResult.OK)  # d7 to d5
+        self.assertEqual(game.make_move_idx(28, 37), MoveResult.ILLEGAL_GEOMETRY)  # e4 to f5 captures nothing
+        self.assertEqual(game.make_move_idx(28, 35), MoveResult.OK)  # e4 takes d5
+        self.assertEqual(game.get_piece_inventory()['BP'], 7)
+
     def test_pawn_move(self):
         game = ChessVar()
         self.assertFalse(game.make_move('a2', 'b3')) # White tries to move diagonal without capturing
@@ -96,6 +180,22 @@ class MyTestCase(unittest.TestCase):
         game.make_move('d4', 'c6')
         self.assertEqual(game.get_game_state(), 'WHITE_WON') # White takes both black knights and wins
 
+    def test_piece_inventory(self):
+        game = ChessVar()
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5'), ('b1', 'c3')]:
+            game.make_move(source, destination)
+        self.assertEqual(game._piece_inventory['WP'], 7)  # Only the captured pieces' counts change
+        self.assertEqual(game._piece_inventory['BP'], 7)
+        self.assertEqual(game._piece_inventory['BQ'], 1)
+        self.assertTrue(game.validate_piece_inventory())
+        self.assertEqual(game.get_game_state(), 'UNFINISHED')
+        game.make_move('d5', 'd2')  # Black queen takes a pawn
+        game.make_move('d1', 'd2')  # White queen takes the only black queen
+        self.assertEqual(game._piece_inventory['BQ'], 0)
+        self.assertEqual(game._piece_inventory['WP'], 6)
+        self.assertTrue(game.validate_piece_inventory())
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+
     def test_bishop_move(self):
         game = ChessVar()
         self.assertFalse(game.make_move('c1', 'h6')) # Bishop can't move through pawns
@@ -156,5 +256,142 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(game.make_move('h6', 'h5'))  # Black pawn moves 1 space
         self.assertTrue(game.make_move('d4', 'e4')) # King moves horizontally and takes pawn
 
+    def test_legal_moves(self):
+        game = ChessVar()
+        self.assertEqual(len(game.legal_moves()), 20)  # 16 pawn moves and 4 knight moves
+        self.assertIn(('e2', 'e4'), [move_to_algebraic(move) for move in game.legal_moves()])
+
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('f1', 'b5'), ('c7', 'c6'), ('g1', 'f3')]:
+            game.make_move(source, destination)
+
+        # Every generated move must be accepted by make_move, and every move make_move accepts must be generated
+        accepted = set()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for source in SQUARE_NAMES:
+                for destination in SQUARE_NAMES:
+                    if copy.deepcopy(game).make_move(source, destination):
+                        accepted.add((source, destination))
+        self.assertEqual({move_to_algebraic(move) for move in game.legal_moves()}, accepted)
+
+        game.forfeit()
+        self.assertEqual(game.legal_moves(), [])  # No legal moves once the game is over
+
+    def test_push_pop(self):
+        game = ChessVar()
+        start = (list(game._bitboards), list(game._mailbox), dict(game._piece_inventory), game.get_player_turn())
+        rng = random.Random(7)
+
+        # Play random moves until someone wins, then take every move back
+        played = []
+        while game.legal_moves():
+            move = rng.choice(game.legal_moves())
+            game.push(move)
+            played.append(move)
+        self.assertNotEqual(game.get_game_state(), 'UNFINISHED')
+        self.assertTrue(game.validate_piece_inventory())
+
+        while played:
+            self.assertEqual(game.pop(), played.pop())
+        self.assertEqual(game.get_game_state(), 'UNFINISHED')
+        self.assertEqual((game._bitboards, game._mailbox, game._piece_inventory, game.get_player_turn()), start)
+
+        # Moves made with make_move can be taken back as well
+        self.assertTrue(game.make_move('b1', 'c3'))
+        game.pop()
+        self.assertEqual(game.get_board()['b1'].get_name(), 'WN')
+        self.assertEqual(game.get_player_turn(), 'WHITE')
+
+    def test_zobrist_hash(self):
+        game = ChessVar()
+        other = ChessVar()
+        start_hash = game.get_hash()
+
+        # The same position reached through different move orders has the same hash
+        for source, destination in [('g1', 'f3'), ('g8', 'f6'), ('b1', 'c3'), ('b8', 'c6')]:
+            game.make_move(source, destination)
+        for source, destination in [('b1', 'c3'), ('b8', 'c6'), ('g1', 'f3'), ('g8', 'f6')]:
+            other.make_move(source, destination)
+        self.assertEqual(game.get_hash(), other.get_hash())
+        self.assertNotEqual(game.get_hash(), start_hash)
+
+        # The player turn is part of the hash
+        game.make_move('f3', 'g5')
+        game.make_move('f6', 'g8')
+        game.make_move('g5', 'f3')
+        self.assertNotEqual(game.get_hash(), other.get_hash())
+
+        rng = random.Random(3)
+        while game.legal_moves():
+            game.push(rng.choice(game.legal_moves()))
+            self.assertTrue(game.validate_hash())
+        while len(game._undo_stack) > 0:
+            game.pop()
+        self.assertEqual(game.get_hash(), start_hash)
+
+    def test_perft(self):
+        # Shallow depths of every stored reference count; run ChessPerft.py --depth 4 for the full suite
+        for name, moves, reference_counts in TEST_POSITIONS:
+            game = setup_position(moves)
+            position = game.get_hash()
+            for depth, expected in enumerate(reference_counts[:3], start=1):
+                self.assertEqual(perft(game, depth), expected, name)
+            self.assertEqual(game.get_hash(), position)
+
+        counts = divide(ChessVar(), 2)
+        self.assertEqual(len(counts), 20)
+        self.assertEqual(sum(counts.values()), 400)
+
+    def test_positions(self):
+        game = ChessVar()
+        self.assertEqual(game.to_position(), START_POSITION)
+        for source, destination in [('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('d8', 'd5')]:
+            game.make_move(source, destination)
+        self.assertEqual(game.to_position(), 'rnb1kbnr/ppp1pppp/8/3q4/8/8/PPPP1PPP/RNBQKBNR w -')
+
+        # Text and binary positions rebuild the same game without replaying moves
+        for position in (game.to_position(), game.to_position(binary=True)):
+            copy_game = ChessVar.from_position(position)
+            self.assertEqual(copy_game.to_position(True), game.to_position(True))
+            self.assertEqual(copy_game.get_hash(), game.get_hash())
+            self.assertEqual(copy_game.get_piece_inventory(), game.get_piece_inventory())
+            self.assertEqual(copy_game.get_player_turn(), 'WHITE')
+        self.assertEqual(len(game.to_position(binary=True)), 33)
+
+        # Only piece types on the board are in play
+        game.set_position('4k3/8/8/8/8/8/3q4/3QK3 b -')
+        self.assertEqual(game.get_piece_inventory(), {'BK': 1, 'BQ': 1, 'WK': 1, 'WQ': 1})
+        self.assertTrue(game.make_move('d2', 'e1'))
+        self.assertEqual(game.get_game_state(), 'BLACK_WON')
+        self.assertEqual(game.to_position(), '4k3/8/8/8/8/8/8/3Qq3 w B')
+        self.assertEqual(ChessVar.from_position(game.to_position(True)).get_game_state(), 'BLACK_WON')
+
+        for position in ['8/8/8/8/8/8/8 w -', '9/8/8/8/8/8/8/8 w -', '8/8/8/8/8/8/8/7x w -', START_POSITION[:-1],
+                         bytes(32)]:
+            with self.assertRaises(ValueError):
+                ChessVar.from_position(position)
+
+    def test_reset(self):
+        game = ChessVar()
+        bitboards = game.get_bitboards()
+        mailbox = game.get_mailbox()
+        game.set_position('4k3/8/8/8/8/8/3q4/3QK3 b -')
+        game.make_move('d2', 'e1')
+
+        # The game is back at the start with the same storage, so earlier references stay current
+        game.reset()
+        fresh_game = ChessVar()
+        self.assertEqual(game.to_position(True), fresh_game.to_position(True))
+        self.assertEqual(game.get_hash(), fresh_game.get_hash())
+        self.assertEqual(game.get_piece_inventory(), fresh_game.get_piece_inventory())
+        self.assertEqual(game.get_game_state(), 'UNFINISHED')
+        self.assertIs(game.get_bitboards(), bitboards)
+        self.assertIs(game.get_mailbox(), mailbox)
+        self.assertEqual(mailbox[0], 3)
+        self.assertTrue(game.make_move('e2', 'e4'))
+        game.pop()
+        with self.assertRaises(IndexError):
+            game.pop()
+
+
 if __name__ == '__main__':
     unittest.main()